@@ -0,0 +1,4 @@
+"""Throughput benchmarks for scitex-linter (not shipped with the package).
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,228 @@
+"""Deterministic synthetic SciTeX corpora for throughput benchmarks.
+
+`generate` writes a mix of file kinds under a root directory:
+
+``scripts/``
+    ``@stx.session`` scripts (mostly clean, some with missing INJECTED
+    parameters or a missing return).
+``src/<pkg>/``
+    Library modules (classes and helpers; script-only rules do not apply).
+``dense/``
+    Scripts dense with ``np.save``/``np.load``/``savefig``/``pd.read_csv``
+    and ``scipy.stats`` calls — the worst case for call rules and fixes.
+``notebooks/``
+    ``.ipynb`` files with code cells and large (base64 image) outputs.
+
+The same arguments always produce byte-identical corpora, so numbers are
+comparable across commits.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+KINDS = ("session", "library", "dense", "notebook")
+
+_STATS = ("ttest_ind", "mannwhitneyu", "pearsonr", "spearmanr", "wilcoxon")
+
+
+# =========================================================================
+# Building blocks
+# =========================================================================
+
+
+def _session_body(rng: random.Random, n_lines: int) -> list:
+    out = []
+    while len(out) < n_lines:
+        i = len(out)
+        choice = rng.random()
+        if choice < 0.3:
+            out.append(f"    x{i} = np.arange({rng.randint(1, 1000)}) * {i}")
+        elif choice < 0.5:
+            out.append(f'    logger.info(f"step {i}: {{x{max(i - 1, 0)}!r}}")')
+        elif choice < 0.65:
+            out.append(f'    data{i} = stx.io.load("./data/in_{i}.csv")')
+        elif choice < 0.8:
+            out.append(f'    stx.io.save(data{i - 1 if i else 0}, "./out/r_{i}.csv")')
+        elif choice < 0.9:
+            out.append(f"    fig, ax = plt.subplots()\n    ax.plot([{i}, {i + 1}])")
+        else:
+            out.append(f"    for k in range({i % 7 + 1}):\n        pass")
+    return out
+
+
+def session_script(rng: random.Random, n_lines: int) -> str:
+    """A ``@stx.session`` script; ~20% carry auto-fixable S004/S006 issues."""
+    broken = rng.random() < 0.2
+    params = ["CONFIG", "plt", "COLORS", "rngg", "logger"]
+    if broken:
+        params = params[: rng.randint(1, 4)]
+    head = [
+        "#!/usr/bin/env python3",
+        '"""Synthetic analysis script."""',
+        "",
+        "import numpy as np",
+        "import scitex as stx",
+        "",
+        "",
+        "@stx.session",
+        "def main(",
+        *[f"    {p}=stx.session.INJECTED," for p in params],
+        "):",
+    ]
+    body = _session_body(rng, max(n_lines - len(head) - 6, 1))
+    tail = [] if broken else ["    return 0"]
+    guard = ["", "", 'if __name__ == "__main__":', "    main()", ""]
+    return "\n".join(head + body + tail + guard)
+
+
+def library_module(rng: random.Random, n_lines: int) -> str:
+    """A library module with classes and helpers."""
+    out = ['"""Synthetic library module."""', "", "import numpy as np", ""]
+    n = 0
+    while len(out) < n_lines:
+        out += [
+            "",
+            f"class Model{n}:",
+            f'    """Model {n}."""',
+            "",
+            "    def __init__(self, size=10):",
+            "        self.size = size",
+            "        self.weights = np.zeros(size)",
+            "",
+            "    def fit(self, x, y):",
+            "        for i in range(self.size):",
+            f"            self.weights[i] = (x[i] - y[i]) * {rng.random():.3f}",
+            "        return self",
+            "",
+            "",
+            f"def helper_{n}(values):",
+            "    return [v * 2 for v in values if v]",
+        ]
+        n += 1
+    return "\n".join(out) + "\n"
+
+
+def dense_script(rng: random.Random, n_lines: int) -> str:
+    """A script dense with IO, plotting and stats calls (many issues)."""
+    out = [
+        "import matplotlib.pyplot as plt",
+        "import numpy as np",
+        "import pandas as pd",
+        "from scipy import stats",
+        "",
+        "",
+        "def main():",
+    ]
+    while len(out) < n_lines:
+        i = len(out)
+        choice = rng.randrange(6)
+        if choice == 0:
+            out.append(f'    np.save("out_{i}.npy", np.arange({i}))')
+        elif choice == 1:
+            out.append(f'    arr{i} = np.load("in_{i}.npy")')
+        elif choice == 2:
+            out.append(f'    df{i} = pd.read_csv("table_{i}.csv")')
+        elif choice == 3:
+            out.append(f"    fig{i}, ax = plt.subplots()")
+            out.append(f'    fig{i}.savefig("fig_{i}.png")')
+        elif choice == 4:
+            test = rng.choice(_STATS)
+            out.append(f"    res{i} = stats.{test}([1, 2, 3], [4, 5, {i}])")
+        else:
+            out.append(f'    print("value", {i})')
+    out += ["", "", "main()", ""]
+    return "\n".join(out)
+
+
+def notebook(rng: random.Random, n_cells: int, output_kb: int) -> str:
+    """An ``.ipynb`` document with code/markdown cells and bulky outputs."""
+    blob_len = output_kb * 1024
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    cells = []
+    for i in range(n_cells):
+        if i % 4 == 3:
+            cells.append(
+                {
+                    "cell_type": "markdown",
+                    "metadata": {},
+                    "source": [f"## Section {i}\n", "Some prose.\n"],
+                }
+            )
+            continue
+        src = dense_script(rng, 12).splitlines(keepends=True)
+        outputs = []
+        if i % 2 == 0:
+            png = "".join(rng.choice(alphabet) for _ in range(64)) * (blob_len // 64)
+            outputs.append(
+                {
+                    "data": {"image/png": png, "text/plain": ["<Figure>"]},
+                    "metadata": {},
+                    "output_type": "display_data",
+                }
+            )
+        outputs.append(
+            {"name": "stdout", "output_type": "stream", "text": [f"cell {i}\n"] * 20}
+        )
+        cells.append(
+            {
+                "cell_type": "code",
+                "execution_count": i + 1,
+                "metadata": {},
+                "outputs": outputs,
+                "source": src,
+            }
+        )
+    doc = {
+        "cells": cells,
+        "metadata": {"kernelspec": {"name": "python3", "language": "python"}},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    return json.dumps(doc, indent=1)
+
+
+# =========================================================================
+# Public API
+# =========================================================================
+
+
+def generate(
+    root,
+    n_files: int = 200,
+    lines: int = 200,
+    seed: int = 0,
+    kinds: tuple = KINDS,
+    notebook_cells: int = 20,
+    notebook_output_kb: int = 64,
+) -> dict:
+    """Write a corpus of *n_files* files under *root*.
+
+    Files are spread round-robin over *kinds*; Python files have roughly
+    *lines* lines each. Returns ``{kind: [paths]}``.
+    """
+    root = Path(root)
+    rng = random.Random(seed)
+    written: dict = {kind: [] for kind in kinds}
+    for n in range(n_files):
+        kind = kinds[n % len(kinds)]
+        if kind == "session":
+            path = root / "scripts" / f"script_{n:05d}.py"
+            text = session_script(rng, lines)
+        elif kind == "library":
+            path = root / "src" / f"pkg{n % 8}" / f"module_{n:05d}.py"
+            text = library_module(rng, lines)
+        elif kind == "dense":
+            path = root / "dense" / f"dense_{n:05d}.py"
+            text = dense_script(rng, lines)
+        elif kind == "notebook":
+            path = root / "notebooks" / f"nb_{n:05d}.ipynb"
+            text = notebook(rng, notebook_cells, notebook_output_kb)
+        else:
+            raise ValueError(f"unknown corpus kind: {kind!r}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        written[kind].append(path)
+    return written
@@ -0,0 +1,233 @@
+"""Throughput harness for checking, fixing and notebook linting.
+
+Each task runs in a fresh interpreter (so peak RSS is per task) over a
+corpus from `benchmarks.corpus`, and reports:
+
+- ``files_per_sec`` / ``lines_per_sec`` for the best of ``--repeat`` timed
+  passes (after one warm-up pass),
+- ``peak_rss_kb`` of the task process,
+- ``stages``: per-stage seconds from one extra pass under
+  `scitex_linter._profile`: the lint stages for check and ipynb; read,
+  parse, collect-edits and apply-edits for fix.
+
+Usage::
+
+    python -m benchmarks --files 400 --lines 300 --output bench.json
+    python -m benchmarks --corpus ./my-project --tasks check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TASKS = ("check", "fix", "ipynb")
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _task_files(task: str, corpus: Path) -> list:
+    suffix = ".ipynb" if task == "ipynb" else ".py"
+    return sorted(p for p in corpus.rglob(f"*{suffix}") if p.is_file())
+
+
+def _count_lines(paths: list) -> int:
+    total = 0
+    for p in paths:
+        with open(p, "rb") as f:
+            total += sum(1 for _ in f)
+    return total
+
+
+def _runner(task: str, config):
+    """Return a callable that processes one file for *task*."""
+    if task == "fix":
+        from scitex_linter import _profile
+        from scitex_linter.fixer import fix_source
+
+        def run(path):
+            prof = _profile.current
+            if prof is not None:
+                prof.lap()
+            source = path.read_text(encoding="utf-8")
+            if prof is not None:
+                prof.lap("read")
+            fix_source(source, str(path), config=config)
+
+    else:
+        from scitex_linter.checker import lint_file
+
+        def run(path):
+            lint_file(str(path), config=config)
+
+    return run
+
+
+def run_task(task: str, corpus, repeat: int = 3) -> dict:
+    """Benchmark *task* over *corpus* in the current process."""
+    from scitex_linter import _profile
+    from scitex_linter.config import load_config
+
+    corpus = Path(corpus)
+    files = _task_files(task, corpus)
+    result = {"files": len(files), "lines": _count_lines(files)}
+    if not files:
+        return result
+
+    config = load_config(str(corpus))
+    run = _runner(task, config)
+    for path in files:  # warm-up: imports, plugin loading, page cache
+        run(path)
+
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        for path in files:
+            run(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    prof = _profile.enable()
+    try:
+        for path in files:
+            run(path)
+    finally:
+        _profile.disable()
+    stages = {k: round(v, 6) for k, v in sorted(prof.stages.items())}
+
+    result.update(
+        seconds=round(best, 6),
+        files_per_sec=round(len(files) / best, 1),
+        lines_per_sec=round(result["lines"] / best, 1),
+        peak_rss_kb=_peak_rss_kb(),
+        stages=stages,
+    )
+    return result
+
+
+def _run_isolated(task: str, corpus: Path, repeat: int) -> dict:
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.harness",
+        "--task",
+        task,
+        "--corpus",
+        str(corpus),
+        "--repeat",
+        str(repeat),
+    ]
+    root = Path(__file__).resolve().parent.parent
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(root), str(root / "src"), env.get("PYTHONPATH")) if p
+    )
+    out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def _meta(args, corpus: Path) -> dict:
+    from scitex_linter import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "scitex_linter": __version__,
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": str(corpus) if args.corpus else None,
+        "files": args.files,
+        "lines": args.lines,
+        "seed": args.seed,
+        "repeat": args.repeat,
+    }
+
+
+def run_suite(args) -> dict:
+    """Generate (or reuse) a corpus and run the requested tasks."""
+    from .corpus import generate
+
+    tasks = args.tasks.split(",") if args.tasks else list(TASKS)
+    with tempfile.TemporaryDirectory(prefix="stx-bench-") as tmp:
+        corpus = Path(args.corpus) if args.corpus else Path(tmp)
+        if not args.corpus:
+            generate(
+                corpus,
+                n_files=args.files,
+                lines=args.lines,
+                seed=args.seed,
+                notebook_output_kb=args.notebook_output_kb,
+            )
+        results = {}
+        for task in tasks:
+            if args.in_process:
+                results[task] = run_task(task, corpus, repeat=args.repeat)
+            else:
+                results[task] = _run_isolated(task, corpus, args.repeat)
+        return {"meta": _meta(args, corpus), "results": results}
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure scitex-linter throughput on a synthetic corpus.",
+    )
+    parser.add_argument("--files", type=int, default=200, help="Corpus size")
+    parser.add_argument("--lines", type=int, default=200, help="Lines per file")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus RNG seed")
+    parser.add_argument(
+        "--notebook-output-kb",
+        type=int,
+        default=64,
+        help="Size of each image output in generated notebooks",
+    )
+    parser.add_argument(
+        "--corpus", help="Benchmark an existing directory instead of generating"
+    )
+    parser.add_argument("--tasks", help=f"Comma-separated subset of: {','.join(TASKS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run tasks in this process (peak RSS is then cumulative)",
+    )
+    parser.add_argument("--task", choices=TASKS, help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if args.task:  # child process of _run_isolated
+        print(json.dumps(run_task(args.task, args.corpus, repeat=args.repeat)))
+        return 0
+
+    report = json.dumps(run_suite(args), indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-try:
-    from importlib.metadata import PackageNotFoundError
-    from importlib.metadata import version as _v
 
+def _version() -> str:
     try:
-        __version__ = _v("scitex-linter")
+        from importlib.metadata import PackageNotFoundError
+        from importlib.metadata import version as _v
+    except ImportError:  # pragma: no cover — only on ancient Pythons
+        return "0.0.0+local"
+    try:
+        return _v("scitex-linter")
     except PackageNotFoundError:
-        __version__ = "0.0.0+local"
-    del _v, PackageNotFoundError
-except ImportError:  # pragma: no cover — only on ancient Pythons
-    __version__ = "0.0.0+local"
+        return "0.0.0+local"
+
+
+def __getattr__(name: str):
+    # __version__ is resolved on first use: importlib.metadata is slow to
+    # import and most CLI commands never need it
+    if name == "__version__":
+        global __version__
+        __version__ = _version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def list_rules(category: str = None) -> list:
@@ -41,4 +51,52 @@ def list_rules(category: str = None) -> list:
     return rules
 
 
-__all__ = ["__version__", "list_rules"]
+def collect_statistics(
+    path,
+    config=None,
+    jobs: int | None = 1,
+    severity: str = "info",
+    category: str | None = None,
+    use_cache: bool = True,
+):
+    """Lint every Python file under *path* and return only issue counts.
+
+    The API behind ``check --statistics``: findings are reduced to counts
+    per rule and top-level directory as each file is linted, so memory
+    does not grow with the number of issues.
+
+    Parameters
+    ----------
+    path : str or Path
+        File or directory to scan.
+    config : LinterConfig, optional
+        Defaults to the configuration found from *path*.
+    jobs : int, optional
+        Worker processes; None means one per CPU.
+    severity : str
+        Minimum severity to count.
+    category : str, optional
+        Comma-separated categories to count.
+    use_cache : bool
+        Read and write the on-disk lint result cache.
+
+    Returns
+    -------
+    Statistics
+        With ``by_rule()``, ``by_category()``, ``by_severity()``,
+        ``by_directory()``, ``rule_by_directory()``, ``to_json()`` and
+        ``format_table()``.
+    """
+    from ._statistics import collect
+
+    return collect(
+        path,
+        config=config,
+        jobs=jobs,
+        severity=severity,
+        category=category,
+        use_cache=use_cache,
+    )
+
+
+__all__ = ["__version__", "collect_statistics", "list_rules"]
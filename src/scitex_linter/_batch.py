@@ -0,0 +1,197 @@
+"""Multi-file linting for the batch MCP tools.
+
+`check_many` lints a list of files, directories and glob patterns in one
+call. Files are collected in a stable order (sorted, deduplicated) and
+paged: each call lints only the files on its page, in-process unless the
+caller asks for more *jobs* (then over the same process pool as
+``check --jobs``), and returns a stateless cursor for the next page. The cursor encodes the offset and a digest of the file
+list, so a page request against a tree that has changed since the first
+call is rejected instead of silently skipping or repeating files.
+
+With ``summary_only`` every collected file is linted and only counts are
+returned (per rule, per severity), which keeps the reply small enough to
+cover a whole repository.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+from collections import Counter
+from pathlib import Path
+
+DEFAULT_PAGE_SIZE = 100
+_SUFFIXES = (".py", ".ipynb")
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+def _glob_root(pattern: str) -> str:
+    """The directory a glob starts from: its leading non-magic components."""
+    parts = []
+    for part in Path(pattern).parts:
+        if _is_glob(part):
+            break
+        parts.append(part)
+    return os.path.join(*parts) if parts else "."
+
+
+def collect(patterns, recursive: bool = True) -> tuple:
+    """Expand *patterns* into ``(files, missing)``.
+
+    *files* is a sorted, deduplicated list of ``(path, config)`` pairs,
+    each file carrying the config of the pattern or directory it came
+    from; *missing* lists non-glob entries that do not exist.
+    """
+    from ._walk import ignore_filter, iter_files
+    from .config import load_config
+
+    found = {}
+    missing = []
+    filters = {}  # (exclude_dirs, respect_gitignore) -> ignore_filter(...)
+    for pattern in patterns:
+        expanded = os.path.expanduser(pattern)
+        is_glob = _is_glob(pattern)
+        if is_glob:
+            matches = sorted(glob.glob(expanded, recursive=True))
+        elif os.path.exists(expanded):
+            matches = [expanded]
+        else:
+            missing.append(pattern)
+            continue
+        for match in matches:
+            config = load_config(match)
+            if os.path.isdir(match):
+                for f in iter_files(Path(match), config=config, recursive=recursive):
+                    found.setdefault(str(f), config)
+            elif not is_glob:
+                found.setdefault(match, config)
+            elif match.endswith(_SUFFIXES):
+                # Globs bypass the walker, so apply its excludes and .gitignore
+                key = (tuple(config.exclude_dirs), config.respect_gitignore)
+                ignored = filters.get(key)
+                if ignored is None:
+                    ignored = filters[key] = ignore_filter(config)
+                if not ignored(match, root=_glob_root(expanded)):
+                    found.setdefault(match, config)
+    return sorted(found.items()), missing
+
+
+def _digest(files) -> str:
+    h = hashlib.blake2b(digest_size=6)
+    for path, _ in files:
+        h.update(path.encode("utf-8", "surrogateescape") + b"\0")
+    return h.hexdigest()
+
+
+def encode_cursor(offset: int, files) -> str:
+    return f"{offset}:{_digest(files)}"
+
+
+def decode_cursor(cursor, files) -> int:
+    """Return the offset of *cursor*; raise ValueError if it is stale."""
+    if not cursor:
+        return 0
+    offset, _, digest = str(cursor).partition(":")
+    if not offset.isdigit() or digest != _digest(files):
+        raise ValueError(
+            "invalid or stale cursor (the file set changed); restart without a cursor"
+        )
+    return int(offset)
+
+
+def _lint(files, jobs, cache):
+    """Lint ``(path, config)`` pairs, grouped by config, in input order."""
+    from ._cache import config_fingerprint
+    from ._parallel import lint_paths, resolve_jobs
+
+    groups = {}
+    for path, config in files:
+        key = config_fingerprint(config)
+        groups.setdefault(key, (config, []))[1].append(path)
+    results = {}
+    for config, paths in groups.values():
+        n = resolve_jobs(jobs, len(paths))
+        for path, issues in lint_paths(paths, config, jobs=n, cache=cache):
+            results[path] = issues
+    return [(path, results[path]) for path, _ in files]
+
+
+def check_many(
+    patterns,
+    severity: str = "info",
+    category: str | None = None,
+    summary_only: bool = False,
+    cursor: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    jobs: int | None = 1,
+    recursive: bool = True,
+    use_cache: bool = True,
+) -> dict:
+    """Lint files, directories and globs; return one page of results.
+
+    *jobs* defaults to 1 so a request never forks a pool unasked; None or
+    0 means one worker per CPU. Raises ValueError for a malformed or stale *cursor*.
+    """
+    from .formatter import to_json
+    from .rules import SEVERITY_ORDER
+
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    files, missing = collect(patterns, recursive=recursive)
+    if summary_only:
+        offset, page = 0, files
+    else:
+        page_size = max(1, page_size)
+        offset = decode_cursor(cursor, files)
+        page = files[offset : offset + page_size]
+
+    cache = None
+    if use_cache:
+        from ._cache import LintCache
+
+        cache = LintCache()
+    min_sev = SEVERITY_ORDER.get(severity, 0)
+    categories = set(category.split(",")) if category else None
+
+    results = []
+    n_with_issues = 0
+    rules = Counter()
+    summary = {"errors": 0, "warnings": 0, "infos": 0}
+    for path, issues in _lint(page, jobs, cache):
+        issues = [
+            i
+            for i in issues
+            if SEVERITY_ORDER[i.rule.severity] >= min_sev
+            and (categories is None or i.rule.category in categories)
+        ]
+        if not issues:
+            continue
+        n_with_issues += 1
+        report = to_json(issues, path)
+        for key, n in report["summary"].items():
+            summary[key] += n
+        rules.update(i.rule.id for i in issues)
+        if not summary_only:
+            results.append(report)
+    if cache is not None:
+        cache.prune()
+
+    out = {
+        "total_files": len(files),
+        "files_checked": len(page),
+        "files_with_issues": n_with_issues,
+        "summary": summary,
+    }
+    if missing:
+        out["missing"] = missing
+    if summary_only:
+        out["rules"] = dict(rules.most_common())
+    else:
+        end = offset + len(page)
+        out["results"] = results
+        out["next_cursor"] = encode_cursor(end, files) if end < len(files) else None
+    return out
@@ -0,0 +1,314 @@
+"""Persistent, content-addressed cache of per-file lint results.
+
+Entries live under ``$SCITEX_LINTER_CACHE_DIR`` (default
+``$XDG_CACHE_HOME/scitex-linter``), one small JSON file per linted path.
+An entry is keyed on the absolute path plus a fingerprint of everything
+that can change the result: the linter version, the built-in rule set,
+installed plugin versions, detected packages and the effective
+`LinterConfig`.
+
+Lookup order for a file:
+  1. stat fast path — (mtime_ns, size, inode) match a non-racy entry;
+  2. content hash — the file was touched but its bytes are unchanged;
+  3. miss — the caller lints and calls `LintCache.store`.
+
+Total size is capped; `prune` evicts least-recently-used entries (entry
+mtimes are bumped on every hit).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+_FORMAT = "v2"
+_DEFAULT_MAX_MB = 256
+# Entries written less than this long after the file's mtime are "racily
+# clean": the file may have changed again within the same mtime tick, so
+# the stat fast path is not trusted for them.
+_RACY_NS = 2_000_000_000
+# Written by `_packages` and `_plugin_loader` into `cache_dir()`
+_METADATA = ("packages.json", "plugins.json")
+
+
+def cache_dir() -> Path:
+    """Return the root directory of the on-disk cache."""
+    env = os.environ.get("SCITEX_LINTER_CACHE_DIR")
+    if env:
+        return Path(env).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "scitex-linter"
+
+
+def _max_bytes() -> int:
+    try:
+        mb = float(os.environ.get("SCITEX_LINTER_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+    except ValueError:
+        mb = _DEFAULT_MAX_MB
+    return int(mb * 1024 * 1024)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """`_digest` of a file's contents, read in chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def base_fingerprint() -> str:
+    """Fingerprint of the linter itself: version, rules, plugins, packages."""
+    from . import __version__
+    from ._packages import detect
+    from ._plugin_loader import plugin_versions
+    from .rules import ALL_RULES
+
+    rules_sig = sorted(
+        (r.id, r.severity, r.category, r.message, r.suggestion, r.requires)
+        for r in ALL_RULES.values()
+    )
+    payload = [__version__, rules_sig, plugin_versions(), sorted(detect().items())]
+    return _digest(json.dumps(payload).encode())
+
+
+def config_fingerprint(config) -> str:
+    """Fingerprint of an effective `LinterConfig`."""
+    from dataclasses import asdict
+
+    return _digest(json.dumps(asdict(config), sort_keys=True).encode())
+
+
+class Lookup(NamedTuple):
+    """Result of `LintCache.lookup`; pass it back to `LintCache.store`."""
+
+    issues: list | None
+    entry: Path | None
+    path: str
+    stat: os.stat_result | None
+    digest: str | None
+    data: bytes | None
+
+
+class LintCache:
+    """On-disk lint result cache with a size cap and LRU eviction.
+
+    With *memory_entries* > 0, up to that many entry records are also kept
+    in an in-process LRU in front of the disk (used by the long-running
+    ``serve`` daemon), so warm lookups cost a stat and no entry read.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+        memory_entries: int = 0,
+    ):
+        self.root = Path(root) if root is not None else cache_dir()
+        self.max_bytes = _max_bytes() if max_bytes is None else max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict = OrderedDict()  # entry path -> record
+        self._base = None
+        self._writes = 0
+
+    @property
+    def entries_dir(self) -> Path:
+        return self.root / _FORMAT
+
+    def _entry_path(self, path: str, config) -> Path:
+        if self._base is None:
+            self._base = base_fingerprint()
+        key = _digest(f"{self._base}\0{config_fingerprint(config)}\0{path}".encode())
+        return self.entries_dir / key[:2] / f"{key}.json"
+
+    def lookup(self, path: Path, config) -> Lookup:
+        """Return cached issues for *path*, or the data needed to store them."""
+        from ._issue import _unpack_issues
+
+        abspath = os.path.abspath(path)
+        try:
+            st = os.stat(abspath)
+        except OSError:
+            return Lookup(None, None, abspath, None, None, None)
+        entry = self._entry_path(abspath, config)
+        cached = self._read(entry)
+        if cached is not None and cached.get("path") == abspath:
+            if (
+                cached["mtime_ns"] == st.st_mtime_ns
+                and cached["size"] == st.st_size
+                and cached["ino"] == st.st_ino
+                and cached["written_ns"] - st.st_mtime_ns > _RACY_NS
+            ):
+                self._touch(entry)
+                return Lookup(
+                    _unpack_issues(cached["issues"]), entry, abspath, st, None, None
+                )
+        try:
+            if abspath.endswith(".ipynb"):
+                # Notebooks are re-read by the streaming reader; hash them in
+                # chunks instead of holding their outputs in memory
+                data, digest = None, _file_digest(abspath)
+            else:
+                with open(abspath, "rb") as f:
+                    data = f.read()
+                digest = _digest(data)
+        except OSError:
+            return Lookup(None, None, abspath, None, None, None)
+        if cached is not None and cached.get("digest") == digest:
+            issues = _unpack_issues(cached["issues"])
+            # Refresh the stat signature so the next run takes the fast path
+            self._write(entry, abspath, st, digest, cached["issues"])
+            return Lookup(issues, entry, abspath, st, digest, data)
+        return Lookup(None, entry, abspath, st, digest, data)
+
+    def store(self, hit: Lookup, issues: list) -> None:
+        """Record *issues* for a path that `lookup` reported as a miss."""
+        from ._issue import _pack_issues
+
+        if hit.entry is None or hit.stat is None:
+            return
+        self._write(hit.entry, hit.path, hit.stat, hit.digest, _pack_issues(issues))
+
+    def _read(self, entry: Path):
+        record = self._memory.get(entry)
+        if record is not None:
+            self._memory.move_to_end(entry)
+            return record
+        try:
+            with open(entry, encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._remember(entry, record)
+        return record
+
+    def _remember(self, entry: Path, record: dict) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[entry] = record
+        self._memory.move_to_end(entry)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write(self, entry: Path, path: str, st, digest: str, packed: list) -> None:
+        record = {
+            "path": path,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "ino": st.st_ino,
+            "digest": digest,
+            "written_ns": time.time_ns(),
+            "issues": packed,
+        }
+        self._remember(entry, record)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(record, f, separators=(",", ":"))
+            os.replace(tmp, entry)
+            self._writes += 1
+        except OSError:
+            pass
+
+    def _touch(self, entry: Path) -> None:
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+    def _iter_entries(self):
+        if not self.entries_dir.is_dir():
+            return
+        for shard in os.scandir(self.entries_dir):
+            if not shard.is_dir():
+                continue
+            for e in os.scandir(shard.path):
+                if e.is_file():
+                    yield e
+
+    def prune(self, force: bool = False) -> int:
+        """Evict least-recently-used entries until under the size cap.
+
+        Only scans the cache when this instance has written something
+        (worker processes report their writes through `add_writes`),
+        unless *force* is set. Returns the number of evicted entries.
+        """
+        if not self._writes and not force:
+            return 0
+        self._writes = 0
+        entries = []
+        total = 0
+        for e in self._iter_entries():
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, e.path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * 0.8)
+        removed = 0
+        for _, size, p in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(p)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def add_writes(self, n: int) -> None:
+        """Count *n* entries written to this cache by another process."""
+        self._writes += n
+
+    def take_writes(self) -> int:
+        """Return the number of entries written since the last call."""
+        n, self._writes = self._writes, 0
+        return n
+
+    def stats(self) -> dict:
+        """Return entry count and total size of the cache."""
+        count = 0
+        size = 0
+        for e in self._iter_entries():
+            try:
+                size += e.stat().st_size
+            except OSError:
+                continue
+            count += 1
+        return {"dir": str(self.root), "entries": count, "bytes": size}
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number of removed entries.
+
+        The package-detection and plugin-manifest caches kept next to the
+        entries are deleted too, but not counted.
+        """
+        self._memory.clear()
+        removed = 0
+        for e in list(self._iter_entries()):
+            try:
+                os.remove(e.path)
+                removed += 1
+            except OSError:
+                pass
+        for name in _METADATA:
+            try:
+                os.remove(self.root / name)
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,143 @@
+"""Merged index of call-level rules, keyed by attribute name.
+
+`SciTeXChecker._check_call` sees every ``obj.attr(...)`` call in a file,
+and almost none of them can trigger a rule. The index maps each
+attribute name that matters (call-rule functions from
+`_rule_tables.CALL_RULES` and plugin ``call_rules``, axes hints,
+``mkdir``, and the ``save``/``load`` stx.io path checks) to a `CallEntry`,
+so a call is dismissed with one dict probe on ``func.attr``.
+
+A `CallEntry` folds the six-step lookup the checker used to do per call
+(built-in then plugin table; each by the written module alias, the
+import-resolved name, then any module) into `rule_for`, and pairs each
+rule with its exemption predicate (plt.show() only on pyplot,
+to_csv/savefig not on os/sys/Path/stx, no FM rules on stx/figrecipe
+objects). The checker memoizes `rule_for` per module alias for the
+current import table.
+
+One index is built per plugin set and FM opt-in, i.e. once per run.
+"""
+
+from __future__ import annotations
+
+import ast
+
+from . import rules
+from ._rule_tables import AXES_HINTS, CALL_RULES
+
+_STX_IO_FUNCS = ("save", "load")
+_IO_EXEMPT = ("stx", "scitex", "os", "sys", "Path")
+_FIGURE_EXEMPT = ("stx", "scitex", "fr", "figrecipe")
+
+
+def _p004_exempt(mod_name, resolved, func) -> bool:
+    return mod_name not in ("plt", "pyplot") and resolved not in ("matplotlib.pyplot",)
+
+
+def _io_exempt(mod_name, resolved, func) -> bool:
+    return mod_name in _IO_EXEMPT
+
+
+def _figure_exempt(mod_name, resolved, func) -> bool:
+    if mod_name in _FIGURE_EXEMPT:
+        return True
+    # Root of a chained call: fr.fig.set_size_inches()
+    value = func.value
+    return (
+        isinstance(value, ast.Attribute)
+        and isinstance(value.value, ast.Name)
+        and value.value.id in _FIGURE_EXEMPT
+    )
+
+
+def _exemption(rule):
+    """Predicate ``(mod_name, resolved, func) -> bool`` for *rule*, or None."""
+    checks = []
+    if rule is rules.P004:
+        checks.append(_p004_exempt)
+    if rule in (rules.IO004, rules.IO007):
+        checks.append(_io_exempt)
+    if rule.category == "figure":
+        checks.append(_figure_exempt)
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda *args: any(check(*args) for check in checks)
+
+
+class CallEntry:
+    """Everything the checker needs to know about one attribute name."""
+
+    __slots__ = ("builtin", "plugin", "axes_rule", "mkdir")
+
+    def __init__(self):
+        self.builtin: dict = {}  # module alias (or None) -> (rule, exempt)
+        self.plugin: dict = {}
+        self.axes_rule = None
+        self.mkdir = False
+
+    def rule_for(self, mod_name, resolved):
+        """``(rule, exempt)`` for a call on *mod_name*, or None.
+
+        Precedence: built-in table before plugin table; within each, the
+        written alias, then the import-resolved name, then any module.
+        """
+        for table in (self.builtin, self.plugin):
+            if not table:
+                continue
+            hit = table.get(mod_name)
+            if hit is None and resolved != mod_name:
+                hit = table.get(resolved)
+            if hit is None:
+                hit = table.get(None)
+            if hit is not None:
+                return hit
+        return None
+
+
+def build(plugin_call_rules: dict) -> dict:
+    """Return ``{attr_name: CallEntry}`` for built-in plus *plugin_call_rules*."""
+    index: dict = {}
+
+    def entry(name):
+        found = index.get(name)
+        if found is None:
+            found = index[name] = CallEntry()
+        return found
+
+    for (module, func_name), rule in CALL_RULES.items():
+        entry(func_name).builtin[module] = (rule, _exemption(rule))
+    for (module, func_name), rule in plugin_call_rules.items():
+        entry(func_name).plugin[module] = (rule, _exemption(rule))
+    for func_name, rule in AXES_HINTS.items():
+        entry(func_name).axes_rule = rule
+    entry("mkdir").mkdir = True
+    for func_name in _STX_IO_FUNCS:
+        entry(func_name)
+    return index
+
+
+# (plugins dict, fm enabled) -> index; holding the dict keeps its id unique
+_memo: dict = {}
+
+
+def for_config(config) -> dict:
+    """The index for the loaded plugins, honouring FM opt-in in *config*."""
+    from ._plugin_loader import load_plugins
+
+    plugins = load_plugins()
+    fm = bool(config) and "FM" in set(config.enable)
+    key = (id(plugins), fm)
+    hit = _memo.get(key)
+    if hit is not None and hit[0] is plugins:
+        return hit[1]
+    # Category "figure" rules are opt-in through config.enable = ["FM"]
+    call_rules = {
+        k: r for k, r in plugins["call_rules"].items() if r.category != "figure" or fm
+    }
+    if len(_memo) > 8:
+        _memo.clear()
+    index = build(call_rules)
+    _memo[key] = (plugins, index)
+    return index
@@ -10,7 +10,7 @@ _PUBLIC_API = [
         "scitex_linter.checker",
         "F",
         "lint_file",
-        "(filepath, config=None) -> list[Issue]",
+        "(filepath, config=None, cache=None) -> list[Issue]",
         "Lint a Python file and return list of issues.",
     ),
     (
@@ -97,6 +97,14 @@ _PUBLIC_API = [
         "(category=None) -> list[Rule]",
         "List all rules (built-in + plugins).",
     ),
+    (
+        "scitex_linter",
+        "F",
+        "collect_statistics",
+        "(path, config=None, jobs=1, severity='info', category=None, "
+        "use_cache=True) -> Statistics",
+        "Lint a tree and return issue counts by rule, category, severity and dir.",
+    ),
 ]
 
 
@@ -0,0 +1,55 @@
+"""CLI handler for the 'cache' subcommand."""
+
+import json
+
+
+def register(subparsers) -> None:
+    p = subparsers.add_parser(
+        "cache",
+        help="Manage the on-disk lint result cache",
+        description="Inspect or clear the lint result cache used by 'check'.",
+    )
+    cache_sub = p.add_subparsers(dest="cache_command")
+
+    clear_p = cache_sub.add_parser("clear", help="Delete all cached lint results")
+    clear_p.set_defaults(func=_cmd_clear)
+
+    info_p = cache_sub.add_parser("info", help="Show cache location and size")
+    info_p.add_argument(
+        "--json", action="store_true", dest="as_json", help="Output as JSON"
+    )
+    info_p.set_defaults(func=_cmd_info)
+
+    p.set_defaults(func=lambda args: _cmd_default(p, args))
+
+
+def _cmd_default(parser, args) -> int:
+    if not hasattr(args, "cache_command") or args.cache_command is None:
+        parser.print_help()
+    return 0
+
+
+def _cmd_clear(args) -> int:
+    from ._cache import LintCache
+
+    cache = LintCache()
+    removed = cache.clear()
+    noun = "entry" if removed == 1 else "entries"
+    print(f"Removed {removed} cache {noun} from {cache.root}")
+    return 0
+
+
+def _cmd_info(args) -> int:
+    from ._cache import LintCache
+
+    cache = LintCache()
+    info = cache.stats()
+    info["max_bytes"] = cache.max_bytes
+    if args.as_json:
+        print(json.dumps(info, indent=2))
+        return 0
+    print(f"Dir:     {info['dir']}")
+    print(f"Entries: {info['entries']}")
+    print(f"Size:    {info['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"Limit:   {info['max_bytes'] / 1024 / 1024:.1f} MB")
+    return 0
@@ -0,0 +1,264 @@
+"""CLI handler for the 'check' subcommand.
+
+Files are linted as they are discovered and each one is written as soon
+as its result arrives (text, JSON or NDJSON), or folded into a
+``--statistics`` rollup. ``--daemon`` hands the run to the ``serve``
+daemon and falls back to linting here.
+"""
+
+import sys
+from pathlib import Path
+
+
+def register(subparsers) -> None:
+    from ._git import add_arguments as _add_git_arguments
+
+    p = subparsers.add_parser(
+        "check",
+        help="Check Python files for SciTeX pattern compliance",
+        description="Check Python files for SciTeX pattern compliance.",
+    )
+    p.add_argument("path", help="Python file or directory to check")
+    p.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        dest="output_format",
+        help="Output format; ndjson writes one object per file as it is linted",
+    )
+    p.add_argument(
+        "--json",
+        action="store_const",
+        const="json",
+        dest="output_format",
+        help="Output as JSON (same as --format json)",
+    )
+    p.add_argument("--no-color", action="store_true", help="Disable colored output")
+    p.add_argument(
+        "--severity",
+        choices=["error", "warning", "info"],
+        default="info",
+        help="Minimum severity to report (default: info)",
+    )
+    p.add_argument(
+        "--category",
+        help="Filter by category (comma-separated: structure,import,io,plot,stats)",
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk lint result cache",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count; 1 = in-process)",
+    )
+    p.add_argument(
+        "--statistics",
+        action="store_true",
+        help=(
+            "Print only issue counts by rule, category, severity and top-level "
+            "directory (a table, or JSON with --format json/ndjson)"
+        ),
+    )
+    p.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "Lint in the persistent 'serve' daemon, starting or restarting "
+            "it as needed (falls back to local linting if unavailable)"
+        ),
+    )
+    p.add_argument(
+        "--profile-rules",
+        nargs="?",
+        type=int,
+        const=10,
+        default=None,
+        metavar="N",
+        help=(
+            "Print per-stage, per-handler, per-node-type and per-rule timing "
+            "plus the N slowest files (default 10) to stderr; implies "
+            "--jobs 1 --no-cache"
+        ),
+    )
+    _add_git_arguments(p)
+    p.set_defaults(func=_cmd_check)
+
+
+def _cmd_check(args) -> int:
+    from ._git import GitError
+    from ._select import lint_staged, nonempty, select_files
+    from .config import load_config
+
+    target = Path(args.path)
+    if not target.exists():
+        print(f"Error: {args.path} not found", file=sys.stderr)
+        return 2
+
+    if args.daemon and args.profile_rules is None:
+        status = _check_via_daemon(args)
+        if status is not None:
+            return status
+
+    config = load_config(args.path)
+
+    # Discovery is lazy: linting starts before the walk finishes
+    try:
+        files = nonempty(select_files(args, target, config))
+    except GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if files is None:
+        print(f"No Python files found in {args.path}", file=sys.stderr)
+        return 0
+
+    if args.no_cache:
+        from . import _plugin_loader
+
+        _plugin_loader.set_disk_cache(False)
+
+    profiling = args.profile_rules is not None
+    cache = None
+    if not args.no_cache and not args.staged and not profiling:
+        from ._cache import LintCache
+
+        cache = LintCache()
+
+    from ._parallel import count_paths, lint_paths, resolve_jobs
+
+    jobs = 1 if target.is_file() or profiling else resolve_jobs(args.jobs)
+    counted = False
+    if args.staged:
+        results = lint_staged(files, config, jobs=jobs)
+    elif args.statistics and not profiling:
+        results = count_paths(files, config, jobs=jobs, cache=cache)
+        counted = True
+    else:
+        results = lint_paths(files, config, jobs=jobs, cache=cache)
+
+    if profiling:
+        from . import _profile
+
+        prof = _profile.enable()
+        try:
+            n_files, has_errors = _write_output(args, results)
+        finally:
+            _profile.disable()
+        print(prof.report(top=args.profile_rules), file=sys.stderr)
+    else:
+        n_files, has_errors = _write_output(args, results, counted=counted)
+
+    if cache is not None:
+        cache.prune()
+
+    return 2 if has_errors else (1 if n_files else 0)
+
+
+def _check_via_daemon(args):
+    """Run ``check`` through the daemon; None means fall back to local."""
+    from . import _daemon
+
+    try:
+        results = _daemon.check(args)
+    except _daemon.RemoteError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except (_daemon.DaemonError, OSError) as e:
+        print(f"Warning: {e}; linting locally", file=sys.stderr)
+        return None
+    if results is None:
+        print(f"No Python files found in {args.path}", file=sys.stderr)
+        return 0
+    try:
+        n_files, has_errors = _write_output(args, results)
+    except (_daemon.DaemonError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return 2 if has_errors else (1 if n_files else 0)
+
+
+def _write_output(args, results, counted: bool = False) -> tuple:
+    """Write *results* as issues or, with --statistics, as counts.
+
+    *counted* means *results* already yields ``(path, counts)`` pairs
+    from `_parallel.count_paths`.
+    """
+    if args.statistics:
+        return _write_statistics(args, results, counted)
+    return _write_results(args, results)
+
+
+def _write_statistics(args, results, counted: bool = False) -> tuple:
+    """Aggregate *results* and print the rollup; return (n_files, has_errors)."""
+    import json
+
+    from ._statistics import Statistics
+
+    categories = args.category.split(",") if args.category else None
+    stats = Statistics(args.path, min_severity=args.severity, categories=categories)
+    for f, found in results:
+        if counted:
+            stats.add_counts(f, found)
+        else:
+            stats.add(f, found)
+    if args.output_format == "text":
+        print(stats.format_table())
+    else:
+        print(json.dumps(stats.to_json(), indent=2))
+    has_errors = stats.by_severity().get("error", 0) > 0
+    return stats.files_with_issues, has_errors
+
+
+def _write_results(args, results) -> tuple:
+    """Stream *results* in the requested format; return (n_files, has_errors).
+
+    Each file is written as soon as it has been linted.
+    """
+    from .formatter import JSONWriter, NDJSONWriter, format_issue, format_summary
+    from .rules import SEVERITY_ORDER
+
+    use_color = not args.no_color and sys.stdout.isatty()
+    min_sev = SEVERITY_ORDER[args.severity]
+    categories = set(args.category.split(",")) if args.category else None
+    if args.output_format == "json":
+        writer = JSONWriter(sys.stdout)
+    elif args.output_format == "ndjson":
+        writer = NDJSONWriter(sys.stdout)
+    else:
+        writer = None
+
+    n_files = 0
+    has_errors = False
+    for f, issues in results:
+        issues = [
+            i
+            for i in issues
+            if SEVERITY_ORDER[i.rule.severity] >= min_sev
+            and (categories is None or i.rule.category in categories)
+        ]
+        if not issues:
+            continue
+        n_files += 1
+        has_errors = has_errors or any(i.rule.severity == "error" for i in issues)
+        if writer is not None:
+            writer.add(f, issues)
+            continue
+        for issue in issues:
+            print(format_issue(issue, f, color=use_color))
+        print(format_summary(issues, f, color=use_color))
+        print()
+        sys.stdout.flush()
+
+    if writer is not None:
+        writer.close()
+    elif not n_files:
+        msg = "All files clean"
+        if use_color:
+            print(f"\033[92m{msg}\033[0m")
+        else:
+            print(msg)
+    return n_files, has_errors
@@ -13,7 +13,7 @@ _scitex_linter_complete() {
     COMPREPLY=()
     cur="${COMP_WORDS[COMP_CWORD]}"
     prev="${COMP_WORDS[COMP_CWORD-1]}"
-    cmds="check format python rule rules list-python-apis api mcp completion"
+    cmds="check format python rule rules list-python-apis api mcp completion cache watch serve lsp"
 
     case "$prev" in
         scitex-linter)
@@ -21,11 +21,11 @@ _scitex_linter_complete() {
             return 0
             ;;
         check)
-            COMPREPLY=( $(compgen -W "--json --no-color --severity --category --help" -f -- "$cur") )
+            COMPREPLY=( $(compgen -W "--format --json --no-color --severity --category --no-cache --jobs --changed-since --staged --statistics --profile-rules --daemon --help" -f -- "$cur") )
             return 0
             ;;
         format)
-            COMPREPLY=( $(compgen -W "--check --diff --help" -f -- "$cur") )
+            COMPREPLY=( $(compgen -W "--check --diff --jobs --changed-since --staged --help" -f -- "$cur") )
             return 0
             ;;
         python)
@@ -48,10 +48,30 @@ _scitex_linter_complete() {
             COMPREPLY=( $(compgen -W "install status bash zsh --help" -- "$cur") )
             return 0
             ;;
+        cache)
+            COMPREPLY=( $(compgen -W "clear info --help" -- "$cur") )
+            return 0
+            ;;
+        watch)
+            COMPREPLY=( $(compgen -W "--no-color --severity --category --interval --debounce --poll --once --help" -f -- "$cur") )
+            return 0
+            ;;
+        serve)
+            COMPREPLY=( $(compgen -W "--socket --idle-timeout --status --stop --help" -- "$cur") )
+            return 0
+            ;;
+        lsp)
+            COMPREPLY=( $(compgen -W "--debounce --help" -- "$cur") )
+            return 0
+            ;;
         --severity)
             COMPREPLY=( $(compgen -W "error warning info" -- "$cur") )
             return 0
             ;;
+        --format)
+            COMPREPLY=( $(compgen -W "text json ndjson" -- "$cur") )
+            return 0
+            ;;
     esac
 
     COMPREPLY=( $(compgen -f -- "$cur") )
@@ -73,6 +93,10 @@ _scitex-linter() {
         'api:List public Python API'
         'mcp:MCP server commands'
         'completion:Shell tab completion'
+        'cache:Manage the on-disk lint result cache'
+        'watch:Re-lint files as they change'
+        'serve:Run the persistent lint daemon'
+        'lsp:Run a Language Server Protocol server on stdio'
     )
 
     _arguments -C \\
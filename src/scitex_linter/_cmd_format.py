@@ -4,7 +4,8 @@ import difflib
 import sys
 from pathlib import Path
 
-from .fixer import fix_source
+from ._git import add_arguments as _add_git_arguments
+from .fixer import _write_atomic, fix_source
 
 
 def register(subparsers) -> None:
@@ -20,11 +21,20 @@ def register(subparsers) -> None:
         help="Check if changes needed without writing (exit 1 if changes needed)",
     )
     p.add_argument("--diff", action="store_true", help="Show diff of changes")
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count; 1 = in-process)",
+    )
+    _add_git_arguments(p)
     p.set_defaults(func=cmd_format)
 
 
 def cmd_format(args) -> int:
-    from .cli import _collect_files
+    from ._git import GitError
+    from ._select import select_files
     from .config import load_config
 
     config = load_config(args.path)
@@ -33,30 +43,34 @@ def cmd_format(args) -> int:
         print(f"Error: {args.path} not found", file=sys.stderr)
         return 2
 
-    files = _collect_files(target, config=config)
+    try:
+        files = list(select_files(args, target, config))
+    except GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
     if not files:
         print(f"No Python files found in {args.path}", file=sys.stderr)
         return 0
 
+    from ._parallel import fix_paths, resolve_jobs
+
+    jobs = resolve_jobs(args.jobs, len(files))
+    results = fix_paths(files, config, jobs=jobs, write=not args.check, diff=args.diff)
     changed_count = 0
-    for f in files:
-        original = f.read_text(encoding="utf-8")
-        fixed = fix_source(original, filepath=str(f), config=config)
-        if fixed != original:
-            changed_count += 1
-            if args.diff:
-                diff = difflib.unified_diff(
-                    original.splitlines(keepends=True),
-                    fixed.splitlines(keepends=True),
-                    fromfile=str(f),
-                    tofile=str(f),
-                )
-                sys.stdout.writelines(diff)
-            if not args.check:
-                f.write_text(fixed, encoding="utf-8")
-                print(f"Fixed {f}")
-            else:
-                print(f"Would fix {f}")
+    for f, changed, diff in results:
+        if changed is None:
+            # e.g. staged or changed in git but deleted from the worktree
+            print(f"Skipped {f}: {diff}", file=sys.stderr)
+            continue
+        if not changed:
+            continue
+        changed_count += 1
+        if args.diff:
+            sys.stdout.write(diff)
+        if not args.check:
+            print(f"Fixed {f}")
+        else:
+            print(f"Would fix {f}")
 
     if changed_count == 0:
         print("All files clean")
@@ -68,3 +82,42 @@ def cmd_format(args) -> int:
 
     print(f"\n{changed_count} file(s) fixed")
     return 0
+
+
+def _format_one(path: str, config, write: bool = True, diff: bool = False) -> tuple:
+    """Fix one file; return ``(changed, diff_text)``.
+
+    Runs in worker processes for ``--jobs``. The file is rewritten
+    atomically, and only when its content changed. A file that cannot be
+    read or written gives ``(None, reason)``.
+    """
+    p = Path(path)
+    try:
+        original = p.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return None, _reason(e)
+    fixed = fix_source(original, filepath=path, config=config)
+    if fixed == original:
+        return False, ""
+    diff_text = ""
+    if diff:
+        diff_text = "".join(
+            difflib.unified_diff(
+                original.splitlines(keepends=True),
+                fixed.splitlines(keepends=True),
+                fromfile=path,
+                tofile=path,
+            )
+        )
+    if write:
+        try:
+            _write_atomic(p, fixed)
+        except OSError as e:
+            return None, _reason(e)
+    return True, diff_text
+
+
+def _reason(error: Exception) -> str:
+    if isinstance(error, OSError) and error.strerror:
+        return error.strerror
+    return str(error)
@@ -0,0 +1,27 @@
+"""CLI handler for the 'lsp' subcommand (Language Server over stdio)."""
+
+from __future__ import annotations
+
+
+def register(subparsers) -> None:
+    p = subparsers.add_parser(
+        "lsp",
+        help="Run a Language Server Protocol server on stdio",
+        description=(
+            "Serve diagnostics and auto-fix code actions to editors over the "
+            "Language Server Protocol (stdio)."
+        ),
+    )
+    p.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="Seconds to wait after an edit before re-linting (default: 0.3)",
+    )
+    p.set_defaults(func=_cmd_lsp)
+
+
+def _cmd_lsp(args) -> int:
+    from ._lsp import main
+
+    return main(debounce=args.debounce)
@@ -3,8 +3,6 @@
 import json
 import sys
 
-from .rules import ALL_RULES
-
 # =========================================================================
 # Subcommand: rule (built-in only, JSON-capable)
 # =========================================================================
@@ -30,22 +28,25 @@ def register_rule(subparsers) -> None:
 
 
 def _cmd_rule(args) -> int:
+    # Served from the static catalog: no rule modules are imported
+    from ._rule_catalog import FIELDS, RULES
+
     categories = set(args.category.split(",")) if args.category else None
-    rules_list = list(ALL_RULES.values())
+    rules_list = [dict(zip(FIELDS, row)) for row in RULES]
 
     if categories:
-        rules_list = [r for r in rules_list if r.category in categories]
+        rules_list = [r for r in rules_list if r["category"] in categories]
     if args.severity:
-        rules_list = [r for r in rules_list if r.severity == args.severity]
+        rules_list = [r for r in rules_list if r["severity"] == args.severity]
 
     if args.as_json:
         data = [
             {
-                "id": r.id,
-                "severity": r.severity,
-                "category": r.category,
-                "message": r.message,
-                "suggestion": r.suggestion,
+                "id": r["id"],
+                "severity": r["severity"],
+                "category": r["category"],
+                "message": r["message"],
+                "suggestion": r["suggestion"],
             }
             for r in rules_list
         ]
@@ -58,10 +59,10 @@ def _cmd_rule(args) -> int:
 
     for r in rules_list:
         if use_color:
-            c = sev_color.get(r.severity, "")
-            print(f"  {c}{r.id}{reset}  [{r.severity}]  {r.message}")
+            c = sev_color.get(r["severity"], "")
+            print(f"  {c}{r['id']}{reset}  [{r['severity']}]  {r['message']}")
         else:
-            print(f"  {r.id}  [{r.severity}]  {r.message}")
+            print(f"  {r['id']}  [{r['severity']}]  {r['message']}")
 
     print(f"\n  {len(rules_list)} rules")
     return 0
@@ -0,0 +1,75 @@
+"""CLI handler for the 'serve' subcommand (persistent lint daemon).
+
+``check --daemon`` starts the daemon on demand, so running ``serve`` by
+hand is only needed to keep it in the foreground (e.g. under a process
+supervisor) or to inspect and stop it.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+
+def register(subparsers) -> None:
+    from ._daemon import DEFAULT_IDLE_TIMEOUT
+
+    p = subparsers.add_parser(
+        "serve",
+        help="Run the persistent lint daemon used by 'check --daemon'",
+        description=(
+            "Listen on a unix socket and answer lint requests with plugins, "
+            "configs and results kept warm in memory."
+        ),
+    )
+    p.add_argument(
+        "--socket",
+        help="Socket path (default: $SCITEX_LINTER_SOCKET or a per-user temp path)",
+    )
+    p.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT:g})",
+    )
+    action = p.add_mutually_exclusive_group()
+    action.add_argument(
+        "--status", action="store_true", help="Report whether a daemon is running"
+    )
+    action.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    p.set_defaults(func=_cmd_serve)
+
+
+def _cmd_serve(args) -> int:
+    from . import _daemon
+
+    path = args.socket or _daemon.socket_path()
+    if args.status:
+        info = _daemon.ping(path)
+        if info is None:
+            print(f"No daemon listening on {path}")
+            return 1
+        print(json.dumps({"socket": str(path), **info}, indent=2))
+        return 0
+    if args.stop:
+        if _daemon.ping(path) is None:
+            print(f"No daemon listening on {path}")
+            return 0
+        if not _daemon.shutdown(path):
+            print(f"Error: daemon on {path} did not stop", file=sys.stderr)
+            return 1
+        print(f"Stopped daemon on {path}")
+        return 0
+
+    server = _daemon.Server(path, idle_timeout=args.idle_timeout)
+    try:
+        server.bind()
+    except (_daemon.DaemonError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
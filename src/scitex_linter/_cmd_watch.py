@@ -0,0 +1,314 @@
+"""CLI handler for the 'watch' subcommand.
+
+Keeps config, plugins and per-file results in memory and re-lints only
+files whose (mtime, size) changed *and* whose content digest differs.
+With the optional ``watchdog`` package installed, the watcher sleeps until
+the OS reports a change (inotify, FSEvents, ...); otherwise it wakes every
+``--interval`` seconds. Either way, a wake-up is resolved by polling
+``stat``: the tree is only re-walked when one of the directories (or
+``.gitignore`` files) seen by the last walk changed, otherwise just the
+known files are stat'ed. A burst of saves is coalesced by waiting until
+the tree has been quiet for ``--debounce`` seconds. Each cycle prints only
+diagnostics that appeared or disappeared since the previous one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .rules import SEVERITY_ORDER
+
+
+def register(subparsers) -> None:
+    p = subparsers.add_parser(
+        "watch",
+        help="Re-lint files as they change",
+        description=(
+            "Watch a file or directory and re-lint changed files, printing "
+            "only diagnostics that changed since the last cycle."
+        ),
+    )
+    p.add_argument("path", help="Python file or directory to watch")
+    p.add_argument("--no-color", action="store_true", help="Disable colored output")
+    p.add_argument(
+        "--severity",
+        choices=["error", "warning", "info"],
+        default="info",
+        help="Minimum severity to report (default: info)",
+    )
+    p.add_argument(
+        "--category",
+        help="Filter by category (comma-separated: structure,import,io,plot,stats)",
+    )
+    p.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Seconds between filesystem polls (default: 0.5)",
+    )
+    p.add_argument(
+        "--debounce",
+        type=float,
+        default=0.2,
+        help="Quiet period in seconds before re-linting (default: 0.2)",
+    )
+    p.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll even if watchdog is installed for OS change notifications",
+    )
+    p.add_argument(
+        "--once",
+        action="store_true",
+        help="Run a single lint cycle and exit",
+    )
+    p.set_defaults(func=_cmd_watch)
+
+
+def _issue_key(issue) -> tuple:
+    return (issue.rule.id, issue.cell, issue.line, issue.col)
+
+
+class Watcher:
+    """In-memory incremental linter for one file or directory tree."""
+
+    def __init__(self, path, severity: str = "info", categories=None):
+        self.path = Path(path)
+        self.min_sev = SEVERITY_ORDER[severity]
+        self.categories = categories
+        self.config = None
+        self._config_fp = None
+        # {path: (mtime_ns, size)} from the last poll
+        self.stats: dict = {}
+        # {directory or .gitignore: mtime_ns} seen by the last walk
+        self._tree: dict = {}
+        self._wake = threading.Event()
+        self._observer = None
+        # {path: (digest, issues)} for every file linted so far
+        self.results: dict = {}
+
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+
+    def _reload_config(self) -> bool:
+        """Refresh the config (memoized); True if it changed."""
+        from ._cache import config_fingerprint
+        from .config import load_config
+
+        self.config = load_config(str(self.path))
+        fp = config_fingerprint(self.config)
+        changed = fp != self._config_fp
+        self._config_fp = fp
+        return changed
+
+    def _tree_changed(self) -> bool:
+        """True unless a walk would find the same files as the last one."""
+        if not self._tree:
+            return True
+        for path, mtime in self._tree.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _snapshot(self) -> dict:
+        from ._walk import iter_files
+
+        if self._tree_changed():
+            self._tree = {}
+            files = iter_files(self.path, config=self.config, stamps=self._tree)
+        else:
+            files = list(self.stats)
+        snap = {}
+        for f in files:
+            try:
+                st = os.stat(f)
+            except OSError:
+                continue
+            snap[str(f)] = (st.st_mtime_ns, st.st_size)
+        return snap
+
+    def poll(self) -> set:
+        """Return paths added, modified or removed since the last poll."""
+        snap = self._snapshot()
+        changed = {p for p, st in snap.items() if self.stats.get(p) != st}
+        changed.update(p for p in self.stats if p not in snap)
+        self.stats = snap
+        return changed
+
+    # ------------------------------------------------------------------
+    # Linting
+    # ------------------------------------------------------------------
+
+    def _keep(self, issue) -> bool:
+        return SEVERITY_ORDER[issue.rule.severity] >= self.min_sev and (
+            self.categories is None or issue.rule.category in self.categories
+        )
+
+    def _relint(self, path: str):
+        """Lint *path* if its content changed; return (old, new) or None."""
+        from ._cache import _file_digest
+        from .checker import _lint_path
+
+        old = self.results.get(path)
+        try:
+            if path.endswith(".ipynb"):  # streamed by lint_ipynb
+                data, digest = None, _file_digest(path)
+            else:
+                data = Path(path).read_bytes()
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        except OSError:
+            self.results.pop(path, None)
+            return (old[1], []) if old else None
+        if old is not None and old[0] == digest:
+            return None
+        try:
+            issues = _lint_path(Path(path), self.config, data=data)
+        except (UnicodeDecodeError, ValueError):
+            issues = []
+        issues = [i for i in issues if self._keep(i)]
+        self.results[path] = (digest, issues)
+        return (old[1] if old else []), issues
+
+    def cycle(self, changed=None) -> dict:
+        """Re-lint *changed* paths (all known files on config change).
+
+        Returns ``{path: (added, removed, current)}`` for files whose
+        diagnostics changed.
+        """
+        if self._reload_config():
+            # Keep previous issues for the diff, but force a re-lint
+            self.results = {p: (None, r[1]) for p, r in self.results.items()}
+            self.stats = {}
+            self._tree = {}
+            changed = self.poll()
+        elif changed is None:
+            changed = self.poll()
+
+        delta = {}
+        for path in sorted(changed):
+            result = self._relint(path)
+            if result is None:
+                continue
+            old, new = result
+            old_keys = {_issue_key(i) for i in old}
+            new_keys = {_issue_key(i) for i in new}
+            added = [i for i in new if _issue_key(i) not in old_keys]
+            removed = [i for i in old if _issue_key(i) not in new_keys]
+            if added or removed:
+                delta[path] = (added, removed, new)
+        return delta
+
+    def observe(self) -> bool:
+        """Wake on OS change notifications; False if watchdog is unavailable."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+        wake = self._wake
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+
+        recursive = self.path.is_dir()
+        root = self.path if recursive else self.path.parent
+        observer = Observer()
+        try:
+            observer.schedule(_Handler(), str(root), recursive=recursive)
+            observer.daemon = True
+            observer.start()
+        except OSError:  # e.g. out of inotify watches
+            return False
+        self._observer = observer
+        return True
+
+    def close(self) -> None:
+        """Stop the change observer, if one was started."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def wait_for_changes(self, interval: float, debounce: float) -> set:
+        """Block until files change, then until they stay quiet for *debounce*."""
+        while True:
+            # Clear before polling so an event during the poll is not lost
+            self._wake.clear()
+            changed = self.poll()
+            if changed:
+                break
+            if self._observer is not None:
+                self._wake.wait()
+            else:
+                time.sleep(interval)
+        while debounce > 0:
+            time.sleep(debounce)
+            more = self.poll()
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def exit_code(self) -> int:
+        """Exit status as for ``check``: 2 on errors, 1 on other issues."""
+        issues = [i for _, found in self.results.values() for i in found]
+        if any(i.rule.severity == "error" for i in issues):
+            return 2
+        return 1 if issues else 0
+
+
+def _print_delta(delta: dict, color: bool) -> None:
+    from .formatter import format_issue, format_summary, location
+
+    stamp = time.strftime("%H:%M:%S")
+    for path, (added, removed, current) in delta.items():
+        for issue in removed:
+            label = f"{location(issue, path)}  {issue.rule.id}"
+            if color:
+                print(f"  \033[92m- fixed\033[0m {label}")
+            else:
+                print(f"  - fixed {label}")
+        for issue in added:
+            print(format_issue(issue, path, color=color))
+        print(f"[{stamp}]" + format_summary(current, path, color=color))
+    sys.stdout.flush()
+
+
+def _cmd_watch(args) -> int:
+    target = Path(args.path)
+    if not target.exists():
+        print(f"Error: {args.path} not found", file=sys.stderr)
+        return 2
+
+    categories = set(args.category.split(",")) if args.category else None
+    use_color = not args.no_color and sys.stdout.isatty()
+    watcher = Watcher(target, severity=args.severity, categories=categories)
+
+    _print_delta(watcher.cycle(), use_color)
+    if args.once:
+        return watcher.exit_code()
+
+    notified = not args.poll and watcher.observe()
+    mode = "" if notified else f", polling every {args.interval:g}s"
+    print(
+        f"Watching {len(watcher.stats)} file(s) in {args.path}{mode} (Ctrl+C to stop)"
+    )
+    sys.stdout.flush()
+    try:
+        while True:
+            changed = watcher.wait_for_changes(args.interval, args.debounce)
+            _print_delta(watcher.cycle(changed), use_color)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
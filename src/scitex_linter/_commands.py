@@ -0,0 +1,82 @@
+"""The subcommand table, and lazy registration of its parsers.
+
+Only the command being run has its module imported and its parser
+built; the others get a help-only stub so the top-level ``--help`` is
+unchanged.
+"""
+
+# name -> (module, register function, help), in --help order
+_COMMANDS = {
+    "check": (
+        "._cmd_check",
+        "register",
+        "Check Python files for SciTeX pattern compliance",
+    ),
+    "format": ("._cmd_format", "register", "Auto-fix SciTeX pattern issues"),
+    "python": (".cli", "_register_python", "Lint then execute a Python script"),
+    "rule": ("._cmd_rules", "register_rule", "List all lint rules"),
+    "rules": (
+        "._cmd_rules",
+        "register_rules",
+        "List all lint rules (built-in + plugin)",
+    ),
+    "list-python-apis": ("._cmd_api", "register", "List public Python API"),
+    "mcp": (".cli", "_register_mcp", "MCP server commands"),
+    "completion": ("._cmd_completion", "register", "Shell tab completion"),
+    "cache": ("._cmd_cache", "register", "Manage the on-disk lint result cache"),
+    "watch": ("._cmd_watch", "register", "Re-lint files as they change"),
+    "serve": (
+        "._cmd_serve",
+        "register",
+        "Run the persistent lint daemon used by 'check --daemon'",
+    ),
+    "lsp": ("._cmd_lsp", "register", "Run a Language Server Protocol server on stdio"),
+}
+_ALIASES = {"api": "list-python-apis"}
+_SKILLS_HELP = "Browse the agent skills bundled with scitex-linter"
+
+
+def requested_command(raw: list):
+    """Name of the subcommand in *raw* (aliases resolved), or None.
+
+    Top-level options take no values, so the first non-option argument
+    is the subcommand.
+    """
+    for arg in raw:
+        if not arg.startswith("-"):
+            return _ALIASES.get(arg, arg)
+    return None
+
+
+def _has_skills() -> bool:
+    """True if scitex-dev (which provides 'skills') is installed."""
+    import importlib.util
+
+    try:
+        return importlib.util.find_spec("scitex_dev") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def add_commands(subparsers, requested=None, full: bool = False) -> None:
+    """Register *requested* (or, with *full*, every command) for real."""
+    import importlib
+
+    for name, (module, func, help_text) in _COMMANDS.items():
+        if full or name == requested:
+            mod = importlib.import_module(module, __package__)
+            getattr(mod, func)(subparsers)
+        else:
+            aliases = [a for a, target in _ALIASES.items() if target == name]
+            subparsers.add_parser(name, aliases=aliases, help=help_text)
+
+    # Skills subcommand (from scitex-dev)
+    if full or requested == "skills":
+        try:
+            from scitex_dev.cli import register_skills_subcommand
+
+            register_skills_subcommand(subparsers, package="scitex-linter")
+        except ImportError:
+            pass
+    elif _has_skills():
+        subparsers.add_parser("skills", help=_SKILLS_HELP)
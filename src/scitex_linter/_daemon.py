@@ -0,0 +1,507 @@
+"""Persistent lint daemon (``scitex-linter serve``) and its thin client.
+
+The daemon listens on a unix socket and keeps warm everything a one-shot
+``check`` pays for at startup: imported rule tables, discovered plugins,
+package detection, memoized configs and an in-memory layer over the
+on-disk result cache. Requests are handled one at a time, one request per
+connection, as newline-delimited JSON:
+
+``{"op": "ping"}``
+    ``{"version": ..., "build": ..., "pid": ...}``
+``{"op": "check", "path": ..., "cwd": ..., "env": {...}, ...}``
+    ``{"ok": true}`` (or ``{"error": ...}`` / ``{"empty": true}``), then one
+    ``{"path": ..., "issues": [...]}`` line per file with issues (issues
+    packed as by `_issue._pack_issues`) and a final ``{"done": true}``.
+    Files are linted in the daemon process unless ``"jobs"`` is given,
+    which fans out over a process pool as ``check --jobs`` does.
+``{"op": "check_source", "source": ..., "filepath": ..., ...}``
+    ``{"issues": [...]}``
+``{"op": "shutdown"}``
+    ``{"ok": true}``; the daemon exits after replying.
+
+Requests carry the client's working directory and ``SCITEX_LINTER_*``
+environment, which the daemon adopts while serving them, so results match
+a local run. The daemon exits after ``idle_timeout`` seconds without a
+connection, and drops a connection that stalls for ``_CONN_TIMEOUT``
+seconds so one stuck client cannot block the others. Clients compare
+the daemon's build id (version, installed RECORD or source mtimes,
+installed plugins and detected packages) with their own and replace a
+stale daemon automatically.
+
+The socket lives in a per-user directory (under ``$XDG_RUNTIME_DIR``
+when set, else the temp dir). Both the server and the client refuse a
+directory that is a symlink, is owned by another user, or is accessible
+to group or others, and the client also refuses a socket it does not
+own, so another local user cannot stand in for the daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+_SPAWN_TIMEOUT = 10.0
+_CONN_TIMEOUT = 10.0  # drop a stalled client so it cannot block the queue
+_MEMORY_ENTRIES = 50_000
+_source = None  # memoized _source_stamp()
+
+
+class DaemonError(RuntimeError):
+    """The daemon could not be reached or spoke out of protocol."""
+
+
+class RemoteError(RuntimeError):
+    """The daemon rejected a request (e.g. a bad git ref)."""
+
+
+def socket_path() -> Path:
+    """Socket location: ``$SCITEX_LINTER_SOCKET`` or a per-user private path."""
+    env = os.environ.get("SCITEX_LINTER_SOCKET")
+    if env:
+        return Path(env).expanduser()
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "scitex-linter" / "daemon.sock"
+    if hasattr(os, "getuid"):
+        uid = os.getuid()
+    else:
+        import getpass
+
+        uid = getpass.getuser()
+    return Path(tempfile.gettempdir()) / f"scitex-linter-{uid}" / "daemon.sock"
+
+
+def _check_owned(path: Path, private: bool = False) -> None:
+    """Raise `DaemonError` unless *path* is this user's own.
+
+    *path* must not be a symlink and must be owned by the current user;
+    with *private*, it must also have no group or other permission bits.
+    """
+    if not hasattr(os, "getuid"):
+        return
+    try:
+        st = os.lstat(path)
+    except OSError as e:
+        raise DaemonError(f"cannot stat {path}: {e}") from None
+    if stat.S_ISLNK(st.st_mode):
+        raise DaemonError(f"refusing {path}: it is a symlink")
+    if st.st_uid != os.getuid():
+        raise DaemonError(f"refusing {path}: owned by another user")
+    if private and st.st_mode & 0o077:
+        mode = oct(stat.S_IMODE(st.st_mode))
+        raise DaemonError(f"refusing {path}: accessible to other users ({mode})")
+
+
+def _record_digest():
+    """Digest of the installed distribution's RECORD, if it is this code.
+
+    RECORD hashes every installed file, so it changes on any reinstall.
+    None for editable installs and source checkouts, whose files change
+    in place.
+    """
+    import hashlib
+    from importlib.metadata import PackageNotFoundError, distribution
+
+    try:
+        dist = distribution("scitex-linter")
+    except PackageNotFoundError:
+        return None
+    try:
+        direct = json.loads(dist.read_text("direct_url.json") or "{}")
+    except ValueError:
+        direct = {}
+    if direct.get("dir_info", {}).get("editable"):
+        return None
+    record = dist.read_text("RECORD")
+    installed = Path(dist.locate_file("scitex_linter/__init__.py")).resolve()
+    if not record or installed != Path(__file__).resolve().parent / "__init__.py":
+        return None  # another copy shadows the installed one
+    return hashlib.blake2b(record.encode(), digest_size=8).hexdigest()
+
+
+def _newest_mtime() -> str:
+    mtimes = [0]
+    for root, _, files in os.walk(Path(__file__).resolve().parent):
+        for name in files:
+            if name.endswith(".py"):
+                try:
+                    mtimes.append(os.stat(os.path.join(root, name)).st_mtime_ns)
+                except OSError:
+                    pass
+    return str(max(mtimes))
+
+
+def _source_stamp() -> str:
+    """Stamp of the linter's own code, computed once per process.
+
+    The installed RECORD where there is one, else the newest source mtime.
+    """
+    global _source
+    if _source is None:
+        _source = _record_digest() or _newest_mtime()
+    return _source
+
+
+def build_id() -> str:
+    """Identify this installation.
+
+    Combines the version, a stamp of the linter's sources (see
+    `_source_stamp`), the installed plugins and the package-detection
+    result, so a daemon started before a plugin or a gating package
+    (scitex, figrecipe) was installed is seen as stale. Only entry-point
+    metadata and the (disk-cached) detection are read on each call.
+    """
+    import hashlib
+
+    from . import __version__
+    from ._packages import detect
+    from ._plugin_loader import plugin_versions
+
+    env = json.dumps([plugin_versions(), sorted(detect().items())])
+    digest = hashlib.blake2b(env.encode(), digest_size=8).hexdigest()
+    return f"{__version__}+{_source_stamp()}.{digest}"
+
+
+def _client_env() -> dict:
+    return {k: v for k, v in os.environ.items() if k.startswith("SCITEX_LINTER_")}
+
+
+# =========================================================================
+# Server
+# =========================================================================
+
+
+class Server:
+    """Serve lint requests on a unix socket until idle or shut down."""
+
+    def __init__(self, path=None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        from ._cache import LintCache
+
+        self.path = Path(path) if path is not None else socket_path()
+        self.idle_timeout = idle_timeout
+        self.build = build_id()
+        self.cache = LintCache(memory_entries=_MEMORY_ENTRIES)
+        self._stop = False
+        self._sock = None
+
+    def bind(self) -> None:
+        """Create the listening socket, replacing a dead one at *path*."""
+        if not hasattr(socket, "AF_UNIX"):
+            raise DaemonError("unix sockets are not supported on this platform")
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_owned(self.path.parent, private=True)
+        if self.path.exists():
+            if _alive(self.path):
+                raise DaemonError(f"a daemon is already listening on {self.path}")
+            self.path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        sock.listen(16)
+        sock.settimeout(self.idle_timeout)
+        self._sock = sock
+
+    def serve_forever(self) -> None:
+        from ._packages import detect
+        from ._plugin_loader import load_plugins
+
+        if self._sock is None:
+            self.bind()
+        load_plugins()
+        detect()
+        try:
+            while not self._stop:
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    conn.settimeout(_CONN_TIMEOUT)
+                    self._handle(conn)
+        finally:
+            self._sock.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _handle(self, conn) -> None:
+        stream = conn.makefile("rwb")
+        try:
+            line = stream.readline()
+            if not line:
+                return
+            try:
+                req = json.loads(line)
+            except ValueError:
+                _send(stream, {"error": "malformed request"})
+                return
+            op = req.get("op")
+            handler = getattr(self, f"_op_{op}", None)
+            if handler is None:
+                _send(stream, {"error": f"unknown op: {op!r}"})
+                return
+            handler(req, stream)
+        except OSError:
+            pass  # client went away or stalled (socket.timeout) mid-request
+        finally:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    # -- Operations --
+
+    def _op_ping(self, req, stream) -> None:
+        from . import __version__
+
+        reply = {"version": __version__, "build": self.build, "pid": os.getpid()}
+        _send(stream, reply)
+
+    def _op_shutdown(self, req, stream) -> None:
+        self._stop = True
+        _send(stream, {"ok": True})
+
+    def _op_check(self, req, stream) -> None:
+        from ._git import GitError
+        from ._issue import _pack_issues
+        from ._parallel import lint_paths, resolve_jobs
+        from ._select import lint_staged, nonempty, select_files
+        from .config import load_config
+
+        with _adopt(req):
+            target = Path(req["path"])
+            if not target.exists():
+                _send(stream, {"error": f"{req['path']} not found"})
+                return
+            config = load_config(str(target))
+            staged = bool(req.get("staged"))
+            args = SimpleNamespace(
+                staged=staged, changed_since=req.get("changed_since")
+            )
+            try:
+                files = nonempty(select_files(args, target, config))
+            except GitError as e:
+                _send(stream, {"error": str(e)})
+                return
+            if files is None:
+                _send(stream, {"empty": True})
+                return
+            _send(stream, {"ok": True})
+            # In-process (using the warm memory cache) unless --jobs was given
+            jobs = req.get("jobs")
+            jobs = 1 if jobs is None or target.is_file() else resolve_jobs(jobs)
+            if staged:
+                results = lint_staged(files, config, jobs=jobs)
+            else:
+                cache = None if req.get("no_cache") else self.cache
+                results = lint_paths(files, config, jobs=jobs, cache=cache)
+            for path, issues in results:
+                if issues:
+                    _send(stream, {"path": path, "issues": _pack_issues(issues)})
+            _send(stream, {"done": True})
+        self.cache.prune()
+
+    def _op_check_source(self, req, stream) -> None:
+        from ._issue import _pack_issues
+        from .checker import lint_source
+        from .config import load_config
+
+        with _adopt(req):
+            filepath = req.get("filepath") or "<stdin>"
+            config = load_config(None if filepath == "<stdin>" else filepath)
+            issues = lint_source(req["source"], filepath=filepath, config=config)
+        _send(stream, {"issues": _pack_issues(issues)})
+
+
+@contextmanager
+def _adopt(req: dict):
+    """Run with the client's working directory and SCITEX_LINTER_* env."""
+    saved_cwd = os.getcwd()
+    saved_env = _client_env()
+    cwd = req.get("cwd")
+    env = req.get("env")
+    try:
+        if cwd:
+            os.chdir(cwd)
+        if env is not None:
+            for k in saved_env:
+                os.environ.pop(k, None)
+            os.environ.update(env)
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        if env is not None:
+            for k in _client_env():
+                os.environ.pop(k, None)
+            os.environ.update(saved_env)
+
+
+def _send(stream, obj: dict) -> None:
+    stream.write(json.dumps(obj).encode() + b"\n")
+    stream.flush()
+
+
+def _alive(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(1.0)
+            s.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+# =========================================================================
+# Client
+# =========================================================================
+
+
+def request(req: dict, path=None, timeout: float | None = None):
+    """Send *req* and yield the daemon's response objects."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("unix sockets are not supported on this platform")
+    path = Path(path) if path is not None else socket_path()
+    _check_owned(path.parent, private=True)
+    _check_owned(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError as e:
+            raise DaemonError(f"cannot connect to {path}: {e}") from None
+        stream = sock.makefile("rwb")
+        stream.write(json.dumps(req).encode() + b"\n")
+        stream.flush()
+        for line in stream:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                raise DaemonError("malformed reply from daemon") from None
+    finally:
+        sock.close()
+
+
+def ping(path=None) -> dict | None:
+    """Return the daemon's ping reply, or None if none is listening."""
+    try:
+        return next(request({"op": "ping"}, path, timeout=2.0), None)
+    except (DaemonError, OSError):
+        return None
+
+
+def shutdown(path=None, wait: float = 5.0) -> bool:
+    """Ask the daemon to exit; return True once its socket is gone."""
+    path = Path(path) if path is not None else socket_path()
+    try:
+        list(request({"op": "shutdown"}, path, timeout=2.0))
+    except (DaemonError, OSError):
+        return not path.exists()
+    deadline = time.monotonic() + wait
+    while path.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return not path.exists()
+
+
+def spawn(path=None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Start a detached daemon and wait until it answers pings."""
+    path = Path(path) if path is not None else socket_path()
+    code = (
+        "import sys; from scitex_linter.cli import main; sys.exit(main(sys.argv[1:]))"
+    )
+    cmd = [
+        sys.executable,
+        "-c",
+        code,
+        "serve",
+        "--socket",
+        str(path),
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _SPAWN_TIMEOUT
+    while time.monotonic() < deadline:
+        if ping(path) is not None:
+            return
+        time.sleep(0.05)
+    raise DaemonError(f"daemon did not start on {path}")
+
+
+def ensure(path=None) -> dict:
+    """Return a ping reply from an up-to-date daemon, (re)starting it."""
+    path = Path(path) if path is not None else socket_path()
+    if os.path.lexists(path.parent):
+        # Fail fast instead of spawning a daemon that cannot bind
+        _check_owned(path.parent, private=True)
+    info = ping(path)
+    if info is not None and info.get("build") == build_id():
+        return info
+    if info is not None:
+        shutdown(path)
+    spawn(path)
+    info = ping(path)
+    if info is None:
+        raise DaemonError("daemon exited right after starting")
+    return info
+
+
+def check(args, path=None):
+    """Run ``check`` in the daemon for parsed CLI *args*.
+
+    Returns an iterator of ``(path, issues)``, or None when no files were
+    selected. Raises `RemoteError` for request errors and `DaemonError`
+    when the daemon is unavailable.
+    """
+    from ._issue import _unpack_issues
+
+    ensure(path)
+    replies = request(
+        {
+            "op": "check",
+            "path": args.path,
+            "cwd": os.getcwd(),
+            "env": _client_env(),
+            "changed_since": getattr(args, "changed_since", None),
+            "staged": getattr(args, "staged", False),
+            "no_cache": args.no_cache,
+            "jobs": getattr(args, "jobs", None),
+        },
+        path,
+    )
+    head = next(replies, None)
+    if head is None:
+        raise DaemonError("daemon closed the connection")
+    if "error" in head:
+        raise RemoteError(head["error"])
+    if head.get("empty"):
+        return None
+
+    def results():
+        for reply in replies:
+            if reply.get("done"):
+                return
+            yield reply["path"], _unpack_issues(reply["issues"])
+        raise DaemonError("daemon closed the connection mid-reply")
+
+    return results()
+
+
+# EOF
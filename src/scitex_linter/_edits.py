@@ -0,0 +1,70 @@
+"""Source edits for the fixer: an offset table and single-pass application.
+
+`_SourceIndex` maps AST positions to string offsets of one source text, so
+each fixer can describe its change as a ``(start, end, text, kind)`` edit;
+`_apply_edits` then splices a whole batch in one linear pass.
+"""
+
+import ast
+import re
+
+_NEWLINE = re.compile(r"\r\n|\r|\n")
+
+
+class _SourceIndex:
+    """Line-start offsets of *source*, for O(1) AST position lookups.
+
+    Lines are split the way the tokenizer splits them (CRLF, CR or LF), and
+    AST column offsets (UTF-8 bytes) are converted to string offsets.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        starts = [0]
+        starts.extend(m.end() for m in _NEWLINE.finditer(source))
+        if starts[-1] != len(source):
+            starts.append(len(source))  # unterminated last line
+        self.starts = starts
+        self.lines = [source[a:b] for a, b in zip(starts, starts[1:])]
+
+    def offset(self, lineno: int, col: int) -> int:
+        start = self.starts[lineno - 1]
+        if col == 0:
+            return start
+        line = self.lines[lineno - 1]
+        if not line.isascii():
+            col = len(line.encode("utf-8")[:col].decode("utf-8", "ignore"))
+        return start + col
+
+    def span(self, node: ast.AST) -> tuple:
+        return (
+            self.offset(node.lineno, node.col_offset),
+            self.offset(node.end_lineno, node.end_col_offset),
+        )
+
+    def segment(self, node: ast.AST) -> str:
+        start, end = self.span(node)
+        return self.source[start:end]
+
+
+def _apply_edits(source: str, edits: list) -> tuple:
+    """Apply non-overlapping *edits* in one pass.
+
+    Edits are ``(start, end, text, kind)``. Where edits overlap, the one
+    starting first (the outermost, on ties) is applied and the others are
+    skipped. Returns ``(new_source, applied_kinds, n_skipped)``.
+    """
+    pieces = []
+    applied = set()
+    skipped = 0
+    pos = 0
+    for start, end, text, kind in sorted(edits, key=lambda e: (e[0], -e[1])):
+        if start < pos:
+            skipped += 1
+            continue
+        pieces.append(source[pos:start])
+        pieces.append(text)
+        applied.add(kind)
+        pos = end
+    pieces.append(source[pos:])
+    return "".join(pieces), applied, skipped
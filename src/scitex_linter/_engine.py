@@ -0,0 +1,143 @@
+"""Single-traversal rule dispatch engine.
+
+`lint_source` walks the AST exactly once. Every checker registers handlers
+for the node types it cares about, and the engine dispatches each node to
+the handlers in a per-node-type table, in the same pre-order as
+`ast.NodeVisitor`. "Leave" handlers run after a node's subtree (used for
+scope tracking such as function depth).
+
+Plugin checkers (``ast.NodeVisitor`` subclasses contributed through
+``load_plugins()["checkers"]``) join the single pass by declaring the node
+types they handle::
+
+    class MyChecker(ast.NodeVisitor):
+        category = "io"
+        node_types = ("Call", "Assign")
+
+        def visit_Call(self, node): ...
+        def visit_Assign(self, node): ...
+
+Their ``visit_<Type>`` methods are then called by the engine, which owns
+descent (``generic_visit`` becomes a no-op). Checkers without
+``node_types`` still work: they are run with their own ``visit(tree)``
+after the shared pass. A plugin that raises is disabled for the rest of
+the file and its issues are dropped.
+
+When a `_profile.Profiler` is active, `run` uses tables of instrumented
+handlers instead; otherwise no timing code is on the hot path.
+"""
+
+import ast
+
+from . import _profile
+
+
+def _no_descent(node) -> None:
+    """Replacement for ``generic_visit`` when the engine owns traversal."""
+
+
+class DispatchEngine:
+    """Walk an AST once, dispatching nodes through a per-type handler table."""
+
+    def __init__(self):
+        self._enter: dict = {}  # node class -> [handler, ...]
+        self._leave: dict = {}
+        self._legacy: list = []
+        self.failed: set = set()  # ids of plugin checkers that raised
+
+    def register(self, node_type: type, handler, leave: bool = False) -> None:
+        """Call *handler(node)* for every node of *node_type*.
+
+        With ``leave=True`` the handler runs after the node's children.
+        """
+        table = self._leave if leave else self._enter
+        table.setdefault(node_type, []).append(handler)
+
+    def add_checker(self, checker) -> None:
+        """Attach a plugin checker (see module docstring for the contract)."""
+        node_types = getattr(checker, "node_types", None)
+        if not node_types:
+            self._legacy.append(checker)
+            return
+        checker.generic_visit = _no_descent
+        for name in node_types:
+            cls = getattr(ast, name, None) if isinstance(name, str) else name
+            if cls is None:
+                continue
+            method = getattr(checker, f"visit_{cls.__name__}", None)
+            if method is not None:
+                self.register(cls, self._guard(checker, method))
+
+    def _guard(self, checker, method):
+        failed = self.failed
+        key = id(checker)
+
+        def handler(node):
+            if key in failed:
+                return
+            try:
+                method(node)
+            except Exception:
+                failed.add(key)
+
+        handler.__wrapped__ = method
+        return handler
+
+    def ok(self, checker) -> bool:
+        """Whether *checker* completed without raising."""
+        return id(checker) not in self.failed
+
+    def run(self, tree: ast.AST) -> None:
+        """Traverse *tree* once, then run any legacy (self-walking) checkers."""
+        prof = _profile.current
+        if prof is None:
+            self._walk(tree, self._enter, self._leave)
+            for checker in self._legacy:
+                try:
+                    checker.visit(tree)
+                except Exception:
+                    self.failed.add(id(checker))
+            return
+
+        enter = {
+            cls: [prof.wrap(h, cls.__name__) for h in handlers]
+            for cls, handlers in self._enter.items()
+        }
+        leave = {
+            cls: [prof.wrap(h, cls.__name__) for h in handlers]
+            for cls, handlers in self._leave.items()
+        }
+        prof.lap()
+        self._walk(tree, enter, leave)
+        prof.lap("dispatch")
+        for checker in self._legacy:
+            visit = prof.wrap(checker.visit, type(tree).__name__)
+            try:
+                visit(tree)
+            except Exception:
+                self.failed.add(id(checker))
+            prof.lap(f"legacy {type(checker).__name__}")
+
+    @staticmethod
+    def _walk(tree: ast.AST, enter: dict, leave: dict) -> None:
+        iter_children = ast.iter_child_nodes
+        stack = [tree]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if type(node) is tuple:
+                # Leave marker pushed below the node's children
+                for handler in leave[type(node[0])]:
+                    handler(node[0])
+                continue
+            cls = type(node)
+            handlers = enter.get(cls)
+            if handlers is not None:
+                for handler in handlers:
+                    handler(node)
+            if cls in leave:
+                push((node,))
+            children = list(iter_children(node))
+            children.reverse()
+            stack.extend(children)
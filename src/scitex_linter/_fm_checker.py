@@ -1,14 +1,14 @@
 """FM (Figure/Millimeter) rule detection — opt-in category.
 
 Detects inch-based matplotlib patterns and suggests mm-based alternatives.
-Used as a second-pass AST visitor from lint_source when "FM" is enabled.
+Registered with lint_source's single-pass engine when "FM" is enabled.
 """
 
 import ast
 
 from . import rules
+from ._issue import Issue
 from ._packages import detect as _detect_pkgs
-from .checker import Issue
 
 
 def _is_exempt_call(node):
@@ -136,7 +136,7 @@ class FMChecker(ast.NodeVisitor):
 
         if rule.id in self.config.disable:
             return
-        from .checker import _is_allowed_by_comment
+        from ._issue import _is_allowed_by_comment
 
         if _is_allowed_by_comment(source_line, rule.id):
             return
@@ -149,9 +149,18 @@ class FMChecker(ast.NodeVisitor):
         sev = self.config.per_rule_severity.get(rule.id)
         if sev:
             rule = _replace(rule, severity=sev)
-        self.issues.append(
-            Issue(rule=rule, line=line, col=col, source_line=source_line)
-        )
+        if source_line:
+            # Every caller passes _get_source(line): refer to the line table
+            issue = Issue(rule, line, col, lines=self.source_lines)
+        else:
+            issue = Issue(rule, line, col)
+        self.issues.append(issue)
+
+    def register(self, engine):
+        """Register node handlers with a `DispatchEngine`."""
+        if self._active:
+            engine.register(ast.Call, self._check_call)
+            engine.register(ast.Assign, self._check_assign)
 
     def visit_Call(self, node):
         if self._active:
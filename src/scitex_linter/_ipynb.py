@@ -4,43 +4,141 @@ Scholar-linter Phase 1 for issue #7. Phase 2 (notebook-specific rules
 like `NB001`: raw-matplotlib in code cell) to follow in a dedicated
 checker class.
 
-Uses stdlib `json` — no nbformat dependency. Each code cell is linted
-independently by reusing `lint_source`; the reported filepath is
-suffixed `::cell-N` so downstream tooling can parse cell locations
-back.
+No nbformat dependency: `_nbstream` streams the JSON and decodes only
+cell types and sources, so large outputs are never loaded. By default
+the code cells are concatenated into one virtual module that is parsed
+and visited once (so module-level checks such as S002 see the whole
+notebook); each issue is then mapped back to its cell through a
+line-offset table and carries ``Issue.cell`` plus a cell-relative line.
+Cells that do not parse on their own (IPython magics, shell escapes,
+half-written code) are left out of the module, as they were skipped
+before.
+
+``notebook-per-cell = true`` restores the previous mode: every cell is
+linted independently with `lint_source`.
 """
 
 from __future__ import annotations
 
-import json
+import ast
+from bisect import bisect_right
 from pathlib import Path
 
 
-def lint_ipynb(path: Path, config=None) -> list:
-    """Lint a Jupyter notebook by extracting code cells and running
-    `lint_source` on each. Returns a flat list of Issue objects.
+def lint_ipynb(path: Path, config=None, per_cell: bool | None = None) -> list:
+    """Lint a Jupyter notebook's code cells. Returns a flat list of Issues.
+
+    Every issue has ``cell`` set to the index of its cell in the notebook
+    and ``line`` relative to that cell; formatters render the location as
+    ``"/path/to/notebook.ipynb::cell-N:LINE:COL"``.
 
-    Issue filepaths are of the form ``"/path/to/notebook.ipynb::cell-N"``.
+    *per_cell* defaults to ``config.notebook_per_cell``.
     """
-    from .checker import lint_source
+    from ._nbstream import iter_cells
 
     try:
-        nb = json.loads(path.read_text(encoding="utf-8"))
+        with open(path, "rb") as fp:
+            cells = _code_cells(iter_cells(fp))
     except (OSError, ValueError):
         return []
 
-    issues: list = []
-    cells = nb.get("cells", []) or []
-    for i, cell in enumerate(cells):
-        if cell.get("cell_type") != "code":
-            continue
-        src_val = cell.get("source", "")
-        source = "".join(src_val) if isinstance(src_val, list) else src_val
-        if not source.strip():
+    if per_cell is None:
+        per_cell = bool(config and config.notebook_per_cell)
+    if per_cell:
+        return _lint_per_cell(path, cells, config)
+    return _lint_as_module(path, cells, config)
+
+
+def _code_cells(cells) -> list:
+    """Return ``[(index, source)]`` for the non-empty code cells.
+
+    *cells* yields ``(index, cell_type, source)`` as `_nbstream.iter_cells`.
+    """
+    out = []
+    for i, cell_type, src_val in cells:
+        if cell_type != "code":
             continue
+        if isinstance(src_val, list):
+            src_val = "".join(s for s in src_val if isinstance(s, str))
+        if isinstance(src_val, str) and src_val.strip():
+            out.append((i, src_val))
+    return out
+
+
+def _lint_per_cell(path: Path, cells: list, config) -> list:
+    from .checker import lint_source
+
+    issues: list = []
+    for i, source in cells:
         fake_path = f"{path}::cell-{i}"
-        issues.extend(lint_source(source, filepath=fake_path, config=config))
+        found = lint_source(source, filepath=fake_path, config=config)
+        issues.extend(issue._replace(cell=i) for issue in found)
     return issues
 
 
+def _lint_as_module(path: Path, cells: list, config) -> list:
+    from . import _profile
+    from .checker import _lint_tree
+
+    if not cells:
+        return []
+    prof = _profile.current
+    if prof is not None:
+        prof.lap()
+    source, starts, owners = _join_cells(cells)
+    try:
+        tree = ast.parse(source, filename=str(path))
+    except SyntaxError:
+        # Drop the cells that are not valid Python by themselves; fall back
+        # to per-cell linting if the remainder still does not parse
+        # together (e.g. a cell ending in a line continuation).
+        cells = [(i, src) for i, src in cells if _parses(src)]
+        if not cells:
+            return []
+        source, starts, owners = _join_cells(cells)
+        try:
+            tree = ast.parse(source, filename=str(path))
+        except SyntaxError:
+            return _lint_per_cell(path, cells, config)
+    if prof is not None:
+        prof.lap("parse")
+
+    issues = _lint_tree(tree, source, str(path), config)
+    mapped = []
+    for issue in issues:
+        k = max(bisect_right(starts, issue.line) - 1, 0)
+        line = issue.line - starts[k] + 1
+        mapped.append(issue._replace(line=line, cell=owners[k]))
+    return mapped
+
+
+def _join_cells(cells: list) -> tuple:
+    """Concatenate cell sources; return ``(source, starts, owners)``.
+
+    ``starts[k]`` is the 1-based module line on which ``owners[k]`` (a
+    notebook cell index) begins.
+    """
+    parts = []
+    starts = []
+    owners = []
+    line = 1
+    for i, src in cells:
+        src = src.replace("\r\n", "\n").replace("\r", "\n")
+        if not src.endswith("\n"):
+            src += "\n"
+        parts.append(src)
+        starts.append(line)
+        owners.append(i)
+        line += src.count("\n")
+    return "".join(parts), starts, owners
+
+
+def _parses(source: str) -> bool:
+    try:
+        ast.parse(source)
+    except SyntaxError:
+        return False
+    return True
+
+
 # EOF
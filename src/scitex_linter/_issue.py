@@ -0,0 +1,198 @@
+"""Lint issues: the `Issue` record, its compact wire form and suppression.
+
+`_pack_issues`/`_unpack_issues` encode issues for the on-disk cache, the
+worker pool and the daemon; `_is_allowed_by_comment` implements
+``# stx-allow`` suppression.
+"""
+
+import re
+from dataclasses import asdict
+from typing import Optional
+
+from . import rules
+from .rules import Rule
+
+
+class Issue:
+    """One rule violation.
+
+    Built like the dataclass it replaces, ``Issue(rule, line, col,
+    source_line="", cell=None)``, with the same attributes, equality and
+    repr, but kept small for scans that report hundreds of thousands of
+    issues: ``__slots__`` instead of a ``__dict__``, and built-in rules
+    held by the ID string of the rule table entry (other rules, e.g. a
+    per-rule severity override or a plugin rule, are kept as objects).
+    While a file is being linted, ``source_line`` is read from the
+    checker's line table (passed as *lines*); issues are detached from the
+    table before they are returned, keeping only their own line.
+
+    ``Issue`` is not a dataclass: use ``_fields``, ``_asdict()`` and
+    ``_replace(**changes)`` in place of ``dataclasses.fields``, ``asdict``
+    and ``replace``.
+
+    ``cell`` is the notebook cell index; ``line`` is then cell-relative.
+    """
+
+    _fields = ("rule", "line", "col", "source_line", "cell")
+
+    # _source is the source line, or the line table to read row `line` from
+    __slots__ = ("_rule", "line", "col", "_source", "cell")
+
+    def __init__(
+        self,
+        rule: Rule,
+        line: int,
+        col: int,
+        source_line: str = "",
+        cell: Optional[int] = None,
+        *,
+        lines: Optional[list] = None,
+    ):
+        self.rule = rule
+        self.line = line
+        self.col = col
+        self.cell = cell
+        self._source = source_line if lines is None else lines
+
+    @property
+    def rule(self) -> Rule:
+        rule = self._rule
+        if rule.__class__ is not str:
+            return rule
+        return rules.ALL_RULES.get(rule) or _known_rule(rule)
+
+    @rule.setter
+    def rule(self, rule: Rule) -> None:
+        # Only the built-in table is consulted here: plugin rules stay
+        # objects, so building an issue never triggers plugin discovery
+        known = rules.ALL_RULES.get(rule.id)
+        self._rule = rule.id if known is rule or known == rule else rule
+
+    @property
+    def source_line(self) -> str:
+        source = self._source
+        if source.__class__ is str:
+            return source
+        row = self.line
+        return source[row - 1].rstrip() if 1 <= row <= len(source) else ""
+
+    @source_line.setter
+    def source_line(self, value: str) -> None:
+        self._source = value
+
+    def _astuple(self) -> tuple:
+        return (self.rule, self.line, self.col, self.source_line, self.cell)
+
+    def _asdict(self) -> dict:
+        """Field values by name, with the rule as a dict (like `asdict`)."""
+        values = dict(zip(self._fields, self._astuple()))
+        values["rule"] = asdict(values["rule"])
+        return values
+
+    def _replace(self, **changes) -> "Issue":
+        """Return a copy with *changes* applied (like `dataclasses.replace`)."""
+        new = Issue.__new__(Issue)
+        for name in Issue.__slots__:
+            setattr(new, name, getattr(self, name))
+        if "line" in changes and "source_line" not in changes:
+            new.source_line = self.source_line  # detach from the line table
+        for name, value in changes.items():
+            setattr(new, name, value)
+        return new
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None  # mutable, like the dataclass
+
+    def __repr__(self) -> str:
+        return (
+            f"Issue(rule={self.rule!r}, line={self.line!r}, col={self.col!r}, "
+            f"source_line={self.source_line!r}, cell={self.cell!r})"
+        )
+
+    def __reduce__(self):
+        # Pickle the resolved line, not the whole line table
+        return (Issue, self._astuple())
+
+
+def _detach(issues: list) -> list:
+    """Point *issues* at their own source line instead of the line table."""
+    for issue in issues:
+        if issue._source.__class__ is not str:
+            # rstrip() returns the line object itself unless it has
+            # trailing whitespace, so this rarely allocates
+            issue._source = issue.source_line
+    return issues
+
+
+def _known_rule(rule_id: str):
+    """Return the canonical (built-in or plugin) Rule for *rule_id*, if any."""
+    rule = rules.ALL_RULES.get(rule_id)
+    if rule is None:
+        from ._plugin_loader import load_plugins
+
+        rule = load_plugins()["rules"].get(rule_id)
+    return rule
+
+
+def _pack_issues(issues: list) -> list:
+    """Encode issues as compact, JSON/pickle-friendly tuples.
+
+    Each tuple is ``(rule_id, line, col, source_line, rule_fields, cell)``
+    where *rule_fields* is ``None`` when the issue carries the canonical rule
+    and the full field list otherwise (per-rule severity, dynamic S006
+    message, swapped FM suggestion), and *cell* is the notebook cell index.
+    """
+    packed = []
+    for i in issues:
+        r = i.rule
+        fields = None
+        if _known_rule(r.id) != r:
+            fields = [
+                r.id,
+                r.severity,
+                r.category,
+                r.message,
+                r.suggestion,
+                r.requires,
+            ]
+        packed.append((r.id, i.line, i.col, i.source_line, fields, i.cell))
+    return packed
+
+
+def _unpack_issues(packed) -> list:
+    """Inverse of `_pack_issues`."""
+    issues = []
+    for rule_id, line, col, source_line, fields, cell in packed:
+        rule = Rule(*fields) if fields else _known_rule(rule_id)
+        if rule is None:
+            continue
+        issues.append(Issue(rule, line, col, source_line, cell))
+    return issues
+
+
+_STX_ALLOW_RE = re.compile(r"#\s*stx-allow\b(?::?\s*(.+))?")
+
+
+def _is_allowed_by_comment(source_line: str, rule_id: str) -> bool:
+    """Check if a source line has a ``# stx-allow`` comment suppressing *rule_id*.
+
+    Supported forms::
+
+        x = 1  # stx-allow                     → suppresses ALL rules on this line
+        x = 1  # stx-allow: STX-S003           → suppresses STX-S003
+        x = 1  # stx-allow: STX-S003, STX-I001 → suppresses both
+    """
+    if not source_line:
+        return False
+    m = _STX_ALLOW_RE.search(source_line)
+    if m is None:
+        return False
+    ids_str = m.group(1)
+    if not ids_str:
+        return True  # bare ``# stx-allow`` suppresses everything
+    allowed = {s.strip() for s in ids_str.split(",")}
+    return rule_id in allowed
@@ -0,0 +1,451 @@
+"""Language Server Protocol front end (``scitex-linter lsp``).
+
+A dependency-free LSP server over stdio, built on `lint_source` and
+`fixer.fix_source`:
+
+- documents are synced incrementally (``TextDocumentSyncKind.Incremental``);
+  positions are UTF-16 code units as the protocol requires, and line
+  breaks are ``\\n``, ``\\r\\n`` or ``\\r`` as for the Python tokenizer;
+- edits are debounced: each change pushes the document's lint deadline
+  back, so a burst of keystrokes is linted once, at its latest version;
+- superseded lints are cancelled: messages that arrive while a document
+  is being linted are handled before its diagnostics are published, and
+  a result whose document version moved on is dropped;
+- results are cached per (path, content digest, config), so reopening,
+  saving or undoing back to already-linted text never re-lints;
+- ``textDocument/codeAction`` offers a whole-document edit produced by
+  `fix_source` (as ``quickfix`` and ``source.fixAll.scitex``).
+
+`LanguageServer.handle` processes one decoded message and `run_due`
+lints whatever is due, so the server can be driven without stdio (and
+with ``debounce=0``) in tests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import queue
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import unquote, urlparse
+
+_BREAK = re.compile(r"\r\n|\r|\n")
+_SEVERITY = {"error": 1, "warning": 2, "info": 3}
+_SOURCE = "scitex-linter"
+_FIX_ALL = "source.fixAll.scitex"
+_CACHE_SIZE = 256
+
+# JSON-RPC error codes
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INTERNAL_ERROR = -32603
+
+
+# =========================================================================
+# Framing
+# =========================================================================
+
+
+def read_message(stream):
+    """Read one Content-Length framed JSON-RPC message; None at EOF."""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii", "replace").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    if length is None:
+        raise ValueError("LSP message without Content-Length header")
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body)
+
+
+def write_message(stream, message: dict) -> None:
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+# =========================================================================
+# Documents and positions
+# =========================================================================
+
+
+def _utf16_len(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _char_index(line: str, character: int) -> int:
+    """Index into *line* of UTF-16 offset *character* (clamped)."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for i, ch in enumerate(line):
+        if units >= character:
+            return i
+        units += 2 if ord(ch) > 0xFFFF else 1
+    return len(line)
+
+
+class Document:
+    """An open text document and its line table."""
+
+    def __init__(self, uri: str, text: str, version: int = 0):
+        self.uri = uri
+        self.version = version
+        self.text = text
+        self._starts = None
+
+    @property
+    def starts(self) -> list:
+        """Offsets at which each line begins."""
+        if self._starts is None:
+            self._starts = [0] + [m.end() for m in _BREAK.finditer(self.text)]
+        return self._starts
+
+    def line(self, index: int) -> str:
+        """Text of line *index* without its line break ("" if out of range)."""
+        starts = self.starts
+        if not 0 <= index < len(starts):
+            return ""
+        end = starts[index + 1] if index + 1 < len(starts) else len(self.text)
+        return self.text[starts[index] : end].rstrip("\r\n")
+
+    def offset(self, position: dict) -> int:
+        starts = self.starts
+        index = position["line"]
+        if index >= len(starts):
+            return len(self.text)
+        return starts[index] + _char_index(self.line(index), position["character"])
+
+    def end_position(self) -> dict:
+        last = len(self.starts) - 1
+        return {"line": last, "character": _utf16_len(self.line(last))}
+
+    def apply(self, change: dict) -> None:
+        """Apply one ``TextDocumentContentChangeEvent``."""
+        rng = change.get("range")
+        if rng is None:
+            self.text = change["text"]
+        else:
+            start = self.offset(rng["start"])
+            end = max(self.offset(rng["end"]), start)
+            self.text = self.text[:start] + change["text"] + self.text[end:]
+        self._starts = None
+
+
+def uri_to_path(uri: str) -> str | None:
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    path = unquote(parsed.path)
+    if re.match(r"^/[A-Za-z]:", path):  # file:///C:/... on Windows
+        path = path[1:]
+    return path
+
+
+# =========================================================================
+# Server
+# =========================================================================
+
+
+class LanguageServer:
+    """Stateful LSP server writing responses and notifications to *out*."""
+
+    def __init__(self, out, debounce: float = 0.3):
+        self.out = out
+        self.debounce = debounce
+        self.documents: dict = {}  # uri -> Document
+        self.lints = 0  # number of actual lint_source runs
+        self._due: dict = {}  # uri -> monotonic deadline
+        self._published: dict = {}  # uri -> version last published
+        self._results: OrderedDict = OrderedDict()  # (kind, path, digest, cfg)
+        self._queue = None
+        self._shutdown = False
+        self.exit_code = None
+
+    # -- Main loop --
+
+    def serve(self, inp) -> int:
+        """Serve until ``exit`` (or EOF); return the process exit code."""
+        self._queue = queue.Queue()
+        reader = threading.Thread(target=self._read_loop, args=(inp,), daemon=True)
+        reader.start()
+        while self.exit_code is None:
+            timeout = None
+            if self._due:
+                timeout = max(0.0, min(self._due.values()) - time.monotonic())
+            try:
+                message = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if message is None:
+                    break
+                self.handle(message)
+                if not self._drain():
+                    break
+            self.run_due()
+        return self.exit_code if self.exit_code is not None else 1
+
+    def _read_loop(self, inp) -> None:
+        try:
+            while True:
+                message = read_message(inp)
+                self._queue.put(message)
+                if message is None:
+                    return
+        except (OSError, ValueError):
+            self._queue.put(None)
+
+    def _drain(self) -> bool:
+        """Handle every queued message; False once input has ended."""
+        if self._queue is None:
+            return True
+        while self.exit_code is None:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                return True
+            if message is None:
+                return False
+            self.handle(message)
+        return True
+
+    # -- Dispatch --
+
+    def handle(self, message: dict) -> None:
+        method = message.get("method")
+        msg_id = message.get("id")
+        is_request = "id" in message
+        if method is None:
+            return  # a response to something we never send
+        handler = getattr(self, "_on_" + re.sub(r"\W", "_", method), None)
+        if is_request and self._shutdown and method != "exit":
+            self._error(msg_id, _INVALID_REQUEST, "server is shutting down")
+            return
+        if handler is None:
+            if is_request:
+                self._error(msg_id, _METHOD_NOT_FOUND, f"unknown method {method}")
+            return
+        try:
+            result = handler(message.get("params") or {})
+        except Exception as e:  # never let one bad message kill the server
+            if is_request:
+                self._error(msg_id, _INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            else:
+                self._log(f"{method} failed: {type(e).__name__}: {e}")
+            return
+        if is_request:
+            write_message(self.out, {"jsonrpc": "2.0", "id": msg_id, "result": result})
+
+    def _error(self, msg_id, code: int, text: str) -> None:
+        error = {"code": code, "message": text}
+        write_message(self.out, {"jsonrpc": "2.0", "id": msg_id, "error": error})
+
+    def _notify(self, method: str, params: dict) -> None:
+        write_message(self.out, {"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _log(self, text: str) -> None:
+        self._notify("window/logMessage", {"type": 1, "message": text})
+
+    # -- Lifecycle --
+
+    def _on_initialize(self, params) -> dict:
+        from . import __version__
+
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 2},
+                "codeActionProvider": {"codeActionKinds": ["quickfix", _FIX_ALL]},
+            },
+            "serverInfo": {"name": _SOURCE, "version": __version__},
+        }
+
+    def _on_initialized(self, params) -> None:
+        return None
+
+    def _on_shutdown(self, params) -> None:
+        self._shutdown = True
+        return None
+
+    def _on_exit(self, params) -> None:
+        self.exit_code = 0 if self._shutdown else 1
+
+    def _on___cancelRequest(self, params) -> None:
+        return None  # requests are answered synchronously; nothing to cancel
+
+    # -- Document sync --
+
+    def _on_textDocument_didOpen(self, params) -> None:
+        item = params["textDocument"]
+        uri = item["uri"]
+        self.documents[uri] = Document(uri, item["text"], item.get("version", 0))
+        self._due[uri] = time.monotonic()  # lint a freshly opened file at once
+
+    def _on_textDocument_didChange(self, params) -> None:
+        ident = params["textDocument"]
+        doc = self.documents.get(ident["uri"])
+        if doc is None:
+            return
+        for change in params.get("contentChanges", []):
+            doc.apply(change)
+        doc.version = ident.get("version", doc.version + 1)
+        self._due[doc.uri] = time.monotonic() + self.debounce
+
+    def _on_textDocument_didSave(self, params) -> None:
+        return None
+
+    def _on_textDocument_didClose(self, params) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._due.pop(uri, None)
+        self._published.pop(uri, None)
+        self._notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    # -- Linting --
+
+    def run_due(self, now: float | None = None) -> None:
+        """Lint and publish every document whose debounce deadline passed."""
+        now = time.monotonic() if now is None else now
+        for uri in [u for u, t in self._due.items() if t <= now]:
+            doc = self.documents.get(uri)
+            if doc is None or self._due.get(uri, now + 1) > now:
+                continue  # closed or re-debounced while draining
+            del self._due[uri]
+            if self._published.get(uri) == doc.version:
+                continue
+            version = doc.version
+            issues = self._lint(doc)
+            self._drain()  # let newer edits supersede this result
+            if self.documents.get(uri) is not doc or doc.version != version:
+                continue
+            self._published[uri] = version
+            diagnostics = [_diagnostic(i, doc) for i in issues]
+            self._notify(
+                "textDocument/publishDiagnostics",
+                {"uri": uri, "version": version, "diagnostics": diagnostics},
+            )
+
+    def _cached(self, kind: str, doc: Document, compute):
+        from ._cache import config_fingerprint
+        from .config import load_config
+
+        path = uri_to_path(doc.uri)
+        config = load_config(path)
+        digest = hashlib.blake2b(doc.text.encode("utf-8"), digest_size=16).digest()
+        key = (kind, path or doc.uri, digest, config_fingerprint(config))
+        hit = self._results.get(key)
+        if hit is not None:
+            self._results.move_to_end(key)
+            return hit
+        value = compute(doc.text, path or doc.uri, config)
+        self._results[key] = value
+        while len(self._results) > _CACHE_SIZE:
+            self._results.popitem(last=False)
+        return value
+
+    def _lint(self, doc: Document) -> list:
+        from .checker import lint_source
+
+        def compute(text, path, config):
+            self.lints += 1
+            return lint_source(text, filepath=path, config=config)
+
+        return self._cached("lint", doc, compute)
+
+    # -- Code actions --
+
+    def _on_textDocument_codeAction(self, params) -> list:
+        from .fixer import fix_source
+
+        uri = params["textDocument"]["uri"]
+        doc = self.documents.get(uri)
+        if doc is None:
+            return []
+        fixed = self._cached(
+            "fix", doc, lambda text, path, config: fix_source(text, path, config)
+        )
+        if fixed == doc.text:
+            return []
+        edit = {
+            "changes": {
+                uri: [
+                    {
+                        "range": {
+                            "start": {"line": 0, "character": 0},
+                            "end": doc.end_position(),
+                        },
+                        "newText": fixed,
+                    }
+                ]
+            }
+        }
+        context = params.get("context") or {}
+        only = context.get("only")
+        ours = [d for d in context.get("diagnostics", []) if d.get("source") == _SOURCE]
+        actions = []
+        if _wanted("quickfix", only) and (ours or only):
+            actions.append(
+                {
+                    "title": "Apply SciTeX auto-fixes",
+                    "kind": "quickfix",
+                    "diagnostics": ours,
+                    "edit": edit,
+                }
+            )
+        if _wanted(_FIX_ALL, only):
+            actions.append(
+                {"title": "Fix all SciTeX issues", "kind": _FIX_ALL, "edit": edit}
+            )
+        return actions
+
+
+def _wanted(kind: str, only) -> bool:
+    """Whether *kind* matches the client's ``context.only`` filter."""
+    if not only:
+        return True
+    return any(kind == k or kind.startswith(k + ".") for k in only)
+
+
+def _diagnostic(issue, doc: Document) -> dict:
+    """Convert an `Issue` into an LSP Diagnostic spanning the rest of its line."""
+    line_no = max(issue.line - 1, 0)
+    text = doc.line(line_no)
+    # Issue.col is an AST col_offset: UTF-8 bytes into the line
+    prefix = text.encode("utf-8")[: issue.col].decode("utf-8", "ignore")
+    start = _utf16_len(prefix)
+    end = max(_utf16_len(text), start)
+    rule = issue.rule
+    return {
+        "range": {
+            "start": {"line": line_no, "character": start},
+            "end": {"line": line_no, "character": end},
+        },
+        "severity": _SEVERITY.get(rule.severity, 3),
+        "code": rule.id,
+        "source": _SOURCE,
+        "message": f"{rule.message}\n{rule.suggestion}",
+    }
+
+
+def main(debounce: float = 0.3) -> int:
+    """Run the server on this process's stdin/stdout."""
+    server = LanguageServer(sys.stdout.buffer, debounce=debounce)
+    return server.serve(sys.stdin.buffer)
+
+
+# EOF
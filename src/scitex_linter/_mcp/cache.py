@@ -0,0 +1,129 @@
+"""In-process result cache for the MCP lint tools.
+
+The MCP server is long-lived, and agents tend to re-lint the same
+snippet or an unchanged file many times in one session. Results are kept
+in two bounded LRUs:
+
+- sources, keyed by (source digest, filepath role, config fingerprint).
+  The only thing a snippet's label contributes to the built-in rules is
+  whether it is linted as a script or a library module, so snippets
+  labelled differently but in the same role share an entry;
+- files, keyed by (absolute path, mtime_ns, size, config fingerprint).
+  Files modified within the last couple of seconds are not cached, since
+  a further edit in the same mtime tick would go unnoticed (see
+  `_cache._RACY_NS`).
+
+Entries hold unfiltered issue lists; callers apply severity/category
+filters per call. Hit and miss counters are reported by `stats`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+SOURCE_ENTRIES = 1024
+FILE_ENTRIES = 4096
+
+
+class ResultCache:
+    """Thread-safe LRU mapping keys to issue lists, with hit/miss counters."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            issues = self._entries.get(key)
+            if issues is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return issues
+
+    def put(self, key, issues: list) -> None:
+        with self._lock:
+            self._entries[key] = issues
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+sources = ResultCache(SOURCE_ENTRIES)
+files = ResultCache(FILE_ENTRIES)
+
+
+def lint_source(source: str, filepath: str = "<stdin>") -> list:
+    """`checker.lint_source` with the config for *filepath*, memoized."""
+    from .._cache import config_fingerprint
+    from ..checker import is_script
+    from ..checker import lint_source as _lint_source
+    from ..config import load_config
+
+    config = load_config(filepath)
+    role = "script" if is_script(filepath, config) else "library"
+    digest = hashlib.blake2b(
+        source.encode("utf-8", "surrogatepass"), digest_size=16
+    ).hexdigest()
+    key = (digest, role, config_fingerprint(config))
+    issues = sources.get(key)
+    if issues is None:
+        issues = _lint_source(source, filepath=filepath, config=config)
+        sources.put(key, issues)
+    return issues
+
+
+def lint_file(path: str) -> list:
+    """`checker.lint_file` with the config for *path*, memoized on stat."""
+    from .._cache import _RACY_NS, config_fingerprint
+    from ..checker import lint_file as _lint_file
+    from ..config import load_config
+
+    config = load_config(path)
+    abspath = os.path.abspath(path)
+    try:
+        st = os.stat(abspath)
+    except OSError:
+        return _lint_file(path, config=config)
+    key = (abspath, st.st_mtime_ns, st.st_size, config_fingerprint(config))
+    issues = files.get(key)
+    if issues is None:
+        issues = _lint_file(path, config=config)
+        if time.time_ns() - st.st_mtime_ns >= _RACY_NS:
+            files.put(key, issues)
+    return issues
+
+
+def stats() -> dict:
+    """Hit/miss counters and sizes of both caches."""
+    return {"sources": sources.stats(), "files": files.stats()}
+
+
+def clear() -> None:
+    """Drop all cached results and reset the counters."""
+    sources.clear()
+    files.clear()
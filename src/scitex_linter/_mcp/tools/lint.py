@@ -1,6 +1,6 @@
 """Lint MCP tools for scitex-linter."""
 
-from typing import Optional
+from typing import List, Optional
 
 
 def register_lint_tools(mcp) -> None:
@@ -11,13 +11,11 @@ def register_lint_tools(mcp) -> None:
         path: str, severity: str = "info", category: Optional[str] = None
     ) -> dict:
         """Lint a Python file against 47+ SciTeX reproducible-research rules — raw `pd.read_csv` / `np.load` / `pickle` instead of `stx.io` (STX-IO), hardcoded `/home/...` paths (STX-P), `plt.show()` in scripts, missing axis labels (STX-PA), p-values without effect sizes (STX-S), missing `@stx.session` entrypoints (STX-ST), etc. Drop-in complement to `flake8` / `ruff` / `pylint` — not a replacement for general style but specifically covers scientific-reproducibility anti-patterns. Use whenever the user asks to "lint this file", "check scitex conventions", "find stx.io violations", "lint my script for reproducibility rules", or before committing scientific Python. Filter by `severity` (error / warning / info) or comma-separated `category`."""
-        from ...checker import lint_file
-        from ...config import load_config
         from ...formatter import to_json
         from ...rules import SEVERITY_ORDER
+        from ..cache import lint_file
 
-        config = load_config(path)
-        issues = lint_file(path, config=config)
+        issues = lint_file(path)
         min_sev = SEVERITY_ORDER.get(severity, 0)
         categories = set(category.split(",")) if category else None
 
@@ -62,10 +60,72 @@ def register_lint_tools(mcp) -> None:
     @mcp.tool()
     def linter_check_source(source: str, filepath: str = "<stdin>") -> dict:
         """Lint an in-memory Python source string (no file on disk) against the full SciTeX rule set — useful for LLM-generated code, notebook cells, REPL snippets, and CI hooks checking patches before write. Use whenever the user asks to "lint this code I just wrote", "check this snippet against scitex rules", "validate this function without saving it", "pre-commit lint this patch", or passes a string rather than a path. Optional `filepath=` labels the source in error messages."""
-        from ...checker import lint_source
-        from ...config import load_config
         from ...formatter import to_json
+        from ..cache import lint_source
 
-        config = load_config(filepath)
-        issues = lint_source(source, filepath=filepath, config=config)
+        issues = lint_source(source, filepath=filepath)
         return to_json(issues, filepath)
+
+    @mcp.tool()
+    def linter_cache_stats(clear: bool = False) -> dict:
+        """Diagnostics for the server-side result cache behind `linter_check` and `linter_check_source`: entry counts, hit/miss counters and hit rate for snippet and file results. Use when the user asks "is the linter cache working?", "why is linting slow?", or wants to debug stale results; `clear=true` drops every cached result and resets the counters."""
+        from .. import cache
+
+        stats = cache.stats()
+        if clear:
+            cache.clear()
+        return stats
+
+    @mcp.tool()
+    def linter_check_many(
+        paths: List[str],
+        severity: str = "info",
+        category: Optional[str] = None,
+        summary_only: bool = False,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+        jobs: Optional[int] = 1,
+    ) -> dict:
+        """Lint many files in one call — a list of file paths, directories and glob patterns (`src/**/*.py`, `scripts/*.py`). Use instead of calling `linter_check` file by file whenever the user asks to "lint these files", "check all scripts", "lint the changed files", or hands over a list of paths. Results are paged by file: pass the returned `next_cursor` back as `cursor` to get the next `page_size` files (`next_cursor` is null on the last page). With `summary_only=true` every file is linted and only per-rule and per-severity counts are returned — the cheapest way to survey a large tree. Filter by `severity` (error / warning / info) or comma-separated `category`. Files are linted in-process; pass `jobs` > 1 (0 = one per CPU) to fan out over a worker pool."""
+        from ..._batch import check_many
+
+        try:
+            return check_many(
+                paths,
+                severity=severity,
+                category=category,
+                summary_only=summary_only,
+                cursor=cursor,
+                page_size=page_size,
+                jobs=jobs,
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+    @mcp.tool()
+    def linter_check_dir(
+        path: str = ".",
+        severity: str = "info",
+        category: Optional[str] = None,
+        summary_only: bool = False,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+        recursive: bool = True,
+        jobs: Optional[int] = 1,
+    ) -> dict:
+        """Lint every Python file under a directory (a whole project or package) in one call, honouring the configured excludes and `.gitignore`. Use whenever the user asks to "lint the repo", "check the whole project for scitex violations", "how many STX-IO issues are there?", or "lint src/". Results are paged by file: pass the returned `next_cursor` back as `cursor` for the next `page_size` files. Use `summary_only=true` first for per-rule counts across the tree, then page through the details. `recursive=false` limits the walk to the top level. Pass `jobs` > 1 (0 = one per CPU) to fan out over a worker pool."""
+        from ..._batch import check_many
+
+        try:
+            return check_many(
+                [path],
+                severity=severity,
+                category=category,
+                summary_only=summary_only,
+                cursor=cursor,
+                page_size=page_size,
+                jobs=jobs,
+                recursive=recursive,
+            )
+        except ValueError as e:
+            return {"error": str(e)}
@@ -0,0 +1,245 @@
+"""Incremental reader for the code-cell sources of an ``.ipynb`` file.
+
+`iter_cells` scans the notebook's JSON bytes in fixed-size chunks and
+decodes only ``cells[*].cell_type`` and ``cells[*].source``. Every other
+value, in particular ``outputs`` and ``attachments`` (base64 images, HTML
+reprs), is skipped by scanning for its closing quote or bracket; the
+bytes are dropped as soon as a chunk has been scanned. Peak memory is
+therefore one chunk plus the largest cell source, whatever the size of
+the outputs.
+
+Only the decoded values and the document structure are validated.
+Skipped values are checked for balanced brackets and well-formed
+scalars, not fully parsed the way ``json.loads`` would.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+_WS = b" \t\r\n"
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_CLOSE = {ord("{"): ord("}"), ord("["): ord("]")}
+_QUOTE = ord('"')
+
+
+def iter_cells(fp, chunk_size: int = CHUNK_SIZE):
+    """Yield ``(index, cell_type, source)`` for every cell of notebook *fp*.
+
+    *fp* is a binary file object. *source* is the raw JSON value (a string
+    or a list of strings). Raises ValueError on malformed input.
+    """
+    return _Scanner(fp, chunk_size).notebook()
+
+
+def _backslashes(buf: bytes, lo: int, hi: int, carry: int) -> int:
+    """Length of the backslash run ending at ``buf[hi - 1]``.
+
+    A run reaching *lo* continues with *carry* backslashes from before it.
+    """
+    i = hi
+    while i > lo and buf[i - 1] == 0x5C:
+        i -= 1
+    return hi - i + carry if i == lo else hi - i
+
+
+class _Scanner:
+    def __init__(self, fp, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.captured = None  # list of byte slices while reading a value
+        self.mark = 0
+
+    # ------------------------------------------------------------------
+    # Buffer
+    # ------------------------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Read the next chunk, discarding the scanned part of the buffer."""
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            return False
+        if self.captured is not None:
+            self.captured.append(self.buf[self.mark : self.pos])
+            self.mark = 0
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> int:
+        """Skip whitespace and return the next byte without consuming it."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("unexpected end of notebook JSON")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != ord(char):
+            raise ValueError(f"expected {char!r} at notebook byte {self.pos}")
+        self.pos += 1
+
+    def _at_end(self) -> bool:
+        try:
+            self._peek()
+        except ValueError:
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def _skip_string(self) -> None:
+        # A quote ends the string unless an odd run of backslashes precedes
+        # it. bytes.find is memchr-fast, so long base64 and escape-heavy
+        # HTML payloads cost one search per quote, not per byte or escape.
+        self.pos += 1  # opening quote
+        start, carry = self.pos, 0
+        while True:
+            buf = self.buf
+            quote = buf.find(b'"', self.pos)
+            if quote < 0:
+                # Carry the parity of a trailing backslash run into the
+                # next chunk
+                carry = _backslashes(buf, start, len(buf), carry) % 2
+                self.pos = len(buf)
+                if not self._fill():
+                    raise ValueError("unterminated string in notebook JSON")
+                start = 0
+                continue
+            self.pos = quote + 1
+            if _backslashes(buf, start, quote, carry) % 2 == 0:
+                return
+
+    def _skip_container(self) -> None:
+        stack = [_CLOSE[self.buf[self.pos]]]
+        self.pos += 1
+        while stack:
+            m = _STRUCTURE.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("unterminated container in notebook JSON")
+                continue
+            i = m.start()
+            char = self.buf[i]
+            if char == _QUOTE:
+                self.pos = i
+                self._skip_string()
+            elif char in _CLOSE:
+                stack.append(_CLOSE[char])
+                self.pos = i + 1
+            elif char == stack.pop():
+                self.pos = i + 1
+            else:
+                raise ValueError(f"mismatched bracket at notebook byte {i}")
+
+    def _skip_scalar(self) -> None:
+        if self.captured is None:
+            self._read_value()  # decoding validates the literal
+            return
+        while True:
+            m = _SCALAR_END.search(self.buf, self.pos)
+            if m is not None:
+                self.pos = m.start()
+                return
+            self.pos = len(self.buf)
+            if not self._fill():
+                return
+
+    def _skip_value(self) -> None:
+        char = self._peek()
+        if char == _QUOTE:
+            self._skip_string()
+        elif char in _CLOSE:
+            self._skip_container()
+        else:
+            self._skip_scalar()
+
+    def _read_value(self):
+        """Decode the next value (used only for small values)."""
+        self._peek()
+        self.captured, self.mark = [], self.pos
+        try:
+            self._skip_value()
+            self.captured.append(self.buf[self.mark : self.pos])
+            raw = b"".join(self.captured)
+        finally:
+            self.captured = None
+        return json.loads(raw)
+
+    def _members(self):
+        """Yield each key of an object whose ``{`` was consumed.
+
+        The caller must consume the member's value before resuming.
+        """
+        if self._peek() == ord("}"):
+            self.pos += 1
+            return
+        while True:
+            if self._peek() != _QUOTE:
+                raise ValueError(f"expected a key at notebook byte {self.pos}")
+            key = self._read_value()
+            self._expect(":")
+            yield key
+            if self._peek() == ord(","):
+                self.pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def _items(self):
+        """Yield once per element of an array whose ``[`` was consumed."""
+        if self._peek() == ord("]"):
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self._peek() == ord(","):
+                self.pos += 1
+                continue
+            self._expect("]")
+            return
+
+    # ------------------------------------------------------------------
+    # Notebook structure
+    # ------------------------------------------------------------------
+
+    def notebook(self):
+        self._expect("{")
+        for key in self._members():
+            if key == "cells" and self._peek() == ord("["):
+                self.pos += 1
+                yield from self._cells()
+            else:
+                self._skip_value()
+        if not self._at_end():
+            raise ValueError("trailing data after notebook JSON")
+
+    def _cells(self):
+        for index, _ in enumerate(self._items()):
+            if self._peek() != ord("{"):
+                self._skip_value()
+                continue
+            self.pos += 1
+            fields = {}
+            for key in self._members():
+                if key in ("cell_type", "source"):
+                    fields[key] = self._read_value()
+                else:
+                    self._skip_value()
+            yield index, fields.get("cell_type"), fields.get("source", "")
+
+
+# EOF
@@ -1,17 +1,97 @@
-"""Detect available packages for conditional rule gating."""
+"""Detect available packages for conditional rule gating.
+
+Availability is decided from import-system metadata (module specs found
+through ``sys.meta_path``), so the packages themselves — and their heavy
+dependencies such as matplotlib or scipy — are never executed. The result
+is cached in-process and on disk, keyed on the interpreter and the state
+(entries and mtimes) of ``sys.path``, which changes whenever packages are
+installed or removed.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
 
 _cache = None
 
 
+def _spec_of(name):
+    """Find the module spec for *name* without importing it or its parents."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return getattr(module, "__spec__", None) or True
+    parent, _, _ = name.rpartition(".")
+    if not parent:
+        return importlib.util.find_spec(name)
+    parent_spec = _spec_of(parent)
+    if parent_spec is True:
+        search = getattr(sys.modules[parent], "__path__", None)
+    else:
+        search = getattr(parent_spec, "submodule_search_locations", None)
+    if search is None:
+        return None
+    for finder in sys.meta_path:
+        find_spec = getattr(finder, "find_spec", None)
+        if find_spec is None:
+            continue
+        spec = find_spec(name, list(search))
+        if spec is not None:
+            return spec
+    return None
+
+
 def _can_import(name):
-    """Check if a package is importable."""
+    """Check if a package is importable (without importing it)."""
     try:
-        __import__(name)
-        return True
-    except ImportError:
+        return _spec_of(name) is not None
+    except (ImportError, ValueError, AttributeError):
         return False
 
 
+def _env_key():
+    """Fingerprint of the interpreter and its import path state."""
+    stamps = []
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        stamps.append((entry, mtime))
+    payload = json.dumps([sys.executable, sys.version, stamps])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _cache_file():
+    from ._cache import cache_dir
+
+    return cache_dir() / "packages.json"
+
+
+def _read_disk(key):
+    try:
+        with open(_cache_file(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return data.get("result")
+
+
+def _write_disk(key, result):
+    path = _cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "result": result}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def detect():
     """Detect available packages. Cached after first call.
 
@@ -21,10 +101,15 @@ def detect():
     global _cache
     if _cache is not None:
         return _cache
-    _cache = {
-        "scitex": _can_import("scitex"),
-        "figrecipe": _can_import("figrecipe") or _can_import("scitex.plt"),
-    }
+    key = _env_key()
+    result = _read_disk(key)
+    if result is None:
+        result = {
+            "scitex": _can_import("scitex"),
+            "figrecipe": _can_import("figrecipe") or _can_import("scitex.plt"),
+        }
+        _write_disk(key, result)
+    _cache = result
     return _cache
 
 
@@ -0,0 +1,237 @@
+"""Process-pool execution for multi-file commands.
+
+Workers are initialised once with the resolved config (plugins and
+package detection are warmed up in the initializer) and receive only file
+paths. Lint workers send back compact issue tuples (see
+`_issue._pack_issues`), count workers per-rule counts (see
+`_statistics.count_issues`), both with the number of cache entries they
+wrote so the parent only prunes after a run that wrote something; fix
+workers write their file and send back a changed flag and diff text. Results are yielded in input order, so output
+is identical to the sequential path.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-worker state, set by the initializer
+_config = None
+_cache = None
+
+
+def default_jobs() -> int:
+    """Default worker count: the number of CPUs."""
+    return os.cpu_count() or 1
+
+
+def resolve_jobs(jobs: int | None, n_items: int | None = None) -> int:
+    """Clamp a requested worker count to [1, n_items]; None/<=0 means all CPUs."""
+    if jobs is None or jobs <= 0:
+        jobs = default_jobs()
+    if n_items is not None:
+        jobs = min(jobs, n_items)
+    return max(1, jobs)
+
+
+def imap(fn, items, jobs: int, initializer=None, initargs=()):
+    """Map *fn* over *items* in a process pool, yielding results in order.
+
+    *items* may be a lazy iterable; work is submitted as it is produced.
+    """
+    if hasattr(items, "__len__"):
+        chunksize = max(1, min(64, len(items) // (jobs * 4)))
+    else:
+        chunksize = 8
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as pool:
+        yield from pool.map(fn, items, chunksize=chunksize)
+
+
+def _init_lint_worker(config, cache_root, plugin_cache: bool = True) -> None:
+    global _config, _cache
+    from ._packages import detect
+    from ._plugin_loader import load_plugins, set_disk_cache
+
+    _config = config
+    if cache_root is not None:
+        from ._cache import LintCache
+
+        _cache = LintCache(cache_root)
+    set_disk_cache(plugin_cache)
+    load_plugins()
+    detect()
+
+
+def _plan(paths, jobs: int) -> tuple:
+    """``(paths as str, jobs)`` with *jobs* clamped to the number of paths.
+
+    Sized *paths* are counted directly. A lazy iterable is read ahead by
+    at most ``jobs + 1`` items: if it ends there, it is returned as a
+    list with *jobs* clamped (so one or two files never start a pool and
+    one file is linted in-process); otherwise the rest stays lazy.
+    """
+    if jobs <= 1:
+        return (str(p) for p in paths), 1
+    if not hasattr(paths, "__len__"):
+        rest = iter(paths)
+        head = [str(p) for p in itertools.islice(rest, jobs + 1)]
+        if len(head) > jobs:
+            return itertools.chain(head, (str(p) for p in rest)), jobs
+        paths = head
+    paths = [str(p) for p in paths]
+    return paths, resolve_jobs(jobs, len(paths))
+
+
+def _writes() -> int:
+    """Cache entries this worker wrote since it last reported."""
+    return _cache.take_writes() if _cache is not None else 0
+
+
+def _lint_worker(path: str) -> tuple:
+    from ._issue import _pack_issues
+    from .checker import lint_file
+
+    packed = _pack_issues(lint_file(path, config=_config, cache=_cache))
+    return path, packed, _writes()
+
+
+def lint_paths(paths, config, jobs: int = 1, cache=None):
+    """Lint *paths*, yielding ``(path, issues)`` pairs in input order.
+
+    *paths* may be a lazy iterable (e.g. from `_walk.iter_files`).
+    ``jobs == 1`` lints in-process; larger values fan out over a process
+    pool whose workers share the on-disk *cache* directory.
+    """
+    from ._issue import _unpack_issues
+    from .checker import lint_file
+
+    paths, jobs = _plan(paths, jobs)
+    if jobs <= 1:
+        for p in paths:
+            yield p, lint_file(p, config=config, cache=cache)
+        return
+
+    from . import _plugin_loader
+
+    cache_root = cache.root if cache is not None else None
+    results = imap(
+        _lint_worker,
+        paths,
+        jobs,
+        initializer=_init_lint_worker,
+        initargs=(config, cache_root, _plugin_loader._use_disk),
+    )
+    for p, packed, wrote in results:
+        if wrote:
+            cache.add_writes(wrote)
+        yield p, _unpack_issues(packed)
+
+
+def _source_worker(item: tuple) -> tuple:
+    from ._issue import _pack_issues
+    from .checker import lint_source
+
+    path, source = item
+    return path, _pack_issues(lint_source(source, filepath=path, config=_config))
+
+
+def lint_sources(items, config, jobs: int = 1):
+    """Lint ``(path, source)`` pairs, yielding ``(path, issues)`` in order.
+
+    For content that is not on disk (e.g. staged blobs), so nothing is
+    cached. ``jobs == 1`` lints in-process.
+    """
+    from . import _plugin_loader
+    from ._issue import _unpack_issues
+    from .checker import lint_source
+
+    if jobs <= 1:
+        for path, source in items:
+            yield path, lint_source(source, filepath=path, config=config)
+        return
+    results = imap(
+        _source_worker,
+        items,
+        jobs,
+        initializer=_init_lint_worker,
+        initargs=(config, None, _plugin_loader._use_disk),
+    )
+    for path, packed in results:
+        yield path, _unpack_issues(packed)
+
+
+def _count_worker(path: str) -> tuple:
+    from ._statistics import count_issues
+    from .checker import lint_file
+
+    counts = count_issues(lint_file(path, config=_config, cache=_cache))
+    return path, counts, _writes()
+
+
+def count_paths(paths, config, jobs: int = 1, cache=None):
+    """Like `lint_paths`, but yield ``(path, _statistics.count_issues(...))``.
+
+    Issues are reduced to per-rule counts where they are produced, so
+    workers send back a few tuples per file instead of every issue.
+    """
+    from ._statistics import count_issues
+    from .checker import lint_file
+
+    paths, jobs = _plan(paths, jobs)
+    if jobs <= 1:
+        for p in paths:
+            yield p, count_issues(lint_file(p, config=config, cache=cache))
+        return
+
+    from . import _plugin_loader
+
+    cache_root = cache.root if cache is not None else None
+    results = imap(
+        _count_worker,
+        paths,
+        jobs,
+        initializer=_init_lint_worker,
+        initargs=(config, cache_root, _plugin_loader._use_disk),
+    )
+    for p, counts, wrote in results:
+        if wrote:
+            cache.add_writes(wrote)
+        yield p, counts
+
+
+def _init_fix_worker(config) -> None:
+    global _config
+    _config = config
+
+
+def _fix_worker(task: tuple) -> tuple:
+    from ._cmd_format import _format_one
+
+    path, write, diff = task
+    return (path, *_format_one(path, _config, write=write, diff=diff))
+
+
+def fix_paths(paths, config, jobs: int = 1, write: bool = True, diff: bool = False):
+    """Fix *paths*, yielding ``(path, changed, diff_text)`` in input order.
+
+    With *write*, changed files are replaced atomically by the worker that
+    fixed them; unchanged files are never rewritten. A file that could not
+    be read or written has *changed* None and the reason as *diff_text*.
+    """
+    if jobs <= 1:
+        from ._cmd_format import _format_one
+
+        for p in paths:
+            yield (str(p), *_format_one(str(p), config, write=write, diff=diff))
+        return
+    tasks = [(str(p), write, diff) for p in paths]
+    yield from imap(
+        _fix_worker,
+        tasks,
+        jobs,
+        initializer=_init_fix_worker,
+        initargs=(config,),
+    )
@@ -1,10 +1,38 @@
-"""Discover and load linter rule plugins via entry points."""
+"""Discover and load linter rule plugins via entry points.
 
+Importing a plugin module can be expensive (it may pull in its own
+dependencies), so what `load_plugins` needs from each plugin — its rules,
+call-rule keys, axes hints and the ``category``/``node_types`` of its
+checkers — is recorded in a manifest that is cached in-process and on
+disk, keyed on the installed distributions' metadata (entry-point name
+and target, distribution name and version, the ``RECORD`` and
+``direct_url.json`` files, which change on every reinstall). Editable and
+unrecorded installs are also keyed on the mtime of the entry-point
+module and of every directory in the plugin's top-level package, which
+catches edits to the entry point and submodules saved by replacing the
+file (as most editors do) without stat-ing every file on each load.
+``check --no-cache`` bypasses the disk copy (`set_disk_cache`), and
+``cache clear`` deletes it.
+
+On a cache hit no plugin module is imported: rules are rebuilt from
+their fields, and each checker class is represented by a `LazyChecker`
+that imports its plugin the first time a file actually runs it. Figure
+checkers gated off by FM opt-in are therefore never imported.
+"""
+
+import dataclasses
+import hashlib
+import json
 import logging
+import os
 import sys
 
 _logger = logging.getLogger(__name__)
 _cache = None
+_loaded: dict = {}  # (entry-point name, value) -> plugin dict, or None
+_use_disk = True
+_FORMAT = 2
+_GROUP = "scitex_linter.plugins"
 
 
 def _iter_entry_points(group):
@@ -20,41 +48,311 @@ def _iter_entry_points(group):
         return eps.get(group, [])
 
 
-def load_plugins():
-    """Load all registered linter plugins. Cached after first call.
+# -- Importing plugins --
+
 
-    Returns dict with keys: rules, call_rules, axes_hints, checkers
+def _import_plugin(ep):
+    """Run *ep*'s ``get_plugin()``; None (logged) if it fails. Memoized."""
+    key = (ep.name, ep.value)
+    if key in _loaded:
+        return _loaded[key]
+    try:
+        plugin = ep.load()()
+    except Exception:
+        _logger.debug("Failed to load linter plugin %s", ep.name, exc_info=True)
+        plugin = None
+    _loaded[key] = plugin
+    return plugin
+
+
+class LazyChecker:
+    """Stand-in for a plugin checker class, imported on first instantiation.
+
+    Carries the class's ``category`` and ``node_types`` so gating can be
+    decided without importing the plugin. Calling it returns an instance
+    of the real class.
     """
-    global _cache
-    if _cache is not None:
-        return _cache
 
+    def __init__(self, ep_name, ep_value, index, name, category, node_types):
+        self._ep = (ep_name, ep_value)
+        self._index = index
+        self.__name__ = name
+        self.category = category
+        self.node_types = tuple(node_types) if node_types else None
+
+    def load(self):
+        """Import the plugin and return the real checker class."""
+        key = self._ep
+        plugin = _loaded.get(key)
+        if key not in _loaded:
+            for ep in _iter_entry_points(_GROUP):
+                if (ep.name, ep.value) == key:
+                    plugin = _import_plugin(ep)
+                    break
+        if plugin is None:
+            raise ImportError(f"linter plugin {key[0]!r} could not be loaded")
+        return plugin.get("checkers", [])[self._index]
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyChecker {self._ep[0]}:{self.__name__}>"
+
+
+# -- Manifests --
+
+
+def _rule_fields(rule) -> list:
+    return [getattr(rule, f.name) for f in dataclasses.fields(rule)]
+
+
+def _rule(fields):
+    """Rebuild a Rule, reusing the built-in object when it is the same rule."""
+    from .rules import ALL_RULES, Rule
+
+    rule = Rule(*fields)
+    builtin = ALL_RULES.get(rule.id)
+    return builtin if builtin == rule else rule
+
+
+def _manifest(ep, plugin) -> dict:
+    """JSON-friendly description of everything *plugin* registers."""
+    checkers = []
+    for cls in plugin.get("checkers", []):
+        node_types = getattr(cls, "node_types", None)
+        if node_types:
+            node_types = [n if isinstance(n, str) else n.__name__ for n in node_types]
+        checkers.append(
+            {
+                "name": getattr(cls, "__name__", repr(cls)),
+                "category": getattr(cls, "category", None),
+                "node_types": node_types or None,
+            }
+        )
+    return {
+        "name": ep.name,
+        "value": ep.value,
+        "rules": [_rule_fields(r) for r in plugin.get("rules", [])],
+        "call_rules": [
+            [module, func, _rule_fields(r)]
+            for (module, func), r in plugin.get("call_rules", {}).items()
+        ],
+        "axes_hints": [
+            [func, _rule_fields(r)] for func, r in plugin.get("axes_hints", {}).items()
+        ],
+        "checkers": checkers,
+    }
+
+
+def _merge(manifests) -> dict:
     merged = {
         "rules": {},
         "call_rules": {},
         "axes_hints": {},
         "checkers": [],
     }
+    for m in manifests:
+        for fields in m["rules"]:
+            rule = _rule(fields)
+            merged["rules"][rule.id] = rule
+        for module, func, fields in m["call_rules"]:
+            merged["call_rules"][(module, func)] = _rule(fields)
+        for func, fields in m["axes_hints"]:
+            merged["axes_hints"][func] = _rule(fields)
+        for index, c in enumerate(m["checkers"]):
+            merged["checkers"].append(
+                LazyChecker(
+                    m["name"],
+                    m["value"],
+                    index,
+                    c["name"],
+                    c["category"],
+                    c["node_types"],
+                )
+            )
+    return merged
 
-    for ep in _iter_entry_points("scitex_linter.plugins"):
+
+# -- Disk cache --
+
+
+def _package_files(value: str):
+    """Sorted ``(path, mtime_ns)`` of the package *value* targets.
+
+    Covers the entry-point module file and every directory of its
+    top-level package (rules and checkers often live in submodules; saving
+    one through a rename bumps its directory). Files other than the entry
+    point are not stat-ed. Found without importing; ``__pycache__``
+    directories are skipped.
+    """
+    from ._packages import _spec_of
+
+    module = value.partition(":")[0].strip()
+    top = module.partition(".")[0]
+    try:
+        spec = _spec_of(top)
+        entry = spec if module == top else _spec_of(module)
+    except (ImportError, ValueError, AttributeError):
+        return None
+    if spec is True:
+        roots = list(getattr(sys.modules[top], "__path__", []))
+    else:
+        roots = list(getattr(spec, "submodule_search_locations", None) or [])
+    if entry is True:
+        origin = getattr(sys.modules[module], "__file__", None)
+    else:
+        origin = getattr(entry, "origin", None)
+    paths = [origin] if origin else []
+    for root in roots:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            paths.append(dirpath)
+    stamps = []
+    for path in paths:
         try:
-            get_plugin = ep.load()
-            plugin = get_plugin()
-        except Exception:
-            _logger.debug("Failed to load linter plugin %s", ep.name, exc_info=True)
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
             continue
+    return sorted(stamps)
 
-        for rule in plugin.get("rules", []):
-            merged["rules"][rule.id] = rule
-        merged["call_rules"].update(plugin.get("call_rules", {}))
-        merged["axes_hints"].update(plugin.get("axes_hints", {}))
-        merged["checkers"].extend(plugin.get("checkers", []))
 
-    _cache = merged
+def _is_installed_copy(files) -> bool:
+    """Whether `_dist_files` describes a non-editable install with a RECORD."""
+    record, direct_url = (list(files) + [None, None])[:2]
+    if not record:
+        return False
+    try:
+        info = json.loads(direct_url or "{}")
+    except ValueError:
+        return False
+    return not (info.get("dir_info") or {}).get("editable", False)
+
+
+def _dist_files(dist) -> list:
+    """Contents of *dist*'s ``RECORD`` and ``direct_url.json``, if any.
+
+    ``RECORD`` lists a hash of every installed file, so a reinstall that
+    keeps the version number still changes it.
+    """
+    read_text = getattr(dist, "read_text", None)
+    if read_text is None:
+        return []
+    texts = []
+    for name in ("RECORD", "direct_url.json"):
+        try:
+            texts.append(read_text(name))
+        except (OSError, ValueError):
+            texts.append(None)
+    return texts
+
+
+def _env_key(eps) -> str:
+    """Fingerprint of the installed plugin distributions."""
+    stamps = []
+    for ep in eps:
+        dist = getattr(ep, "dist", None)
+        files = _dist_files(dist)
+        stamps.append(
+            (
+                ep.name,
+                ep.value,
+                getattr(dist, "name", "") or "",
+                getattr(dist, "version", "") or "",
+                files,
+                None if _is_installed_copy(files) else _package_files(ep.value),
+            )
+        )
+    payload = json.dumps([_FORMAT, sys.executable, sys.version, stamps])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _cache_file():
+    from ._cache import cache_dir
+
+    return cache_dir() / "plugins.json"
+
+
+def _read_disk(key):
+    try:
+        with open(_cache_file(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return data.get("manifests")
+
+
+def _write_disk(key, manifests):
+    path = _cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "manifests": manifests}, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load_plugins():
+    """Load all registered linter plugins. Cached after first call.
+
+    Returns dict with keys: rules, call_rules, axes_hints, checkers.
+    Checkers are `LazyChecker` stand-ins for the plugin classes.
+    """
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    eps = sorted(_iter_entry_points(_GROUP), key=lambda ep: (ep.name, ep.value))
+    key = _env_key(eps) if eps and _use_disk else None
+    manifests = _read_disk(key) if key else None
+    if manifests is None:
+        manifests = []
+        complete = True
+        for ep in eps:
+            plugin = _import_plugin(ep)
+            if plugin is None:
+                complete = False
+                continue
+            manifests.append(_manifest(ep, plugin))
+        # A plugin that failed may work once its dependencies are installed
+        if complete and key:
+            _write_disk(key, manifests)
+
+    _cache = _merge(manifests)
     return _cache
 
 
+def set_disk_cache(enabled: bool) -> None:
+    """Use (default) or bypass the on-disk manifest cache in this process.
+
+    Switching drops the manifests already loaded, so the next
+    `load_plugins` follows the new setting.
+    """
+    global _use_disk, _cache
+    if enabled != _use_disk:
+        _use_disk = enabled
+        _cache = None
+
+
+def plugin_versions():
+    """Return sorted (name, target, version) triples for installed plugins.
+
+    Reads entry-point metadata only — plugin modules are not imported.
+    """
+    found = []
+    for ep in _iter_entry_points(_GROUP):
+        dist = getattr(ep, "dist", None)
+        found.append((ep.name, ep.value, getattr(dist, "version", "") or ""))
+    return sorted(found)
+
+
 def reset():
     """Reset cache (for testing)."""
-    global _cache
+    global _cache, _use_disk
     _cache = None
+    _use_disk = True
+    _loaded.clear()
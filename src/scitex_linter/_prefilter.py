@@ -0,0 +1,96 @@
+"""Lexical prefilter: skip parsing files that no rule can fire on.
+
+For a library module (``is_script`` is false) the structural S001/S002/
+S005 checks and the other script-only checks are exempt, and every
+remaining built-in check needs a specific identifier in the source:
+
+- import rules (I001-I003, I006, I007) need the imported module name;
+- call rules (`_rule_tables.CALL_RULES`, plugin ``call_rules``), axes
+  hints and the Path(...).mkdir() check need the called attribute name;
+- stx.io path checks (PA001/PA005) need ``save`` or ``load``, and the
+  load_configs() naming check (S007) needs ``load_configs``;
+- print()/open() (P005/PA002) and the session checks (S004/S006) only
+  fire inside an ``@stx.session``/``@session`` function.
+
+`can_skip` therefore answers True only when none of these identifiers
+occurs anywhere in the text. An identifier cannot be split across lines
+or built from escapes, so the substring test can only over-approximate
+(e.g. a match inside a comment or a longer name). It is bypassed
+entirely, and the file is parsed as usual, when:
+
+- the source is not pure ASCII (Python NFKC-normalizes identifiers, so
+  ``ｎｐ.ｓａｖｅ`` is ``np.save``) or contains NUL bytes;
+- the file is a script;
+- the FM checker or any plugin checker would run, since their triggers
+  are not declared.
+"""
+
+from __future__ import annotations
+
+from ._rule_tables import AXES_HINTS, CALL_RULES
+
+# Names the import, naming and session checks in checker.py key on
+_FIXED_TOKENS = (
+    "matplotlib",
+    "scipy",
+    "pickle",
+    "random",
+    "logging",
+    "load_configs",
+    "session",
+    "mkdir",
+)
+
+# (plugins dict, tokens); holding the dict keeps its identity unique
+_memo: tuple = (None, ())
+
+
+def _minimal(tokens) -> tuple:
+    """Drop tokens that contain another token; the result matches the same."""
+    kept = []
+    for t in sorted(set(tokens), key=len):
+        if not any(k in t for k in kept):
+            kept.append(t)
+    return tuple(kept)
+
+
+def trigger_tokens(plugins=None) -> tuple:
+    """Identifiers at least one of which every non-script issue requires."""
+    global _memo
+    if plugins is None:
+        from ._plugin_loader import load_plugins
+
+        plugins = load_plugins()
+    if _memo[0] is plugins:
+        return _memo[1]
+    tokens = set(_FIXED_TOKENS)
+    tokens.update(func for _, func in CALL_RULES)
+    tokens.update(AXES_HINTS)
+    tokens.update(func for _, func in plugins.get("call_rules", {}))
+    tokens.update(plugins.get("axes_hints", {}))
+    result = _minimal(tokens)
+    _memo = (plugins, result)
+    return result
+
+
+def _extra_checkers(config, plugins) -> bool:
+    """True if the FM checker or a plugin checker would run under *config*."""
+    enabled = set(config.enable)
+    if "FM" in enabled:
+        return True
+    return any(
+        getattr(cls, "category", None) != "figure" for cls in plugins["checkers"]
+    )
+
+
+def can_skip(source: str, filepath: str, config) -> bool:
+    """True if linting *source* is guaranteed to report no issues."""
+    if not source.isascii() or "\0" in source:
+        return False
+    from ._plugin_loader import load_plugins
+    from .checker import is_script
+
+    plugins = load_plugins()
+    if _extra_checkers(config, plugins) or is_script(filepath, config):
+        return False
+    return not any(t in source for t in trigger_tokens(plugins))
@@ -0,0 +1,247 @@
+"""Opt-in timing instrumentation for ``check --profile-rules``.
+
+While a `Profiler` is active (see `enable`), `lint_source`/`lint_file`
+record per-stage wall time (read, parse, dispatch, legacy checkers,
+post-checks) and the dispatch engine wraps every handler to record time,
+call count and hits (issues emitted) per handler and AST node type.
+
+Per rule ID, a handler's time and calls are charged to the rules it
+emits: time in proportion to each rule's share of the handler's hits,
+calls in full to every rule the handler emitted. A handler checks all of
+its rules on every call, so this answers "which rule is slow" as well as
+a single-pass visitor can; time of handlers that emitted nothing is
+reported as unattributed.
+
+When no profiler is active the hooks reduce to a ``current is None``
+check per file; the engine runs its uninstrumented loop.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+
+# The active Profiler, or None
+current = None
+
+
+def enable() -> Profiler:
+    """Start collecting into a fresh `Profiler` and return it."""
+    global current
+    current = Profiler()
+    return current
+
+
+def disable() -> None:
+    global current
+    current = None
+
+
+def _handler_label(handler) -> tuple:
+    """Return ``(label, owner)`` for a registered handler."""
+    target = getattr(handler, "__wrapped__", handler)
+    owner = getattr(target, "__self__", None)
+    name = getattr(target, "__name__", repr(target))
+    if owner is None:
+        return getattr(target, "__qualname__", name), None
+    return f"{type(owner).__name__}.{name}", owner
+
+
+def _rule_ids(issues):
+    for issue in issues:
+        rule = getattr(issue, "rule", None)
+        if rule is not None:
+            yield rule.id
+
+
+class Profiler:
+    """Accumulates timing across all files linted while active."""
+
+    def __init__(self):
+        self.stages: dict = {}  # stage -> seconds
+        self.handlers: dict = {}  # (label, node type) -> [seconds, calls, hits]
+        self.handler_rules: dict = {}  # (label, node type) -> Counter of rule ids
+        self.rules: Counter = Counter()  # rule id -> hits
+        self.rule_files: Counter = Counter()  # rule id -> files with hits
+        self.files: list = []  # (seconds, path)
+        self._mark = 0.0
+        # id(checker) -> (checker, Counter of rule ids in its issues so far)
+        self._tallies: dict = {}
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def lap(self, stage: str | None = None) -> None:
+        """Charge the time since the previous lap to *stage* (None: reset)."""
+        now = time.perf_counter()
+        if stage is not None:
+            self.stages[stage] = self.stages.get(stage, 0.0) + now - self._mark
+        self._mark = now
+
+    def add_file(self, path: str, seconds: float) -> None:
+        self.files.append((seconds, path))
+
+    def add_issues(self, issues: list) -> None:
+        ids = [i.rule.id for i in issues]
+        self.rules.update(ids)
+        self.rule_files.update(set(ids))
+        self._tallies.clear()  # the file's checkers are done
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    def wrap(self, handler, node_type: str):
+        """Return *handler* instrumented with time/call/hit accounting."""
+        label, owner = _handler_label(handler)
+        stats = self.handlers.setdefault((label, node_type), [0.0, 0, 0])
+        issues = getattr(owner, "issues", None)
+        timer = time.perf_counter
+        if issues is not None:
+            emitted = self.handler_rules.setdefault((label, node_type), Counter())
+            entry = self._tallies.get(id(owner))
+            if entry is None or entry[0] is not owner:
+                entry = self._tallies[id(owner)] = (owner, Counter())
+            tally = entry[1]
+
+        if issues is None:
+
+            def timed(node):
+                t = timer()
+                handler(node)
+                stats[0] += timer() - t
+                stats[1] += 1
+
+        else:
+
+            def timed(node):
+                n = len(issues)
+                t = timer()
+                handler(node)
+                stats[0] += timer() - t
+                stats[1] += 1
+                if len(issues) > n:
+                    stats[2] += len(issues) - n
+                    # Handlers may insert rather than append (S004), so
+                    # diff the whole tally instead of reading issues[n:]
+                    now = Counter(_rule_ids(issues))
+                    emitted.update(now - tally)
+                    tally.clear()
+                    tally.update(now)
+
+        return timed
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def by_node_type(self) -> dict:
+        totals: dict = {}
+        for (_, node_type), (secs, calls, hits) in self.handlers.items():
+            row = totals.setdefault(node_type, [0.0, 0, 0])
+            row[0] += secs
+            row[1] += calls
+            row[2] += hits
+        return totals
+
+    def by_rule(self) -> tuple:
+        """``({rule id: [seconds, calls]}, unattributed seconds)``.
+
+        See the module docstring for how handler time is attributed.
+        """
+        totals: dict = {}
+        unattributed = 0.0
+        for key, (secs, calls, _) in self.handlers.items():
+            emitted = self.handler_rules.get(key)
+            n = sum(emitted.values()) if emitted else 0
+            if not n:
+                unattributed += secs
+                continue
+            for rule_id, hits in emitted.items():
+                row = totals.setdefault(rule_id, [0.0, 0])
+                row[0] += secs * hits / n
+                row[1] += calls
+        return totals, unattributed
+
+    def to_dict(self, top: int = 10) -> dict:
+        timing, unattributed = self.by_rule()
+        return {
+            "stages": dict(self.stages),
+            "handlers": [
+                {
+                    "handler": label,
+                    "node_type": node_type,
+                    "seconds": secs,
+                    "calls": calls,
+                    "hits": hits,
+                }
+                for (label, node_type), (secs, calls, hits) in sorted(
+                    self.handlers.items(), key=lambda kv: -kv[1][0]
+                )
+            ],
+            "node_types": {
+                name: {"seconds": secs, "calls": calls, "hits": hits}
+                for name, (secs, calls, hits) in self.by_node_type().items()
+            },
+            "rules": {
+                rule_id: {
+                    "seconds": timing.get(rule_id, [0.0, 0])[0],
+                    "calls": timing.get(rule_id, [0.0, 0])[1],
+                    "hits": hits,
+                    "files": self.rule_files[rule_id],
+                }
+                for rule_id, hits in self._rules_by_time(timing)
+            },
+            "unattributed_seconds": unattributed,
+            "slowest_files": [
+                {"path": path, "seconds": secs}
+                for secs, path in sorted(self.files, reverse=True)[:top]
+            ],
+        }
+
+    def _rules_by_time(self, timing: dict) -> list:
+        """``(rule id, hits)`` pairs, slowest rule first."""
+        return sorted(
+            self.rules.items(), key=lambda kv: (-timing.get(kv[0], (0.0,))[0], kv[0])
+        )
+
+    def report(self, top: int = 10) -> str:
+        """Human-readable tables (times in milliseconds)."""
+        out = []
+        total = sum(self.stages.values()) or 1.0
+
+        out.append(f"{'Stage':<32} {'ms':>10} {'%':>6}")
+        for stage, secs in sorted(self.stages.items(), key=lambda kv: -kv[1]):
+            out.append(f"{stage:<32} {secs * 1e3:>10.1f} {secs / total:>6.1%}")
+
+        out.append("")
+        out.append(f"{'Handler':<40} {'Node':<16} {'ms':>9} {'calls':>8} {'hits':>6}")
+        rows = sorted(self.handlers.items(), key=lambda kv: -kv[1][0])
+        for (label, node_type), (secs, calls, hits) in rows:
+            out.append(
+                f"{label:<40} {node_type:<16} {secs * 1e3:>9.1f} {calls:>8} {hits:>6}"
+            )
+
+        out.append("")
+        out.append(f"{'Node type':<24} {'ms':>9} {'calls':>8} {'hits':>6}")
+        nodes = sorted(self.by_node_type().items(), key=lambda kv: -kv[1][0])
+        for name, (secs, calls, hits) in nodes:
+            out.append(f"{name:<24} {secs * 1e3:>9.1f} {calls:>8} {hits:>6}")
+
+        out.append("")
+        timing, unattributed = self.by_rule()
+        out.append(f"{'Rule':<24} {'ms':>9} {'calls':>8} {'hits':>8} {'files':>6}")
+        for rule_id, hits in self._rules_by_time(timing):
+            secs, calls = timing.get(rule_id, (0.0, 0))
+            out.append(
+                f"{rule_id:<24} {secs * 1e3:>9.1f} {calls:>8} {hits:>8} "
+                f"{self.rule_files[rule_id]:>6}"
+            )
+        out.append(f"{'(no issues emitted)':<24} {unattributed * 1e3:>9.1f}")
+
+        out.append("")
+        out.append(f"Slowest {top} files (ms)")
+        for secs, path in sorted(self.files, reverse=True)[:top]:
+            out.append(f"  {secs * 1e3:>9.1f}  {path}")
+        return "\n".join(out)
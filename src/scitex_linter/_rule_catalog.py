@@ -0,0 +1,424 @@
+"""Static catalog of the built-in rules, for commands that only list them.
+
+``scitex-linter rule`` prints rule metadata; importing the rule modules
+(and the dataclass machinery behind `Rule`) just for that costs more than
+the rest of the command. This table mirrors `rules.ALL_RULES` as
+``(id, severity, category, message, suggestion, requires)`` tuples in the
+same order; a test keeps the two in sync. Regenerate it in place with
+``python -m scitex_linter._rule_catalog``.
+"""
+
+FIELDS = ("id", "severity", "category", "message", "suggestion", "requires")
+
+RULES = (
+    (
+        "STX-S001",
+        "error",
+        "structure",
+        "Missing @stx.session or @stx.module decorator on main function",
+        'Add @stx.session (for scripts) or @stx.module (for cloud modules).\n  @stx.session\n  def main(...):\n      return 0\nIf this is library code (not a script), add its directory to library_dirs:\n  [tool.scitex-linter]\n  library_dirs = ["src", "tests", "apps", "config", "docs"]\n  Or: SCITEX_LINTER_LIBRARY_DIRS=src,tests,apps,config,docs',
+        "scitex",
+    ),
+    (
+        "STX-S002",
+        "error",
+        "structure",
+        "Missing `if __name__ == '__main__'` guard",
+        'Add `if __name__ == \'__main__\': main()` at the end of the script.\nIf this is library code (not a script), add its directory to library_dirs:\n  [tool.scitex-linter]\n  library_dirs = ["src", "tests", "apps", "config", "docs"]\n  Or: SCITEX_LINTER_LIBRARY_DIRS=src,tests,apps,config,docs',
+        "",
+    ),
+    (
+        "STX-S003",
+        "error",
+        "structure",
+        "argparse detected — @stx.session auto-generates CLI from function signature",
+        "Remove `import argparse` and define parameters as function arguments:\n  @stx.session\n  def main(data_path: str, threshold: float = 0.5):\n      # Auto-generates: --data-path, --threshold",
+        "scitex",
+    ),
+    (
+        "STX-S004",
+        "warning",
+        "structure",
+        "@stx.session function should return an integer exit code",
+        "Add `return 0` for success at the end of your session function.",
+        "scitex",
+    ),
+    (
+        "STX-S005",
+        "warning",
+        "structure",
+        "Missing `import scitex as stx`",
+        "Add `import scitex as stx` to use SciTeX modules.",
+        "scitex",
+    ),
+    (
+        "STX-S006",
+        "warning",
+        "structure",
+        "@stx.session function missing explicit INJECTED parameters",
+        "Declare auto-injected values explicitly in the function signature:\n  @stx.session\n  def main(\n      CONFIG=stx.session.INJECTED,\n      plt=stx.session.INJECTED,\n      COLORS=stx.session.INJECTED,\n      rngg=stx.session.INJECTED,\n      logger=stx.session.INJECTED,\n  ):\n      return 0",
+        "scitex",
+    ),
+    (
+        "STX-S007",
+        "warning",
+        "structure",
+        "load_configs() result should be assigned to an UPPER_CASE variable",
+        "Use UPPER_CASE for config variables — they hold project constants:\n  CONFIG = load_configs()          # good\n  config = load_configs()          # bad — looks like a local variable",
+        "",
+    ),
+    (
+        "STX-S008",
+        "info",
+        "structure",
+        "Magic number in module scope — consider centralizing in config/",
+        "Move hard-coded values to config/*.yaml and load with load_configs():\n  # config/MODEL.yaml\n  HIDDEN_DIM: 256\n  DROPOUT: 0.3\n\n  # script.py\n  CONFIG = load_configs()\n  CONFIG.MODEL.HIDDEN_DIM    # 256",
+        "",
+    ),
+    (
+        "STX-I001",
+        "warning",
+        "import",
+        "Use `stx.plt` instead of importing matplotlib.pyplot directly",
+        "Replace with `stx.plt` (or `plt` injected by @stx.session).",
+        "scitex",
+    ),
+    (
+        "STX-I002",
+        "warning",
+        "import",
+        "Use `stx.stats` instead of importing scipy.stats directly",
+        "Replace with `stx.stats` which adds effect sizes, CI, and power analysis.",
+        "scitex",
+    ),
+    (
+        "STX-I003",
+        "warning",
+        "import",
+        "Use `stx.io` instead of pickle for file I/O",
+        "Replace with `stx.io.save(obj, 'file.pkl')` / `stx.io.load('file.pkl')`.",
+        "scitex",
+    ),
+    (
+        "STX-I004",
+        "warning",
+        "import",
+        "Use `stx.io` for CSV/DataFrame I/O instead of pandas I/O functions",
+        "Replace `pd.read_csv()` with `stx.io.load()`, `df.to_csv()` with `stx.io.save()`.",
+        "scitex",
+    ),
+    (
+        "STX-I005",
+        "warning",
+        "import",
+        "Use `stx.io` for array I/O instead of numpy save/load",
+        "Replace `np.save()`/`np.load()` with `stx.io.save()`/`stx.io.load()`.",
+        "scitex",
+    ),
+    (
+        "STX-I006",
+        "info",
+        "import",
+        "Use `rngg` (injected by @stx.session) for reproducible randomness",
+        "Remove `import random` and use `rngg` from @stx.session injection.",
+        "scitex",
+    ),
+    (
+        "STX-I007",
+        "warning",
+        "import",
+        "Use `logger` (injected by @stx.session) instead of logging module",
+        "Remove `import logging` and use `logger` from @stx.session injection.",
+        "scitex",
+    ),
+    (
+        "STX-IO001",
+        "warning",
+        "io",
+        "`np.save()` detected — use `stx.io.save()` for provenance tracking",
+        "Replace `np.save(path, arr)` with `stx.io.save(arr, path)`.",
+        "scitex",
+    ),
+    (
+        "STX-IO002",
+        "warning",
+        "io",
+        "`np.load()` detected — use `stx.io.load()` for provenance tracking",
+        "Replace `np.load(path)` with `stx.io.load(path)`.",
+        "scitex",
+    ),
+    (
+        "STX-IO003",
+        "warning",
+        "io",
+        "`pd.read_csv()` detected — use `stx.io.load()` for provenance tracking",
+        "Replace `pd.read_csv(path)` with `stx.io.load(path)`.",
+        "scitex",
+    ),
+    (
+        "STX-IO004",
+        "warning",
+        "io",
+        "`.to_csv()` detected — use `stx.io.save()` for provenance tracking",
+        "Replace `df.to_csv(path)` with `stx.io.save(df, path)`.",
+        "scitex",
+    ),
+    (
+        "STX-IO005",
+        "warning",
+        "io",
+        "`pickle.dump()` detected — use `stx.io.save()` for provenance tracking",
+        "Replace `pickle.dump(obj, f)` with `stx.io.save(obj, 'file.pkl')`.",
+        "scitex",
+    ),
+    (
+        "STX-IO006",
+        "warning",
+        "io",
+        "`json.dump()` detected — use `stx.io.save()` for provenance tracking",
+        "Replace `json.dump(obj, f)` with `stx.io.save(obj, 'file.json')`.",
+        "scitex",
+    ),
+    (
+        "STX-IO007",
+        "warning",
+        "io",
+        "`.savefig()` detected — use `stx.io.save(fig, path)` for metadata embedding",
+        "Replace `fig.savefig(path)` with `stx.io.save(fig, path)`.",
+        "scitex",
+    ),
+    (
+        "STX-P001",
+        "info",
+        "plot",
+        "`ax.plot()` — consider `ax.stx_line()` for automatic CSV data export",
+        "Replace `ax.plot(x, y)` with `ax.stx_line(x, y)` for tracked plotting.",
+        "scitex",
+    ),
+    (
+        "STX-P002",
+        "info",
+        "plot",
+        "`ax.scatter()` — consider `ax.stx_scatter()` for automatic CSV data export",
+        "Replace `ax.scatter(x, y)` with `ax.stx_scatter(x, y)` for tracked plotting.",
+        "scitex",
+    ),
+    (
+        "STX-P003",
+        "info",
+        "plot",
+        "`ax.bar()` — consider `ax.stx_bar()` for automatic sample size annotation",
+        "Replace `ax.bar(x, y)` with `ax.stx_bar(x, y)` for tracked plotting.",
+        "scitex",
+    ),
+    (
+        "STX-P004",
+        "info",
+        "plot",
+        "`plt.show()` is non-reproducible in batch/CI environments",
+        "Remove `plt.show()` — figures are auto-saved in session output directory.",
+        "",
+    ),
+    (
+        "STX-P005",
+        "info",
+        "plot",
+        "`print()` inside @stx.session — use `logger` for tracked logging",
+        "Replace `print(msg)` with `logger.info(msg)` (injected by @stx.session).",
+        "scitex",
+    ),
+    (
+        "STX-ST001",
+        "warning",
+        "stats",
+        "`scipy.stats.ttest_ind()` — use `stx.stats.ttest_ind()` for auto effect size + CI",
+        "Replace with `stx.stats.ttest_ind(a, b)` which includes Cohen's d and CI.",
+        "scitex",
+    ),
+    (
+        "STX-ST002",
+        "warning",
+        "stats",
+        "`scipy.stats.mannwhitneyu()` — use `stx.stats.mannwhitneyu()` for auto effect size",
+        "Replace with `stx.stats.mannwhitneyu(a, b)` which includes Cliff's delta.",
+        "scitex",
+    ),
+    (
+        "STX-ST003",
+        "warning",
+        "stats",
+        "`scipy.stats.pearsonr()` — use `stx.stats.pearsonr()` for auto CI + power",
+        "Replace with `stx.stats.pearsonr(a, b)` which includes CI and power analysis.",
+        "scitex",
+    ),
+    (
+        "STX-ST004",
+        "warning",
+        "stats",
+        "`scipy.stats.f_oneway()` — use `stx.stats.anova_oneway()` for post-hoc + effect sizes",
+        "Replace with `stx.stats.anova_oneway(*groups)` which includes eta-squared.",
+        "scitex",
+    ),
+    (
+        "STX-ST005",
+        "warning",
+        "stats",
+        "`scipy.stats.wilcoxon()` — use `stx.stats.wilcoxon()` for auto effect size",
+        "Replace with `stx.stats.wilcoxon(a, b)` which includes effect size and CI.",
+        "scitex",
+    ),
+    (
+        "STX-ST006",
+        "warning",
+        "stats",
+        "`scipy.stats.kruskal()` — use `stx.stats.kruskal()` for post-hoc + effect sizes",
+        "Replace with `stx.stats.kruskal(*groups)` which includes epsilon-squared.",
+        "scitex",
+    ),
+    (
+        "STX-PA001",
+        "warning",
+        "path",
+        "Absolute path in `stx.io` call — use relative paths for reproducibility",
+        "Use `stx.io.save(obj, './relative/path.ext')` — paths resolve to script_out/.",
+        "scitex",
+    ),
+    (
+        "STX-PA002",
+        "warning",
+        "path",
+        "`open()` detected — use `stx.io.save()`/`stx.io.load()` which includes auto-logging",
+        "Replace `open(path)` with `stx.io.load(path)` or `stx.io.save(obj, path)`.\n  stx.io automatically logs all I/O operations for provenance tracking.",
+        "scitex",
+    ),
+    (
+        "STX-PA003",
+        "info",
+        "path",
+        "`os.makedirs()`/`mkdir()` detected — `stx.io.save()` creates directories automatically",
+        "Remove manual directory creation.\n  `stx.io.save(obj, './subdir/file.ext')` auto-creates `subdir/` inside script_out/.",
+        "scitex",
+    ),
+    (
+        "STX-PA004",
+        "warning",
+        "path",
+        "`os.chdir()` detected — scripts should be run from project root",
+        "Remove `os.chdir()` and run scripts from the project root directory.",
+        "",
+    ),
+    (
+        "STX-PA005",
+        "info",
+        "path",
+        "Path without `./` prefix in `stx.io` call — use `./` for explicit relative intent",
+        "Use `./filename.ext` instead of `filename.ext` to clarify relative path intent.",
+        "scitex",
+    ),
+    (
+        "STX-FM001",
+        "warning",
+        "figure",
+        "`figsize=` detected — inch-based figure sizing is imprecise for publications",
+        "Use mm-based sizing: `stx.plt.subplots(axes_width_mm=40, axes_height_mm=28)` or `fig, ax = fr.subplots(axes_width_mm=40, axes_height_mm=28)` for precise control.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM002",
+        "warning",
+        "figure",
+        "`tight_layout()` detected — layout is unpredictable across plot types",
+        "Use mm-based margins: `stx.plt.subplots(margin_left_mm=15, margin_bottom_mm=12)` for deterministic layout control.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM003",
+        "warning",
+        "figure",
+        '`bbox_inches="tight"` detected — can crop important elements unpredictably',
+        "Use `fr.save(fig, './plot.png')` or `stx.io.save(fig, './plot.png')` which handle cropping intelligently.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM004",
+        "info",
+        "figure",
+        "`constrained_layout=True` detected — conflicts with mm-based layout control",
+        "Use mm-based layout from `stx.plt.subplots()` instead of constrained_layout.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM005",
+        "info",
+        "figure",
+        "`subplots_adjust()` with hardcoded fractions — fragile across figure sizes",
+        "Use mm-based spacing: `stx.plt.subplots(space_w_mm=8, space_h_mm=10)` for size-independent layout.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM006",
+        "info",
+        "figure",
+        "`plt.savefig()` detected — no provenance tracking",
+        "Use `fr.save(fig, './plot.png')` or `stx.io.save(fig, './plot.png')` for recipe tracking and provenance.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM007",
+        "info",
+        "figure",
+        "`rcParams` direct modification detected — hard to maintain across figures",
+        "Use figrecipe style presets: `fr.load_style('SCITEX')` for consistent styling.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM008",
+        "warning",
+        "figure",
+        "`set_size_inches()` detected — bypasses mm-based layout control",
+        "Use mm-based sizing: `fr.subplots(axes_width_mm=40, axes_height_mm=28)` or `stx.plt.subplots(axes_width_mm=40, axes_height_mm=28)` for precise control.",
+        "figrecipe",
+    ),
+    (
+        "STX-FM009",
+        "warning",
+        "figure",
+        "`ax.set_position()` detected — conflicts with mm-based layout control",
+        "Use mm-based margins: `fr.subplots(margin_left_mm=15, margin_bottom_mm=12)` or `stx.plt.subplots(margin_left_mm=15, margin_bottom_mm=12)` for deterministic layout.",
+        "figrecipe",
+    ),
+)
+
+
+def _literal(value: str) -> str:
+    """``repr`` of *value*, double-quoted where possible (black style)."""
+    text = repr(value)
+    if text.startswith("'") and '"' not in value:
+        text = f'"{text[1:-1]}"'
+    return text
+
+
+def _render() -> str:
+    """Source of this module, regenerated from `rules.ALL_RULES`."""
+    import dataclasses
+
+    from .rules import ALL_RULES
+
+    with open(__file__, encoding="utf-8") as f:
+        head = f.read().split("RULES = (\n", 1)[0]
+        f.seek(0)
+        tail = f.read().split("\n)\n", 1)[1]
+    out = [head, "RULES = (\n"]
+    for rule in ALL_RULES.values():
+        out.append("    (\n")
+        for field in dataclasses.fields(rule):
+            out.append(f"        {_literal(getattr(rule, field.name))},\n")
+        out.append("    ),\n")
+    out.append(")\n")
+    return "".join(out) + tail
+
+
+if __name__ == "__main__":
+    _source = _render()
+    with open(__file__, "w", encoding="utf-8") as _f:
+        _f.write(_source)
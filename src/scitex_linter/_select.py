@@ -0,0 +1,66 @@
+"""Choosing which files a command processes.
+
+Shared by ``check``, ``format`` and the daemon: the whole tree (walked
+lazily), or the files git reports for ``--changed-since``/``--staged``,
+whose index versions ``--staged`` lints instead of the worktree copies.
+"""
+
+import itertools
+from pathlib import Path
+
+
+def collect_files(path: Path, recursive: bool = True, config=None) -> list:
+    """Collect Python files from a path."""
+    from ._walk import iter_files
+
+    return list(iter_files(path, config=config, recursive=recursive))
+
+
+def select_files(args, target: Path, config):
+    """Files to process: a list from git when requested, else a lazy tree walk."""
+    from ._walk import iter_files
+
+    if getattr(args, "staged", False) or getattr(args, "changed_since", None):
+        from ._git import changed_files
+
+        return changed_files(
+            target, ref=args.changed_since, staged=args.staged, config=config
+        )
+    return iter_files(target, config=config)
+
+
+def nonempty(files):
+    """*files*, or None if it has no items; a lazy iterator stays lazy."""
+    if hasattr(files, "__len__"):
+        return files or None
+    first = next(files, None)
+    return None if first is None else itertools.chain([first], files)
+
+
+def _staged_sources(files):
+    """Yield ``(path, source)`` for the index version of each of *files*."""
+    from ._git import BlobReader, repo_root
+
+    with BlobReader(repo_root(files[0])) as blobs:
+        for f in files:
+            data = blobs.read_staged(f)
+            if data is None:
+                continue
+            try:
+                source = data.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            yield str(f), source
+
+
+def lint_staged(files, config, jobs: int = 1):
+    """Lint the index version of *files*, yielding ``(path, issues)``.
+
+    Blobs are read here; with *jobs* > 1 their contents are linted in a
+    process pool.
+    """
+    from ._parallel import lint_sources, resolve_jobs
+
+    files = list(files)
+    jobs = resolve_jobs(jobs, len(files))
+    yield from lint_sources(_staged_sources(files), config, jobs=jobs)
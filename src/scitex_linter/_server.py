@@ -9,8 +9,11 @@ SciTeX Linter: AST-based linter enforcing reproducible research patterns.
 
 Tools:
 - linter_check: Check a Python file
+- linter_check_many: Check a list of files, directories or globs (paged)
+- linter_check_dir: Check every Python file under a directory (paged)
 - linter_list_rules: List all lint rules
 - linter_check_source: Lint source code string
+- linter_cache_stats: Hit/miss counters of the server-side result cache
 """
 
 mcp = FastMCP(name="scitex-linter", instructions=_INSTRUCTIONS)
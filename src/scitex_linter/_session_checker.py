@@ -0,0 +1,69 @@
+"""Decorator detection for @stx.session / @stx.module functions, and S006."""
+
+import ast
+
+from .rules import S006, Rule
+
+
+def is_session(node: ast.FunctionDef) -> bool:
+    """Check if function has @stx.session or @session decorator."""
+    for deco in node.decorator_list:
+        # @stx.session
+        if isinstance(deco, ast.Attribute):
+            if (
+                isinstance(deco.value, ast.Name)
+                and deco.value.id in ("stx", "scitex")
+                and deco.attr == "session"
+            ):
+                return True
+        # @session (bare)
+        if isinstance(deco, ast.Name) and deco.id == "session":
+            return True
+    return False
+
+
+def is_module(node: ast.FunctionDef) -> bool:
+    """Check if function has @stx.module(...) decorator."""
+    for deco in node.decorator_list:
+        # @stx.module(...) — Call wrapping Attribute
+        if isinstance(deco, ast.Call) and isinstance(deco.func, ast.Attribute):
+            if (
+                isinstance(deco.func.value, ast.Name)
+                and deco.func.value.id in ("stx", "scitex")
+                and deco.func.attr == "module"
+            ):
+                return True
+        # @stx.module (bare, no parens)
+        if isinstance(deco, ast.Attribute):
+            if (
+                isinstance(deco.value, ast.Name)
+                and deco.value.id in ("stx", "scitex")
+                and deco.attr == "module"
+            ):
+                return True
+        # @module(...) (bare call)
+        if isinstance(deco, ast.Call) and isinstance(deco.func, ast.Name):
+            if deco.func.id == "module":
+                return True
+    return False
+
+
+def check_injected_params(checker, node: ast.FunctionDef) -> None:
+    """Check that @stx.session function declares all INJECTED parameters."""
+    declared = {arg.arg for arg in node.args.args}
+    missing = sorted(set(checker.config.required_injected) - declared)
+    if missing:
+        line = checker._get_source(node.lineno)
+        missing_str = ", ".join(missing)
+        dynamic_rule = Rule(
+            id=S006.id,
+            severity=S006.severity,
+            category=S006.category,
+            message=(
+                f"@stx.session function missing INJECTED parameters: {missing_str}. "
+                f"All 5 must be declared: CONFIG, COLORS, logger, plt, rngg"
+            ),
+            suggestion=S006.suggestion,
+            requires=S006.requires,
+        )
+        checker._add(dynamic_rule, node.lineno, node.col_offset, line)
@@ -0,0 +1,235 @@
+"""Aggregate lint findings into counters (``check --statistics``).
+
+`Statistics` keeps one row of counters per top-level directory (the
+first path component below the scanned root) and one column per rule,
+each row an ``array('q')``, plus per-directory file counts. Issues are
+reduced to ``(rule_id, severity, category, n)`` tuples as soon as a file
+has been linted (inside the worker process when running in parallel),
+so no `Issue` objects outlive their file and memory does not grow with
+the number of findings.
+
+Rollups by rule, category, severity and directory are derived from the
+matrix on demand; `to_json` and `format_table` render them.
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from pathlib import Path
+
+
+def count_issues(issues) -> list:
+    """Reduce *issues* to ``[(rule_id, severity, category, n), ...]``."""
+    counts = {}
+    for issue in issues:
+        rule = issue.rule
+        key = (rule.id, rule.severity, rule.category)
+        counts[key] = counts.get(key, 0) + 1
+    return [(*key, n) for key, n in counts.items()]
+
+
+class Statistics:
+    """Rule x top-level-directory issue counters for one scan.
+
+    Findings below *min_severity* or outside *categories* (a set of
+    category names, None for all) are not counted.
+    """
+
+    def __init__(self, root=".", min_severity: str = "info", categories=None):
+        from .rules import SEVERITY_ORDER
+
+        self.root = os.path.abspath(root)
+        if os.path.isfile(self.root):
+            self.root = os.path.dirname(self.root)
+        self._min_sev = SEVERITY_ORDER[min_severity]
+        self._categories = set(categories) if categories else None
+        self.rules: list = []  # column -> (rule_id, severity, category)
+        self._rule_index: dict = {}
+        self.dirs: list = []  # row -> directory name
+        self._dir_index: dict = {}
+        self._rows: list = []  # row -> array('q') of per-rule counts
+        self._files = array("q")
+        self._dirty = array("q")  # files with at least one counted issue
+
+    # -- Accumulation --
+
+    def _dir_row(self, path: str) -> int:
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        parts = Path(rel).parts
+        name = parts[0] if len(parts) > 1 else "."
+        row = self._dir_index.get(name)
+        if row is None:
+            row = self._dir_index[name] = len(self.dirs)
+            self.dirs.append(name)
+            self._rows.append(array("q", bytes(8 * len(self.rules))))
+            self._files.append(0)
+            self._dirty.append(0)
+        return row
+
+    def _rule_col(self, key: tuple) -> int:
+        col = self._rule_index.get(key)
+        if col is None:
+            col = self._rule_index[key] = len(self.rules)
+            self.rules.append(key)
+            for counts in self._rows:
+                counts.append(0)
+        return col
+
+    def add_counts(self, path: str, counts) -> int:
+        """Count one file's ``count_issues`` tuples; return how many counted."""
+        from .rules import SEVERITY_ORDER
+
+        row = self._dir_row(path)
+        self._files[row] += 1
+        total = 0
+        for rule_id, severity, category, n in counts:
+            if SEVERITY_ORDER.get(severity, 0) < self._min_sev:
+                continue
+            if self._categories is not None and category not in self._categories:
+                continue
+            col = self._rule_col((rule_id, severity, category))
+            self._rows[row][col] += n
+            total += n
+        if total:
+            self._dirty[row] += 1
+        return total
+
+    def add(self, path: str, issues) -> int:
+        """Count one file's issues; return how many counted."""
+        return self.add_counts(path, count_issues(issues))
+
+    # -- Rollups --
+
+    @property
+    def files(self) -> int:
+        return sum(self._files)
+
+    @property
+    def files_with_issues(self) -> int:
+        return sum(self._dirty)
+
+    def _column_totals(self) -> list:
+        totals = [0] * len(self.rules)
+        for counts in self._rows:
+            for col, n in enumerate(counts):
+                totals[col] += n
+        return totals
+
+    @property
+    def total(self) -> int:
+        return sum(sum(counts) for counts in self._rows)
+
+    def _rollup(self, field: int) -> dict:
+        out = {}
+        for key, n in zip(self.rules, self._column_totals()):
+            out[key[field]] = out.get(key[field], 0) + n
+        return dict(sorted(out.items(), key=lambda kv: (-kv[1], kv[0])))
+
+    def by_rule(self) -> dict:
+        """``{rule_id: count}``, most frequent first."""
+        return self._rollup(0)
+
+    def by_severity(self) -> dict:
+        return self._rollup(1)
+
+    def by_category(self) -> dict:
+        return self._rollup(2)
+
+    def by_directory(self) -> dict:
+        """``{dir: {"files", "files_with_issues", "issues"}}`` in scan order."""
+        return {
+            name: {
+                "files": self._files[row],
+                "files_with_issues": self._dirty[row],
+                "issues": sum(self._rows[row]),
+            }
+            for row, name in enumerate(self.dirs)
+        }
+
+    def rule_by_directory(self) -> dict:
+        """Sparse matrix ``{dir: {rule_id: count}}``."""
+        out = {}
+        for row, name in enumerate(self.dirs):
+            cells = {}
+            for col, n in enumerate(self._rows[row]):
+                if n:
+                    rule_id = self.rules[col][0]
+                    cells[rule_id] = cells.get(rule_id, 0) + n
+            if cells:
+                out[name] = cells
+        return out
+
+    # -- Output --
+
+    def to_json(self) -> dict:
+        return {
+            "files": self.files,
+            "files_with_issues": self.files_with_issues,
+            "issues": self.total,
+            "by_rule": self.by_rule(),
+            "by_category": self.by_category(),
+            "by_severity": self.by_severity(),
+            "by_directory": self.by_directory(),
+            "rule_by_directory": self.rule_by_directory(),
+        }
+
+    def format_table(self) -> str:
+        """Human-readable rollup tables."""
+        totals = self._column_totals()
+        out = [f"{'Rule':<16} {'Severity':<9} {'Category':<12} {'Count':>9}"]
+        rows = sorted(zip(self.rules, totals), key=lambda kv: (-kv[1], kv[0]))
+        for (rule_id, severity, category), n in rows:
+            out.append(f"{rule_id:<16} {severity:<9} {category:<12} {n:>9}")
+
+        out.append("")
+        out.append(f"{'Directory':<32} {'Files':>7} {'Flagged':>8} {'Issues':>9}")
+        for name, d in self.by_directory().items():
+            out.append(
+                f"{name:<32} {d['files']:>7} {d['files_with_issues']:>8} "
+                f"{d['issues']:>9}"
+            )
+
+        out.append("")
+        for title, rollup in (
+            ("Severity", self.by_severity()),
+            ("Category", self.by_category()),
+        ):
+            parts = ", ".join(f"{k}: {n}" for k, n in rollup.items())
+            out.append(f"{title:<9} {parts or '-'}")
+        out.append("")
+        out.append(
+            f"{self.total} issues in {self.files_with_issues} of {self.files} files"
+        )
+        return "\n".join(out)
+
+
+def collect(
+    path,
+    config=None,
+    jobs: int | None = 1,
+    severity: str = "info",
+    category: str | None = None,
+    use_cache: bool = True,
+) -> Statistics:
+    """Lint every file under *path* into a `Statistics`."""
+    from ._parallel import count_paths, resolve_jobs
+    from ._walk import iter_files
+    from .config import load_config
+
+    if config is None:
+        config = load_config(str(path))
+    cache = None
+    if use_cache:
+        from ._cache import LintCache
+
+        cache = LintCache()
+    categories = category.split(",") if category else None
+    stats = Statistics(path, min_severity=severity, categories=categories)
+    n = 1 if Path(path).is_file() else resolve_jobs(jobs)
+    files = iter_files(Path(path), config=config)
+    for f, counts in count_paths(files, config, jobs=n, cache=cache):
+        stats.add_counts(f, counts)
+    if cache is not None:
+        cache.prune()
+    return stats
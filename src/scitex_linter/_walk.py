@@ -0,0 +1,334 @@
+"""Pruning directory walker used to collect files for check/format.
+
+Excluded directories (``config.exclude_dirs``) and paths ignored by
+``.gitignore`` files or ``.git/info/exclude`` are pruned *before* they are
+entered, so large ``.venv``/``node_modules``/data trees cost a single
+``scandir`` entry. Directories are deduplicated on (device, inode) to
+survive symlink loops, and files are yielded lazily in the same order as
+``sorted(path.glob("**/*.py"))``.
+
+Supported ``.gitignore`` syntax: comments, ``!`` negation, trailing ``/``
+(directory-only), anchored patterns (containing ``/``), ``*``, ``?``,
+``[...]`` and ``**``. Deeper ignore files take precedence over shallower
+ones; within a file the last matching pattern wins.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+_DEFAULT_SKIP = frozenset(
+    {"__pycache__", ".git", "node_modules", ".tox", "venv", ".venv"}
+)
+
+
+# =========================================================================
+# .gitignore patterns
+# =========================================================================
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over a relative posix path."""
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                j = i + 2
+                at_segment_start = i == 0 or pattern[i - 1] == "/"
+                if at_segment_start and j == n:
+                    out.append(".*")  # "dir/**": everything inside
+                    i = j
+                    continue
+                if at_segment_start and pattern[j] == "/":
+                    out.append("(?:.*/)?")  # "**/": zero or more directories
+                    i = j + 1
+                    continue
+                i = j - 1  # not a segment: behaves like "*"
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 2)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    body = "".join(out)
+    return ("" if anchored else "(?:.*/)?") + body + r"\Z"
+
+
+class IgnoreFile:
+    """Compiled patterns of one ignore file, relative to its *base* directory."""
+
+    def __init__(self, base: str, lines):
+        self.base = base
+        self.rules = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip("\r")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            self.rules.append((re.compile(_translate(line)), negated, dir_only))
+
+    @classmethod
+    def load(cls, base: str, path: str) -> IgnoreFile | None:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return cls(base, f.readlines())
+        except OSError:
+            return None
+
+    def match(self, abspath: str, is_dir: bool) -> bool | None:
+        """True if ignored, False if re-included, None if no pattern matches."""
+        rel = abspath[len(self.base) :].lstrip(os.sep)
+        if os.sep != "/":
+            rel = rel.replace(os.sep, "/")
+        for regex, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                return not negated
+        return None
+
+
+def _is_ignored(layers: list, abspath: str, is_dir: bool) -> bool:
+    for layer in reversed(layers):
+        verdict = layer.match(abspath, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _find_git_root(start: str) -> str | None:
+    probe = start
+    while True:
+        if os.path.exists(os.path.join(probe, ".git")):
+            return probe
+        parent = os.path.dirname(probe)
+        if parent == probe:
+            return None
+        probe = parent
+
+
+def _ancestor_layers(root_abs: str) -> list:
+    """Ignore files that apply to *root_abs* from its enclosing git work tree.
+
+    Returns ``.git/info/exclude`` plus the ``.gitignore`` files of the git
+    root and every directory between it and *root_abs* (exclusive; the
+    walker picks up *root_abs*'s own ``.gitignore``).
+    """
+    git_root = _find_git_root(root_abs)
+    if git_root is None:
+        return []
+
+    layers = []
+    info_exclude = os.path.join(git_root, ".git", "info", "exclude")
+    exclude = IgnoreFile.load(git_root, info_exclude)
+    if exclude is not None:
+        layers.append(exclude)
+
+    chain = []
+    current = root_abs
+    while current != git_root:
+        current = os.path.dirname(current)
+        chain.append(current)
+    for d in reversed(chain):
+        layer = IgnoreFile.load(d, os.path.join(d, ".gitignore"))
+        if layer is not None:
+            layers.append(layer)
+    return layers
+
+
+# =========================================================================
+# Walker
+# =========================================================================
+
+
+def iter_files(
+    path: Path,
+    config=None,
+    recursive: bool = True,
+    suffixes: tuple = (".py",),
+    stamps: dict | None = None,
+):
+    """Yield files under *path* with one of *suffixes*, lazily and in order.
+
+    A file *path* is yielded as-is. Excluded and git-ignored directories
+    are pruned without being entered. If *stamps* is given, it is filled
+    with ``{abspath: mtime_ns}`` for every directory entered and every
+    ``.gitignore`` read, so a caller can tell whether a walk would see
+    the same files without repeating it.
+    """
+    path = Path(path)
+    if path.is_file():
+        yield path
+        return
+    if not path.is_dir():
+        return
+
+    skip = frozenset(config.exclude_dirs) if config else _DEFAULT_SKIP
+    if any(s in path.parts for s in skip):
+        return
+    gitignore = getattr(config, "respect_gitignore", True)
+
+    root_abs = os.path.abspath(path)
+    layers = _ancestor_layers(root_abs) if gitignore else []
+    seen = set()
+    yield from _walk(
+        str(path), root_abs, layers, skip, gitignore, recursive, suffixes, seen, stamps
+    )
+
+
+def _walk(
+    display, abspath, layers, skip, gitignore, recursive, suffixes, seen, stamps=None
+):
+    try:
+        st = os.stat(abspath)
+    except OSError:
+        return
+    ident = (st.st_dev, st.st_ino)
+    if ident in seen:
+        return
+    seen.add(ident)
+    if stamps is not None:
+        stamps[abspath] = st.st_mtime_ns
+
+    try:
+        with os.scandir(abspath) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+
+    if gitignore:
+        for e in entries:
+            if e.name == ".gitignore":
+                layer = IgnoreFile.load(abspath, e.path)
+                if layer is not None:
+                    layers = layers + [layer]
+                if stamps is not None:
+                    try:
+                        stamps[e.path] = e.stat().st_mtime_ns
+                    except OSError:
+                        pass
+                break
+
+    for e in entries:
+        name = e.name
+        child_abs = os.path.join(abspath, name)
+        try:
+            is_dir = e.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            if not recursive or name in skip:
+                continue
+            if layers and _is_ignored(layers, child_abs, True):
+                continue
+            yield from _walk(
+                os.path.join(display, name),
+                child_abs,
+                layers,
+                skip,
+                gitignore,
+                recursive,
+                suffixes,
+                seen,
+                stamps,
+            )
+        elif name.endswith(suffixes):
+            try:
+                if not e.is_file():
+                    continue
+            except OSError:
+                continue
+            if layers and _is_ignored(layers, child_abs, False):
+                continue
+            yield Path(display, name)
+
+
+def ignore_filter(config=None):
+    """Return ``ignored(path, root=None) -> bool`` for files found otherwise.
+
+    For files that did not come from `iter_files` (e.g. glob matches):
+    applies the rules the walker prunes by. These are ``exclude_dirs`` on
+    the path's components and, unless ``respect_gitignore`` is off, the
+    ignore files checked for every directory from the top down to the
+    file. The top is the enclosing git work tree (with its
+    ``.git/info/exclude``), or else *root*, standing in for the
+    directory a walk would have started from. Git roots and loaded ignore
+    files are shared across calls, so filtering many matches looks up each
+    directory's work tree and reads each ignore file once.
+    """
+    skip = frozenset(config.exclude_dirs) if config else _DEFAULT_SKIP
+    gitignore = getattr(config, "respect_gitignore", True)
+    layers_of: dict = {}  # (top, directory) -> ignore layers in effect inside it
+    git_root_of: dict = {}  # directory -> enclosing git work tree (or None)
+
+    def git_root(directory: str) -> str | None:
+        if directory not in git_root_of:
+            git_root_of[directory] = _find_git_root(directory)
+        return git_root_of[directory]
+
+    def layers_in(top: str, directory: str, parent_layers: list) -> list:
+        layers = layers_of.get((top, directory))
+        if layers is None:
+            layer = IgnoreFile.load(directory, os.path.join(directory, ".gitignore"))
+            layers = parent_layers + [layer] if layer is not None else parent_layers
+            layers_of[top, directory] = layers
+        return layers
+
+    def ignored(path, root=None) -> bool:
+        if skip.intersection(Path(path).parts):
+            return True
+        if not gitignore:
+            return False
+        abspath = os.path.abspath(path)
+        top = git_root(os.path.dirname(abspath))
+        base = []
+        if top is not None and (top, top) not in layers_of:
+            info = os.path.join(top, ".git", "info", "exclude")
+            exclude = IgnoreFile.load(top, info)
+            if exclude is not None:
+                base.append(exclude)
+        elif root is not None:
+            top = os.path.abspath(root)
+        if top is None or not abspath.startswith(top.rstrip(os.sep) + os.sep):
+            return False
+        layers = layers_in(top, top, base)
+        current = top
+        parts = Path(os.path.relpath(abspath, top)).parts
+        for i, name in enumerate(parts):
+            child = os.path.join(current, name)
+            is_dir = i < len(parts) - 1
+            if layers and _is_ignored(layers, child, is_dir):
+                return True
+            if is_dir:
+                layers = layers_in(top, child, layers)
+                current = child
+        return False
+
+    return ignored
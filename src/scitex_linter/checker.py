@@ -3,14 +3,13 @@
 __all__ = ["Issue", "is_script", "lint_file", "lint_source"]
 
 import ast
-import re
-from dataclasses import dataclass, replace
+from dataclasses import replace
 from pathlib import Path
 
-from . import rules
-from ._rule_tables import AXES_HINTS as _AXES_HINTS
+from . import _profile, rules
+from ._engine import DispatchEngine
+from ._issue import Issue, _detach, _is_allowed_by_comment
 from ._rule_tables import AXES_SKIP as _AXES_SKIP
-from ._rule_tables import CALL_RULES as _CALL_RULES
 from ._rule_tables import (
     I001,
     I002,
@@ -22,77 +21,12 @@ from ._rule_tables import (
     S003,
     S004,
     S005,
-    S006,
 )
 from ._rule_tables import PRINT_RULE as _PRINT_RULE
+from .config import is_script
 from .rules import Rule
 
 
-@dataclass
-class Issue:
-    rule: Rule
-    line: int
-    col: int
-    source_line: str = ""
-
-
-def is_script(filepath: str, config=None) -> bool:
-    """Check if file is a script (not a library module).
-
-    Uses config.library_patterns and config.library_dirs to determine
-    which files are library modules (exempt from script-only rules).
-    """
-    from .config import load_config, matches_library_pattern
-
-    if config is None:
-        config = load_config(start_path=filepath)
-
-    path = Path(filepath)
-    name = path.name
-
-    # Check filename against library patterns (e.g., __*__.py, test_*.py)
-    if matches_library_pattern(name, config):
-        return False
-
-    # Check if file is inside a library directory (e.g., src/)
-    parts = path.parts
-    for lib_dir in config.library_dirs:
-        if lib_dir in parts:
-            return False
-
-    # Check if file is inside a script directory (e.g., scripts/)
-    # These are utility scripts called by shell, not SciTeX session scripts
-    for script_dir in config.script_dirs:
-        if script_dir in parts:
-            return False
-
-    return True
-
-
-_STX_ALLOW_RE = re.compile(r"#\s*stx-allow\b(?::?\s*(.+))?")
-
-
-def _is_allowed_by_comment(source_line: str, rule_id: str) -> bool:
-    """Check if a source line has a ``# stx-allow`` comment suppressing *rule_id*.
-
-    Supported forms::
-
-        x = 1  # stx-allow                     → suppresses ALL rules on this line
-        x = 1  # stx-allow: STX-S003           → suppresses STX-S003
-        x = 1  # stx-allow: STX-S003, STX-I001 → suppresses both
-    """
-    if not source_line:
-        return False
-    m = _STX_ALLOW_RE.search(source_line)
-    if m is None:
-        return False
-    ids_str = m.group(1)
-    if not ids_str:
-        return True  # bare ``# stx-allow`` suppresses everything
-    allowed = {s.strip() for s in ids_str.split(",")}
-    return rule_id in allowed
-
-
 class SciTeXChecker(ast.NodeVisitor):
     """AST visitor detecting non-SciTeX patterns."""
 
@@ -113,25 +47,42 @@ class SciTeXChecker(ast.NodeVisitor):
         self._has_session_decorator = False
         self._has_module_decorator = False
         self._session_func_returns_int = False
+        self._session_frames: list = []  # open @stx.session functions
         self._imports: dict = {}  # alias -> full module path
         self._is_script = is_script(filepath, self.config)
         self._func_depth = 0  # >0 means inside a function body
+        from . import _call_index
         from ._plugin_loader import load_plugins
 
-        _plugins = load_plugins()
-        # Filter plugin rules by config.enable (FM rules need opt-in)
-        _enabled = set(self.config.enable) if self.config else set()
-        _CAT_ENABLE = {"figure": "FM"}  # categories requiring opt-in
-        self._plugin_call_rules = {
-            k: r
-            for k, r in _plugins["call_rules"].items()
-            if r.category not in _CAT_ENABLE or _CAT_ENABLE[r.category] in _enabled
-        }
-        self._plugin_checkers = _plugins["checkers"]
-
-    # -- Import visitors --
-
-    def visit_Import(self, node: ast.Import) -> None:
+        self._plugin_checkers = load_plugins()["checkers"]
+        # Built-in + plugin call rules by attribute name (FM rules opt-in)
+        self._call_index = _call_index.for_config(self.config)
+        self._call_memo: dict = {}  # (attr, module alias) -> rule_for(...)
+
+    # -- Single-pass registration --
+
+    def register(self, engine) -> None:
+        """Register this checker's node handlers with a `DispatchEngine`."""
+        engine.register(ast.Import, self._on_import)
+        engine.register(ast.ImportFrom, self._on_import_from)
+        engine.register(ast.Assign, self._on_assign)
+        engine.register(ast.Call, self._check_call)
+        engine.register(ast.If, self._on_if)
+        engine.register(ast.Return, self._on_return)
+        for cls in (ast.FunctionDef, ast.AsyncFunctionDef):
+            engine.register(cls, self._enter_function)
+            engine.register(cls, self._leave_function, leave=True)
+
+    def visit(self, node: ast.AST) -> None:
+        """Run all checks over *node* in a single traversal."""
+        engine = DispatchEngine()
+        self.register(engine)
+        engine.run(node)
+
+    # -- Import handlers --
+
+    def _on_import(self, node: ast.Import) -> None:
+        self._call_memo.clear()
         for alias in node.names:
             name = alias.asname or alias.name
             self._imports[name] = alias.name
@@ -141,17 +92,15 @@ class SciTeXChecker(ast.NodeVisitor):
 
             self._check_import(alias.name, node)
 
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def _on_import_from(self, node: ast.ImportFrom) -> None:
         module = node.module or ""
+        self._call_memo.clear()
         for alias in node.names:
             name = alias.asname or alias.name
             full = f"{module}.{alias.name}"
             self._imports[name] = full
 
         self._check_import_from(module, node)
-        self.generic_visit(node)
 
     def _check_import(self, module_name: str, node: ast.Import) -> None:
         """Check bare `import X` statements."""
@@ -200,19 +149,14 @@ class SciTeXChecker(ast.NodeVisitor):
         if module == "argparse" and self._is_script:
             self._add(S003, node.lineno, node.col_offset, line)
 
-    # -- Assignment visitors --
+    # -- Assignment handler --
 
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def _on_assign(self, node: ast.Assign) -> None:
         from ._naming_checker import check_assignment
 
         check_assignment(self, node)
-        self.generic_visit(node)
-
-    # -- Call visitors (Phase 2) --
 
-    def visit_Call(self, node: ast.Call) -> None:
-        self._check_call(node)
-        self.generic_visit(node)
+    # -- Call handler (Phase 2) --
 
     def _check_call(self, node: ast.Call) -> None:
         """Check function calls against Phase 2 rules."""
@@ -220,97 +164,10 @@ class SciTeXChecker(ast.NodeVisitor):
 
         # module.func() pattern -- e.g., np.save(), stats.ttest_ind()
         if isinstance(func, ast.Attribute):
-            func_name = func.attr
-            mod_name = None
-
-            if isinstance(func.value, ast.Name):
-                mod_name = func.value.id
-            elif isinstance(func.value, ast.Attribute):
-                # module.sub.func() -- e.g., scipy.stats.ttest_ind()
-                if isinstance(func.value.value, ast.Name):
-                    mod_name = func.value.attr  # use "stats" from scipy.stats
-
-            # Check stx.io path patterns before skipping stx.* calls
-            if mod_name in ("stx", "scitex") or (
-                isinstance(func.value, ast.Attribute)
-                and isinstance(func.value.value, ast.Name)
-                and func.value.value.id in ("stx", "scitex")
-            ):
-                self._check_stx_io_path(node)
-                return
-
-            # Resolve alias: if user did `import numpy as np`, resolve np -> numpy
-            resolved = self._imports.get(mod_name, mod_name)
-
-            # Check (module, func) against rule table
-            rule = _CALL_RULES.get((mod_name, func_name))
-            if rule is None and resolved != mod_name:
-                rule = _CALL_RULES.get((resolved, func_name))
-            if rule is None:
-                rule = _CALL_RULES.get((None, func_name))
-
-            # Fallback to plugin-contributed rules
-            if rule is None:
-                rule = self._plugin_call_rules.get((mod_name, func_name))
-            if rule is None and resolved != mod_name:
-                rule = self._plugin_call_rules.get((resolved, func_name))
-            if rule is None:
-                rule = self._plugin_call_rules.get((None, func_name))
-
-            # Special cases
-            if rule is not None:
-                # plt.show() -- only flag if mod resolves to matplotlib
-                if rule is rules.P004:
-                    if mod_name not in ("plt", "pyplot") and resolved not in (
-                        "matplotlib.pyplot",
-                    ):
-                        return
-
-                # to_csv / savefig -- skip on non-data/figure objects
-                if rule in (rules.IO004, rules.IO007):
-                    if mod_name in ("stx", "scitex", "os", "sys", "Path"):
-                        return
-
-                # FM rules: exempt stx.*/fr.*/figrecipe.* calls
-                if rule.category == "figure":
-                    _exempt = ("stx", "scitex", "fr", "figrecipe")
-                    if mod_name in _exempt:
-                        return
-                    # Check root of chained call: fr.fig.set_size_inches()
-                    if (
-                        isinstance(func.value, ast.Attribute)
-                        and isinstance(func.value.value, ast.Name)
-                        and func.value.value.id in _exempt
-                    ):
-                        return
-
-                line = self._get_source(node.lineno)
-                self._add(rule, node.lineno, node.col_offset, line)
-                return
-
-            # Axes hints: ax.plot(), ax.scatter(), ax.bar()
-            if func_name in _AXES_HINTS and mod_name not in _AXES_SKIP:
-                # Heuristic: if variable name looks like axes
-                if mod_name and (
-                    mod_name.startswith("ax") or mod_name in ("axes", "subplot")
-                ):
-                    line = self._get_source(node.lineno)
-                    self._add(
-                        _AXES_HINTS[func_name], node.lineno, node.col_offset, line
-                    )
-                return
-
-            # Path(...).mkdir() pattern
-            if func_name == "mkdir" and mod_name not in (
-                "os",
-                "stx",
-                "scitex",
-                "sys",
-            ):
-                # Heuristic: if it's called on something that looks like a Path
-                line = self._get_source(node.lineno)
-                if "Path" in line or "path" in line.lower():
-                    self._add(rules.PA003, node.lineno, node.col_offset, line)
+            # Most attribute names can trigger nothing: one probe and out
+            entry = self._call_index.get(func.attr)
+            if entry is not None:
+                self._check_attribute_call(node, func, entry)
 
         # bare func() pattern -- e.g., print(), open()
         elif isinstance(func, ast.Name):
@@ -321,6 +178,62 @@ class SciTeXChecker(ast.NodeVisitor):
                 line = self._get_source(node.lineno)
                 self._add(rules.PA002, node.lineno, node.col_offset, line)
 
+    def _check_attribute_call(self, node: ast.Call, func, entry) -> None:
+        """Check ``obj.attr(...)`` where *entry* is attr's `CallEntry`."""
+        func_name = func.attr
+        mod_name = None
+
+        if isinstance(func.value, ast.Name):
+            mod_name = func.value.id
+        elif isinstance(func.value, ast.Attribute):
+            # module.sub.func() -- e.g., scipy.stats.ttest_ind()
+            if isinstance(func.value.value, ast.Name):
+                mod_name = func.value.attr  # use "stats" from scipy.stats
+
+        # Check stx.io path patterns before skipping stx.* calls
+        if mod_name in ("stx", "scitex") or (
+            isinstance(func.value, ast.Attribute)
+            and isinstance(func.value.value, ast.Name)
+            and func.value.value.id in ("stx", "scitex")
+        ):
+            self._check_stx_io_path(node)
+            return
+
+        # Resolve alias: if user did `import numpy as np`, resolve np -> numpy
+        resolved = self._imports.get(mod_name, mod_name)
+
+        key = (func_name, mod_name)
+        try:
+            hit = self._call_memo[key]
+        except KeyError:
+            hit = self._call_memo[key] = entry.rule_for(mod_name, resolved)
+
+        if hit is not None:
+            rule, exempt = hit
+            # plt.show() off pyplot, to_csv on os/Path, FM on stx/fr objects
+            if exempt is not None and exempt(mod_name, resolved, func):
+                return
+            line = self._get_source(node.lineno)
+            self._add(rule, node.lineno, node.col_offset, line)
+            return
+
+        # Axes hints: ax.plot(), ax.scatter(), ax.bar()
+        if entry.axes_rule is not None and mod_name not in _AXES_SKIP:
+            # Heuristic: if variable name looks like axes
+            if mod_name and (
+                mod_name.startswith("ax") or mod_name in ("axes", "subplot")
+            ):
+                line = self._get_source(node.lineno)
+                self._add(entry.axes_rule, node.lineno, node.col_offset, line)
+            return
+
+        # Path(...).mkdir() pattern
+        if entry.mkdir and mod_name not in ("os", "stx", "scitex", "sys"):
+            # Heuristic: if it's called on something that looks like a Path
+            line = self._get_source(node.lineno)
+            if "Path" in line or "path" in line.lower():
+                self._add(rules.PA003, node.lineno, node.col_offset, line)
+
     # -- stx.io path checking (delegated to _path_checker) --
 
     def _check_stx_io_path(self, node: ast.Call) -> None:
@@ -328,106 +241,55 @@ class SciTeXChecker(ast.NodeVisitor):
 
         check_stx_io_path(self, node)
 
-    # -- Function/decorator visitors --
+    # -- Function/decorator handlers (delegated to _session_checker) --
 
-    @property
-    def _REQUIRED_INJECTED(self):
-        return set(self.config.required_injected)
+    def _enter_function(self, node: ast.FunctionDef) -> None:
+        from ._session_checker import check_injected_params, is_module, is_session
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        if self._has_session_deco(node):
+        if is_session(node):
             self._has_session_decorator = True
-            self._check_session_return(node)
-            self._check_injected_params(node)
-        elif self._has_module_deco(node):
+            # [node, returns_int, index where S004 belongs in self.issues]
+            self._session_frames.append([node, False, len(self.issues)])
+            check_injected_params(self, node)
+        elif is_module(node):
             self._has_module_decorator = True
         self._func_depth += 1
-        self.generic_visit(node)
-        self._func_depth -= 1
-
-    visit_AsyncFunctionDef = visit_FunctionDef
-
-    def _has_session_deco(self, node: ast.FunctionDef) -> bool:
-        """Check if function has @stx.session or @session decorator."""
-        for deco in node.decorator_list:
-            # @stx.session
-            if isinstance(deco, ast.Attribute):
-                if (
-                    isinstance(deco.value, ast.Name)
-                    and deco.value.id in ("stx", "scitex")
-                    and deco.attr == "session"
-                ):
-                    return True
-            # @session (bare)
-            if isinstance(deco, ast.Name) and deco.id == "session":
-                return True
-        return False
-
-    def _has_module_deco(self, node: ast.FunctionDef) -> bool:
-        """Check if function has @stx.module(...) decorator."""
-        for deco in node.decorator_list:
-            # @stx.module(...) — Call wrapping Attribute
-            if isinstance(deco, ast.Call) and isinstance(deco.func, ast.Attribute):
-                if (
-                    isinstance(deco.func.value, ast.Name)
-                    and deco.func.value.id in ("stx", "scitex")
-                    and deco.func.attr == "module"
-                ):
-                    return True
-            # @stx.module (bare, no parens)
-            if isinstance(deco, ast.Attribute):
-                if (
-                    isinstance(deco.value, ast.Name)
-                    and deco.value.id in ("stx", "scitex")
-                    and deco.attr == "module"
-                ):
-                    return True
-            # @module(...) (bare call)
-            if isinstance(deco, ast.Call) and isinstance(deco.func, ast.Name):
-                if deco.func.id == "module":
-                    return True
-        return False
 
-    def _check_session_return(self, node: ast.FunctionDef) -> None:
-        """Check that session function returns an int."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Return) and child.value is not None:
-                if isinstance(child.value, ast.Constant) and isinstance(
-                    child.value.value, int
-                ):
-                    self._session_func_returns_int = True
-                    return
-        # No int return found
+    def _leave_function(self, node: ast.FunctionDef) -> None:
+        self._func_depth -= 1
+        frames = self._session_frames
+        if frames and frames[-1][0] is node:
+            _, returns_int, insert_at = frames.pop()
+            if not returns_int:
+                self._report_missing_return(node, insert_at)
+
+    def _on_return(self, node: ast.Return) -> None:
+        """Mark enclosing session functions that return an int literal."""
+        if not self._session_frames:
+            return
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, int):
+            self._session_func_returns_int = True
+            for frame in self._session_frames:
+                frame[1] = True
+
+    def _report_missing_return(self, node: ast.FunctionDef, insert_at: int) -> None:
+        """Report S004 for a session function with no int return.
+
+        The issue is placed where it would have been reported on entering
+        the function, ahead of issues found in its body.
+        """
+        n = len(self.issues)
         line = self._get_source(node.lineno)
         self._add(S004, node.lineno, node.col_offset, line)
-
-    def _check_injected_params(self, node: ast.FunctionDef) -> None:
-        """Check that @stx.session function declares all INJECTED parameters."""
-        declared = {arg.arg for arg in node.args.args}
-        missing = sorted(self._REQUIRED_INJECTED - declared)
-        if missing:
-            line = self._get_source(node.lineno)
-            missing_str = ", ".join(missing)
-            dynamic_rule = Rule(
-                id=S006.id,
-                severity=S006.severity,
-                category=S006.category,
-                message=(
-                    f"@stx.session function missing INJECTED parameters: {missing_str}. "
-                    f"All 5 must be declared: CONFIG, COLORS, logger, plt, rngg"
-                ),
-                suggestion=S006.suggestion,
-                requires=S006.requires,
-            )
-            self._add(dynamic_rule, node.lineno, node.col_offset, line)
+        if len(self.issues) > n:
+            self.issues.insert(insert_at, self.issues.pop())
 
     # -- Module-level checks (run after visiting entire tree) --
 
-    def visit_If(self, node: ast.If) -> None:
+    def _on_if(self, node: ast.If) -> None:
         """Detect if __name__ == '__main__' guard."""
         if self._is_main_guard(node):
             self._has_main_guard = True
-        self.generic_visit(node)
 
     def _is_main_guard(self, node: ast.If) -> bool:
         test = node.test
@@ -476,9 +338,12 @@ class SciTeXChecker(ast.NodeVisitor):
         sev = self.config.per_rule_severity.get(rule.id)
         if sev:
             rule = replace(rule, severity=sev)
-        self.issues.append(
-            Issue(rule=rule, line=line, col=col, source_line=source_line)
-        )
+        if source_line:
+            # Every caller passes _get_source(line): refer to the line table
+            issue = Issue(rule, line, col, lines=self.source_lines)
+        else:
+            issue = Issue(rule, line, col)
+        self.issues.append(issue)
 
     def _get_source(self, lineno: int) -> str:
         if 1 <= lineno <= len(self.source_lines):
@@ -492,21 +357,45 @@ class SciTeXChecker(ast.NodeVisitor):
 
 
 def lint_source(source: str, filepath: str = "<stdin>", config=None) -> list:
-    """Lint Python source code and return list of Issues."""
+    """Lint Python source code and return list of Issues.
+
+    Library modules containing none of the identifiers any rule keys on
+    are answered without parsing (see `_prefilter`).
+    """
+    from ._prefilter import can_skip
+    from .config import load_config
+
+    prof = _profile.current
+    if prof is not None:
+        prof.lap()
+    effective = config if config is not None else load_config(start_path=filepath)
+    if can_skip(source, filepath, effective):
+        if prof is not None:
+            prof.lap("prefilter")
+        return []
     try:
         tree = ast.parse(source, filename=filepath)
     except SyntaxError:
         return []
+    if prof is not None:
+        prof.lap("parse")
+    return _lint_tree(tree, source, filepath, config)
+
 
+def _lint_tree(tree: ast.Module, source: str, filepath: str, config=None) -> list:
+    """Run every checker over an already-parsed *tree* of *source*."""
+    prof = _profile.current
     lines = source.splitlines()
     checker = SciTeXChecker(lines, filepath=filepath, config=config)
-    checker.visit(tree)
+    engine = DispatchEngine()
+    checker.register(engine)
+    extra = []
     if config and "FM" in config.enable:
         from ._fm_checker import FMChecker
 
         fm = FMChecker(lines, config)
-        fm.visit(tree)
-        checker.issues.extend(fm.issues)
+        fm.register(engine)
+        extra.append(fm)
 
     # Plugin-contributed checkers (respect opt-in gating)
     from ._plugin_loader import load_plugins
@@ -518,27 +407,83 @@ def lint_source(source: str, filepath: str = "<stdin>", config=None) -> list:
         if cat == "figure" and "FM" not in _enabled:
             continue
         try:
-            extra = checker_cls(lines, config)
-            extra.visit(tree)
-            checker.issues.extend(extra.issues)
+            plugin = checker_cls(lines, config)
         except Exception:
-            pass
+            continue
+        engine.add_checker(plugin)
+        extra.append(plugin)
+
+    if prof is not None:
+        prof.lap("setup")
+    engine.run(tree)
+    for other in extra:
+        if engine.ok(other):
+            checker.issues.extend(other.issues)
 
-    return checker.get_issues()
+    issues = _detach(checker.get_issues())
+    if prof is not None:
+        prof.lap("post-checks")
+        prof.add_issues(issues)
+    return issues
 
 
-def lint_file(filepath: str, config=None) -> list:
+def lint_file(filepath: str, config=None, cache=None) -> list:
     """Lint a Python file or Jupyter notebook; returns list of Issues.
 
-    `.ipynb` files are routed to `_ipynb.lint_ipynb`, which extracts
-    code cells and calls back into `lint_source` per cell.
+    `.ipynb` files are routed to `_ipynb.lint_ipynb`, which lints the
+    code cells as one module and maps issues back to their cells.
+
+    When *cache* (a `_cache.LintCache`) is given, unchanged files are
+    answered from the on-disk cache without parsing.
     """
     path = Path(filepath)
     if not path.exists() or not path.is_file():
         return []
+    if cache is None:
+        return _lint_path(path, config)
+
+    from .config import load_config
+
+    if config is None:
+        config = load_config(start_path=str(path))
+    hit = cache.lookup(path, config)
+    if hit.issues is not None:
+        return hit.issues
+    issues = _lint_path(path, config, data=hit.data)
+    cache.store(hit, issues)
+    return issues
+
+
+def _lint_path(path: Path, config=None, data: bytes = None) -> list:
+    prof = _profile.current
+    if prof is not None:
+        return _lint_path_profiled(prof, path, config, data)
     if path.suffix == ".ipynb":
         from ._ipynb import lint_ipynb
 
         return lint_ipynb(path, config=config)
-    source = path.read_text(encoding="utf-8")
+    if data is None:
+        source = path.read_text(encoding="utf-8")
+    else:
+        source = data.decode("utf-8")
     return lint_source(source, filepath=str(path), config=config)
+
+
+def _lint_path_profiled(prof, path: Path, config=None, data: bytes = None) -> list:
+    import time
+
+    start = time.perf_counter()
+    if path.suffix == ".ipynb":
+        from ._ipynb import lint_ipynb
+
+        issues = lint_ipynb(path, config=config)
+    else:
+        prof.lap()
+        if data is None:
+            source = path.read_text(encoding="utf-8")
+        else:
+            source = data.decode("utf-8")
+        prof.lap("read")
+        issues = lint_source(source, filepath=str(path), config=config)
+    prof.add_file(str(path), time.perf_counter() - start)
+    return issues
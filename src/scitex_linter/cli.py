@@ -1,8 +1,16 @@
 """CLI entry point for scitex-linter.
 
 Usage:
-    scitex-linter check <path> [--json] [--severity] [--category] [--no-color]
-    scitex-linter format <path> [--check] [--diff]
+    scitex-linter check <path> [--format text|json|ndjson] [--json] [--severity]
+                               [--category] [--no-color] [--no-cache] [--jobs N]
+                               [--changed-since REF | --staged]
+                               [--statistics] [--profile-rules [N]] [--daemon]
+    scitex-linter serve [--socket PATH] [--idle-timeout S] [--status | --stop]
+    scitex-linter lsp [--debounce S]
+    scitex-linter cache clear|info
+    scitex-linter watch <path> [--interval S] [--debounce S] [--once]
+    scitex-linter format <path> [--check] [--diff] [--jobs N]
+                                [--changed-since REF | --staged]
     scitex-linter python <script.py> [--strict] [-- script_args...]
     scitex-linter rule [--json] [--category] [--severity]
     scitex-linter list-python-apis [-v|-vv|-vvv] [--json]
@@ -12,127 +20,13 @@ Usage:
 """
 
 import argparse
-import json
 import sys
-from pathlib import Path
-
-from . import __version__
-from ._cmd_completion import register as _register_completion
-from ._cmd_format import register as _register_format
-from ._cmd_rules import register_rule as _register_rule
-from ._cmd_rules import register_rules as _register_rules
-from .checker import lint_file
-from .config import load_config
-from .formatter import format_issue, format_summary, to_json
-from .rules import ALL_RULES, SEVERITY_ORDER
 
-# =========================================================================
-# File collection helper
-# =========================================================================
-
-
-def _collect_files(path: Path, recursive: bool = True, config=None) -> list:
-    """Collect Python files from a path."""
-    if path.is_file():
-        return [path]
-    if path.is_dir():
-        pattern = "**/*.py" if recursive else "*.py"
-        skip = (
-            set(config.exclude_dirs)
-            if config
-            else {"__pycache__", ".git", "node_modules", ".tox", "venv", ".venv"}
-        )
-        return sorted(
-            p for p in path.glob(pattern) if not any(s in p.parts for s in skip)
-        )
-    return []
-
-
-# =========================================================================
-# Subcommand: check
-# =========================================================================
-
-
-def _register_check(subparsers) -> None:
-    p = subparsers.add_parser(
-        "check",
-        help="Check Python files for SciTeX pattern compliance",
-        description="Check Python files for SciTeX pattern compliance.",
-    )
-    p.add_argument("path", help="Python file or directory to check")
-    p.add_argument("--json", action="store_true", dest="as_json", help="Output as JSON")
-    p.add_argument("--no-color", action="store_true", help="Disable colored output")
-    p.add_argument(
-        "--severity",
-        choices=["error", "warning", "info"],
-        default="info",
-        help="Minimum severity to report (default: info)",
-    )
-    p.add_argument(
-        "--category",
-        help="Filter by category (comma-separated: structure,import,io,plot,stats)",
-    )
-    p.set_defaults(func=_cmd_check)
-
-
-def _cmd_check(args) -> int:
-    config = load_config(args.path)
-    use_color = not args.no_color and sys.stdout.isatty()
-    min_sev = SEVERITY_ORDER[args.severity]
-    categories = set(args.category.split(",")) if args.category else None
-
-    target = Path(args.path)
-    if not target.exists():
-        print(f"Error: {args.path} not found", file=sys.stderr)
-        return 2
-
-    files = _collect_files(target, config=config)
-    if not files:
-        print(f"No Python files found in {args.path}", file=sys.stderr)
-        return 0
-
-    all_results = {}
-    for f in files:
-        issues = lint_file(str(f), config=config)
-        issues = [
-            i
-            for i in issues
-            if SEVERITY_ORDER[i.rule.severity] >= min_sev
-            and (categories is None or i.rule.category in categories)
-        ]
-        if issues:
-            all_results[str(f)] = issues
-
-    # JSON output
-    if args.as_json:
-        combined = {fp: to_json(issues, fp) for fp, issues in all_results.items()}
-        print(json.dumps(combined, indent=2))
-        has_errors = any(
-            any(i.rule.severity == "error" for i in issues)
-            for issues in all_results.values()
-        )
-        return 2 if has_errors else (1 if all_results else 0)
-
-    # Terminal output
-    if not all_results:
-        msg = "All files clean"
-        if use_color:
-            print(f"\033[92m{msg}\033[0m")
-        else:
-            print(msg)
-        return 0
-
-    has_errors = False
-    for filepath, issues in all_results.items():
-        for issue in issues:
-            print(format_issue(issue, filepath, color=use_color))
-            if issue.rule.severity == "error":
-                has_errors = True
-        print(format_summary(issues, filepath, color=use_color))
-        print()
-
-    return 2 if has_errors else 1
+from ._commands import add_commands, requested_command
 
+# Command modules, the linter itself and importlib.metadata (for the
+# version) are imported inside the functions that need them, so startup
+# only pays for the command being run (see _commands)
 
 # =========================================================================
 # Subcommand: python (lint then execute)
@@ -228,7 +122,14 @@ def _cmd_mcp_start(args) -> int:
 
 
 def _cmd_mcp_list_tools(args) -> int:
-    _KNOWN_TOOLS = ["linter_check", "linter_check_source", "linter_list_rules"]
+    _KNOWN_TOOLS = [
+        "linter_cache_stats",
+        "linter_check",
+        "linter_check_dir",
+        "linter_check_many",
+        "linter_check_source",
+        "linter_list_rules",
+    ]
     tools = []
 
     try:
@@ -284,6 +185,9 @@ def _cmd_mcp_list_tools(args) -> int:
 def _cmd_mcp_doctor(args) -> int:
     import shutil
 
+    from . import __version__
+    from .rules import ALL_RULES
+
     print(f"scitex-linter {__version__}\n")
     print("Health Check")
     print("=" * 40)
@@ -300,7 +204,7 @@ def _cmd_mcp_doctor(args) -> int:
     try:
         from ._mcp.tools import register_all_tools  # noqa: F401
 
-        checks.append(("MCP tools", True, "3 tools"))
+        checks.append(("MCP tools", True, "6 tools"))
     except Exception as e:
         checks.append(("MCP tools", False, str(e)))
 
@@ -332,6 +236,8 @@ def _cmd_mcp_doctor(args) -> int:
 def _cmd_mcp_installation(args) -> int:
     import shutil
 
+    from . import __version__
+
     print(f"scitex-linter {__version__}\n")
     print("Add this to your Claude Desktop config file:\n")
     print("  macOS: ~/Library/Application Support/Claude/claude_desktop_config.json")
@@ -391,14 +297,29 @@ def _print_help_recursive(parser, subparsers_actions) -> None:
 # =========================================================================
 
 
-def main(argv: list = None) -> int:
+class _VersionAction(argparse.Action):
+    """``--version``, looking the version up only when it is asked for."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(
+            option_strings, dest, default=argparse.SUPPRESS, nargs=0, **kwargs
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from . import __version__
+
+        parser._print_message(f"{parser.prog} {__version__}\n", sys.stdout)
+        parser.exit()
+
+
+def _make_parser():
+    """Top-level parser and its (still empty) subcommand action."""
     parser = argparse.ArgumentParser(
         prog="scitex-linter",
         description="SciTeX Linter \u2014 enforce reproducible research patterns",
     )
-    parser.add_argument(
-        "-V", "--version", action="version", version=f"%(prog)s {__version__}"
-    )
+    parser.add_argument("-V", "--version", action=_VersionAction)
     parser.add_argument(
         "--help-recursive",
         action="store_true",
@@ -406,25 +327,11 @@ def main(argv: list = None) -> int:
     )
 
     subparsers = parser.add_subparsers(dest="command")
+    return parser, subparsers
 
-    from ._cmd_api import register as _register_api
-
-    _register_check(subparsers)
-    _register_format(subparsers)
-    _register_python(subparsers)
-    _register_rule(subparsers)
-    _register_rules(subparsers)
-    _register_api(subparsers)
-    _register_mcp(subparsers)
-    _register_completion(subparsers)
 
-    # Skills subcommand (from scitex-dev)
-    try:
-        from scitex_dev.cli import register_skills_subcommand
-
-        register_skills_subcommand(subparsers, package="scitex-linter")
-    except ImportError:
-        pass
+def main(argv: list = None) -> int:
+    parser, subparsers = _make_parser()
 
     # Split on -- to capture script args for the 'python' subcommand
     raw = argv if argv is not None else sys.argv[1:]
@@ -434,6 +341,11 @@ def main(argv: list = None) -> int:
         script_args = raw[idx + 1 :]
         raw = raw[:idx]
 
+    add_commands(
+        subparsers,
+        requested=requested_command(raw),
+        full="--help-recursive" in raw,
+    )
     args = parser.parse_args(raw)
 
     # Attach script_args for the run subcommand
@@ -57,6 +57,8 @@ class LinterConfig:
         default_factory=lambda: ["src", "tests", "apps", "config", "docs"]
     )
     script_dirs: list[str] = field(default_factory=lambda: ["scripts"])
+    respect_gitignore: bool = True
+    notebook_per_cell: bool = False
     disable: list[str] = field(default_factory=list)
     enable: list[str] = field(default_factory=list)
     per_rule_severity: dict[str, str] = field(default_factory=dict)
@@ -70,12 +72,23 @@ class LinterConfig:
 # =============================================================================
 
 
+# Resolved configs keyed by the (unresolved, absolute) start directory:
+# {dir: (stamps, env_snapshot, config_dict)}
+_cache: dict = {}
+
+
 def load_config(start_path: str | None = None) -> LinterConfig:
     """
     Load configuration from defaults, pyproject.toml, and environment variables.
 
     Priority: env vars > pyproject.toml > defaults
 
+    Results are memoized per start directory, so sibling files resolve
+    without walking up the tree again. A cached entry is reused while the
+    ``SCITEX_LINTER_*`` environment is unchanged and the mtimes of the
+    start directory and of every pyproject.toml seen during the walk are
+    unchanged.
+
     Args:
         start_path: File or directory to start pyproject.toml search from.
             If a file path, searches from its parent directory.
@@ -84,25 +97,75 @@ def load_config(start_path: str | None = None) -> LinterConfig:
     Returns:
         Merged configuration
     """
+    key = _start_dir_key(start_path)
+    env = _env_snapshot()
+    cached = _cache.get(key)
+    if cached is not None:
+        stamps, env_snapshot, config_dict = cached
+        if env_snapshot == env and _stamps_current(stamps):
+            return _build_config(config_dict)
+
     # Start with defaults
     config_dict = {}
 
-    # Load from pyproject.toml — resolve file paths to their directory
-    if start_path:
-        start_dir = Path(start_path).resolve()
-        if start_dir.is_file():
-            start_dir = start_dir.parent
-    else:
-        start_dir = Path.cwd()
-    pyproject_config = _load_pyproject(start_dir)
+    # Load from pyproject.toml
+    start_dir = Path(key).resolve()
+    pyproject_config, stamps = _scan_pyproject(start_dir)
     config_dict.update(pyproject_config)
 
     # Load from environment variables (highest priority)
     env_config = _load_env()
     config_dict.update(env_config)
 
+    _cache[key] = (stamps, env, config_dict)
+
     # Build LinterConfig with merged values
-    return LinterConfig(**config_dict)
+    return _build_config(config_dict)
+
+
+def clear_cache() -> None:
+    """Forget all memoized configurations."""
+    _cache.clear()
+
+
+def _start_dir_key(start_path) -> str:
+    """Map *start_path* to the directory the pyproject search starts from."""
+    if not start_path:
+        return os.getcwd()
+    path = os.path.abspath(start_path)
+    if os.path.isfile(path):
+        if os.path.islink(path):
+            # Search from the link target's directory, as Path.resolve() would
+            path = os.path.realpath(path)
+        return os.path.dirname(path)
+    return path
+
+
+def _env_snapshot() -> tuple:
+    return tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("SCITEX_LINTER_"))
+    )
+
+
+def _mtime_ns(path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stamps_current(stamps: tuple) -> bool:
+    return all(_mtime_ns(path) == mtime for path, mtime in stamps)
+
+
+def _build_config(config_dict: dict) -> LinterConfig:
+    # Fresh containers so callers can't mutate the cached values
+    return LinterConfig(
+        **{
+            k: (v.copy() if isinstance(v, (list, dict)) else v)
+            for k, v in config_dict.items()
+        }
+    )
 
 
 def _load_pyproject(start_dir: Path) -> dict:
@@ -115,13 +178,32 @@ def _load_pyproject(start_dir: Path) -> dict:
     Returns:
         Configuration dict from [tool.scitex-linter], or empty dict if not found
     """
+    return _scan_pyproject(start_dir)[0]
+
+
+def _scan_pyproject(start_dir: Path) -> tuple:
+    """
+    Like `_load_pyproject`, also returning the mtime stamps that validate it.
+
+    Stamps cover every directory the walk visits (creating or removing a
+    pyproject.toml in one changes its mtime) and every pyproject.toml
+    inspected.
+
+    Returns:
+        (config dict, tuple of (path, mtime_ns) pairs)
+    """
+    stamps = [(str(start_dir), _mtime_ns(start_dir))]
     if tomllib is None:
-        return {}
+        return {}, tuple(stamps)
 
     current = start_dir
     while True:
+        if current != start_dir:
+            stamps.append((str(current), _mtime_ns(current)))
         pyproject_path = current / "pyproject.toml"
-        if pyproject_path.exists():
+        mtime = _mtime_ns(pyproject_path)
+        if mtime is not None:
+            stamps.append((str(pyproject_path), mtime))
             try:
                 with open(pyproject_path, "rb") as f:
                     data = tomllib.load(f)
@@ -141,7 +223,7 @@ def _load_pyproject(start_dir: Path) -> dict:
                             else:
                                 # Convert kebab-case to snake_case
                                 config[key.replace("-", "_")] = value
-                        return config
+                        return config, tuple(stamps)
             except Exception:
                 pass
 
@@ -152,7 +234,7 @@ def _load_pyproject(start_dir: Path) -> dict:
             break
         current = parent
 
-    return {}
+    return {}, tuple(stamps)
 
 
 def _load_env() -> dict:
@@ -241,3 +323,34 @@ def matches_library_pattern(filename: str, config: LinterConfig) -> bool:
         if fnmatch.fnmatch(filename, pattern):
             return True
     return False
+
+
+def is_script(filepath: str, config=None) -> bool:
+    """Check if file is a script (not a library module).
+
+    Uses config.library_patterns and config.library_dirs to determine
+    which files are library modules (exempt from script-only rules).
+    """
+    if config is None:
+        config = load_config(start_path=filepath)
+
+    path = Path(filepath)
+    name = path.name
+
+    # Check filename against library patterns (e.g., __*__.py, test_*.py)
+    if matches_library_pattern(name, config):
+        return False
+
+    # Check if file is inside a library directory (e.g., src/)
+    parts = path.parts
+    for lib_dir in config.library_dirs:
+        if lib_dir in parts:
+            return False
+
+    # Check if file is inside a script directory (e.g., scripts/)
+    # These are utility scripts called by shell, not SciTeX session scripts
+    for script_dir in config.script_dirs:
+        if script_dir in parts:
+            return False
+
+    return True
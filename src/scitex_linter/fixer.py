@@ -3,14 +3,26 @@
 Currently handles:
   - S006: Insert missing INJECTED parameters into @stx.session functions.
   - IO001-IO003, IO007: Replace np.save/load, pd.read_csv, savefig with stx.io.
+
+All fixers work from a single parse. Each produces (start, end, text) edits
+against one precomputed line-start offset table, and the edits are applied
+in one linear pass. Overlapping edits (e.g. a fixable call nested inside
+another) are never applied together: the outermost is applied and the rest
+are re-derived from a fresh parse of the result, up to `_MAX_PASSES` times.
 """
 
 __all__ = ["fix_file", "fix_source"]
 
 import ast
+import os
 import re
+import stat
+import tempfile
 from pathlib import Path
 
+from . import _profile
+from ._edits import _apply_edits, _SourceIndex
+
 # The 5 required INJECTED parameters (in canonical order) — default fallback
 REQUIRED_INJECTED = ["CONFIG", "plt", "COLORS", "rngg", "logger"]
 
@@ -130,23 +142,11 @@ def _find_def_line_range(lines: list, func_node: ast.FunctionDef) -> tuple:
     return start, colon_line
 
 
-def _fix_s006_in_source(source: str, filepath: str, config=None) -> str:
-    """Fix S006 violations: add missing INJECTED params to @stx.session functions."""
-    try:
-        tree = ast.parse(source, filename=filepath)
-    except SyntaxError:
-        return source
-
+def _s006_edits(tree: ast.AST, index: _SourceIndex, config=None) -> list:
+    """Edits adding missing INJECTED params to @stx.session functions."""
     required = config.required_injected if config else REQUIRED_INJECTED
 
-    lines = source.splitlines(keepends=True)
-    # Ensure the last line has a newline
-    if lines and not lines[-1].endswith("\n"):
-        lines[-1] += "\n"
-
-    # Collect all session functions that need fixing (process in reverse order
-    # so line indices remain valid after edits)
-    fixes = []
+    edits = []
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             if _has_session_decorator(node):
@@ -154,15 +154,18 @@ def _fix_s006_in_source(source: str, filepath: str, config=None) -> str:
                 missing = _missing_injected(declared, required)
                 needs_normalize = _has_non_canonical_injected(node, required)
                 if missing or needs_normalize:
-                    fixes.append((node, missing))
-
-    # Sort by line number descending so we edit from bottom to top
-    fixes.sort(key=lambda x: x[0].lineno, reverse=True)
-
-    for func_node, missing in fixes:
-        lines = _apply_s006_fix(lines, func_node, missing, required)
-
-    return "".join(lines)
+                    start_idx, colon_idx, text = _s006_signature(
+                        index.lines, node, missing, required
+                    )
+                    edits.append(
+                        (
+                            index.starts[start_idx],
+                            index.starts[colon_idx + 1],
+                            text,
+                            "S006",
+                        )
+                    )
+    return edits
 
 
 def _get_def_indent(line: str) -> str:
@@ -171,13 +174,16 @@ def _get_def_indent(line: str) -> str:
     return match.group(1) if match else ""
 
 
-def _apply_s006_fix(
+def _s006_signature(
     lines: list,
     func_node: ast.FunctionDef,
     missing: list,
     required_injected: list = None,
-) -> list:
-    """Apply S006 fix to a single function in the source lines.
+) -> tuple:
+    """Build the fixed signature of a single function.
+
+    Returns ``(start_line_idx, colon_line_idx, new_text)``; *new_text*
+    replaces the whole lines ``start_line_idx..colon_line_idx``.
 
     Strategy:
     1. Find the def line range (from 'def' to the closing ':')
@@ -246,10 +252,7 @@ def _apply_s006_fix(
     new_lines.extend(new_param_lines)
     new_lines.append(f"{def_indent}):\n")
 
-    # Replace old def lines with new ones
-    lines[start_idx : colon_idx + 1] = new_lines
-
-    return lines
+    return start_idx, colon_idx, "".join(new_lines)
 
 
 def _split_params(params_text: str) -> list:
@@ -306,21 +309,10 @@ def _split_params(params_text: str) -> list:
 # =========================================================================
 
 
-def _source_offset(source: str, lineno: int, col_offset: int) -> int:
-    """Convert (lineno, col_offset) to byte offset in source string."""
-    lines = source.splitlines(keepends=True)
-    offset = sum(len(lines[i]) for i in range(lineno - 1))
-    return offset + col_offset
-
-
-def _fix_io_in_source(source: str, filepath: str = "<stdin>") -> str:
-    """Fix IO violations: savefig->stx.io.save, np.save/load, pd.read_csv."""
-    try:
-        tree = ast.parse(source, filename=filepath)
-    except SyntaxError:
-        return source
-
-    replacements = []  # (start_offset, end_offset, new_text)
+def _io_edits(tree: ast.AST, index: _SourceIndex) -> list:
+    """Edits for IO violations: savefig->stx.io.save, np.save/load, pd.read_csv."""
+    segment = index.segment
+    edits = []
 
     for node in ast.walk(tree):
         if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
@@ -333,46 +325,72 @@ def _fix_io_in_source(source: str, filepath: str = "<stdin>") -> str:
         if obj in ("stx", "scitex"):
             continue
 
-        seg = ast.get_source_segment(source, node)
-        if seg is None:
-            continue
-
         new = None
         if fname == "savefig" and node.args:
-            arg0 = ast.get_source_segment(source, node.args[0])
+            arg0 = segment(node.args[0])
             if arg0:
                 new = f"stx.io.save({obj}, {arg0})"
         elif fname == "save" and obj in ("np", "numpy") and len(node.args) >= 2:
-            arg0 = ast.get_source_segment(source, node.args[0])
-            arg1 = ast.get_source_segment(source, node.args[1])
+            arg0 = segment(node.args[0])
+            arg1 = segment(node.args[1])
             if arg0 and arg1:
                 new = f"stx.io.save({arg1}, {arg0})"
         elif fname == "load" and obj in ("np", "numpy") and node.args:
-            arg0 = ast.get_source_segment(source, node.args[0])
+            arg0 = segment(node.args[0])
             if arg0:
                 new = f"stx.io.load({arg0})"
         elif fname == "read_csv" and obj in ("pd", "pandas") and node.args:
-            arg0 = ast.get_source_segment(source, node.args[0])
+            arg0 = segment(node.args[0])
             if arg0:
                 new = f"stx.io.load({arg0})"
 
         if new:
-            start = _source_offset(source, node.lineno, node.col_offset)
-            replacements.append((start, start + len(seg), new))
+            start, end = index.span(node)
+            edits.append((start, end, new, "IO"))
+
+    return edits
+
+
+# =========================================================================
+# Fix passes
+# =========================================================================
+
 
-    if not replacements:
-        return source
+# Upper bound on re-parse passes when edits overlap
+_MAX_PASSES = 4
 
-    # Apply in reverse offset order to preserve positions
-    replacements.sort(key=lambda x: x[0], reverse=True)
-    for start, end, new in replacements:
-        source = source[:start] + new + source[end:]
 
-    # Ensure `import scitex as stx` is present if fixes were applied
-    if "import scitex" not in source:
+def _fix_once(source: str, filepath: str, config=None) -> tuple:
+    """Run every fixer against one parse; return ``(source, n_skipped)``."""
+    prof = _profile.current
+    if prof is not None:
+        prof.lap()
+    try:
+        tree = ast.parse(source, filename=filepath)
+    except SyntaxError:
+        return source, 0
+    if prof is not None:
+        prof.lap("parse")
+
+    # Ensure the last line has a newline
+    if source and not source.endswith("\n"):
+        source += "\n"
+
+    index = _SourceIndex(source)
+    edits = _s006_edits(tree, index, config) + _io_edits(tree, index)
+    if prof is not None:
+        prof.lap("collect-edits")
+    if not edits:
+        return source, 0
+    source, applied, skipped = _apply_edits(source, edits)
+
+    # Ensure `import scitex as stx` is present if IO fixes were applied
+    if "IO" in applied and "import scitex" not in source:
         source = "import scitex as stx\n" + source
+    if prof is not None:
+        prof.lap("apply-edits")
 
-    return source
+    return source, skipped
 
 
 # =========================================================================
@@ -382,8 +400,10 @@ def _fix_io_in_source(source: str, filepath: str = "<stdin>") -> str:
 
 def fix_source(source: str, filepath: str = "<stdin>", config=None) -> str:
     """Auto-fix SciTeX issues in source code. Returns fixed source."""
-    source = _fix_s006_in_source(source, filepath, config=config)
-    source = _fix_io_in_source(source, filepath)
+    for _ in range(_MAX_PASSES):
+        source, skipped = _fix_once(source, filepath, config=config)
+        if not skipped:
+            break
     return source
 
 
@@ -407,6 +427,32 @@ def fix_file(filepath: str, write: bool = True, config=None) -> tuple:
     changed = fixed != original
 
     if write and changed:
-        path.write_text(fixed, encoding="utf-8")
+        _write_atomic(path, fixed)
 
     return (fixed, changed)
+
+
+def _write_atomic(path, text: str) -> None:
+    """Replace *path* with *text* atomically, keeping its permission bits.
+
+    The content goes to a temporary file in the same directory, which is
+    then renamed over the target, so readers never see a partial file. A
+    symlinked *path* has its target replaced, not the link.
+    """
+    target = os.path.realpath(path)
+    directory, name = os.path.split(target)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(target).st_mode))
+        except OSError:
+            pass
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -1,6 +1,15 @@
 """Output formatting for terminal and JSON."""
 
-__all__ = ["format_issue", "format_summary", "to_json"]
+__all__ = [
+    "format_issue",
+    "format_summary",
+    "location",
+    "to_json",
+    "JSONWriter",
+    "NDJSONWriter",
+]
+
+import json
 
 from .checker import Issue
 
@@ -17,6 +26,13 @@ _SEV_COLOR = {"error": _RED, "warning": _YELLOW, "info": _BLUE}
 _SEV_ICON = {"error": "E", "warning": "W", "info": "I"}
 
 
+def location(issue: Issue, filepath: str) -> str:
+    """Return ``path:line:col``, or ``path::cell-N:line:col`` in notebooks."""
+    if issue.cell is not None:
+        filepath = f"{filepath}::cell-{issue.cell}"
+    return f"{filepath}:{issue.line}:{issue.col}"
+
+
 def format_issue(issue: Issue, filepath: str, color: bool = True) -> str:
     if not color:
         return _format_plain(issue, filepath)
@@ -25,7 +41,7 @@ def format_issue(issue: Issue, filepath: str, color: bool = True) -> str:
     c = _SEV_COLOR.get(sev, "")
     icon = _SEV_ICON.get(sev, "?")
     lines = [
-        f"  {c}{icon}{_RESET} {_BOLD}{filepath}:{issue.line}:{issue.col}{_RESET}"
+        f"  {c}{icon}{_RESET} {_BOLD}{location(issue, filepath)}{_RESET}"
         f"  {c}{issue.rule.id}{_RESET}",
     ]
     if issue.source_line:
@@ -38,7 +54,7 @@ def format_issue(issue: Issue, filepath: str, color: bool = True) -> str:
 def _format_plain(issue: Issue, filepath: str) -> str:
     icon = _SEV_ICON.get(issue.rule.severity, "?")
     lines = [
-        f"  {icon} {filepath}:{issue.line}:{issue.col}  {issue.rule.id}",
+        f"  {icon} {location(issue, filepath)}  {issue.rule.id}",
     ]
     if issue.source_line:
         lines.append(f"    {issue.source_line}")
@@ -75,22 +91,64 @@ def format_summary(issues: list, filepath: str, color: bool = True) -> str:
 def to_json(issues: list, filepath: str) -> dict:
     return {
         "file": filepath,
-        "issues": [
-            {
-                "rule_id": i.rule.id,
-                "severity": i.rule.severity,
-                "category": i.rule.category,
-                "line": i.line,
-                "col": i.col,
-                "message": i.rule.message,
-                "suggestion": i.rule.suggestion,
-                "source_line": i.source_line,
-            }
-            for i in issues
-        ],
+        "issues": [_issue_json(i) for i in issues],
         "summary": {
             "errors": sum(1 for i in issues if i.rule.severity == "error"),
             "warnings": sum(1 for i in issues if i.rule.severity == "warning"),
             "infos": sum(1 for i in issues if i.rule.severity == "info"),
         },
     }
+
+
+def _issue_json(i: Issue) -> dict:
+    out = {
+        "rule_id": i.rule.id,
+        "severity": i.rule.severity,
+        "category": i.rule.category,
+        "line": i.line,
+        "col": i.col,
+        "message": i.rule.message,
+        "suggestion": i.rule.suggestion,
+        "source_line": i.source_line,
+    }
+    if i.cell is not None:
+        out["cell"] = i.cell
+    return out
+
+
+class JSONWriter:
+    """Incrementally write the combined ``{filepath: to_json(...)}`` document.
+
+    The output is byte-identical to ``json.dumps(combined, indent=2)``
+    followed by a newline, but each file is written as soon as it is added
+    instead of holding every result in memory.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def add(self, filepath: str, issues: list) -> None:
+        body = json.dumps(to_json(issues, filepath), indent=2)
+        sep = ",\n" if self.count else "{\n"
+        self.stream.write(f"{sep}  {json.dumps(filepath)}: ")
+        self.stream.write(body.replace("\n", "\n  "))
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.write("\n}\n" if self.count else "{}\n")
+        self.stream.flush()
+
+
+class NDJSONWriter:
+    """Write one ``to_json`` object per line, flushed as each file completes."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def add(self, filepath: str, issues: list) -> None:
+        self.stream.write(json.dumps(to_json(issues, filepath)) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.flush()
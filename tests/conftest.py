@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from scitex_linter import _plugin_loader
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the on-disk lint cache out of the user's home directory."""
+    cache = tmp_path_factory.mktemp("scitex-linter-cache")
+    monkeypatch.setenv("SCITEX_LINTER_CACHE_DIR", str(cache))
+    # ``check --no-cache`` switches the plugin manifest cache off process-wide
+    monkeypatch.setattr(_plugin_loader, "_use_disk", True)
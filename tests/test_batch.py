@@ -0,0 +1,111 @@
+"""Tests for multi-file linting behind the batch MCP tools."""
+
+import pytest
+
+from scitex_linter._batch import check_many, collect
+
+DIRTY = 'import numpy as np\nnp.save("a.npy", 1)\n'
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for name in ("a", "b", "c", "d", "e"):
+        (tmp_path / "src" / f"{name}.py").write_text(DIRTY)
+    (tmp_path / "src" / "clean.py").write_text("x = 1\n")
+    (tmp_path / "src" / "notes.txt").write_text("not python\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "lib.py").write_text(DIRTY)
+    return tmp_path
+
+
+def _paths(files):
+    return [path for path, _ in files]
+
+
+class TestCollect:
+    def test_dedup_and_sorted(self, tree):
+        files, missing = collect(["src", "src/b.py", "src/*.py", "nope.py"])
+        assert _paths(files) == sorted(_paths(files))
+        assert len(files) == 6
+        assert missing == ["nope.py"]
+
+    def test_glob_filters(self, tree):
+        files, _ = collect(["**/*"])
+        paths = _paths(files)
+        assert "src/notes.txt" not in paths
+        assert not any(".venv" in p for p in paths)
+        assert "src/a.py" in paths
+
+    @pytest.mark.parametrize("git", [False, True])
+    def test_glob_honours_gitignore_like_walk(self, tree, git):
+        if git:
+            (tree / ".git" / "info").mkdir(parents=True)
+            (tree / ".git" / "info" / "exclude").write_text("src/e.py\n")
+        (tree / ".gitignore").write_text("build/\n")
+        (tree / "src" / ".gitignore").write_text("d.py\n")
+        (tree / "build" / "gen").mkdir(parents=True)
+        (tree / "build" / "gen" / "out.py").write_text(DIRTY)
+        globbed = _paths(collect(["**/*.py"])[0])
+        walked = _paths(collect(["."])[0])
+        assert globbed == [p[2:] if p.startswith("./") else p for p in walked]
+        assert "src/d.py" not in globbed
+        assert not any(p.startswith("build") for p in globbed)
+        assert ("src/e.py" in globbed) is not git
+
+
+class TestCheckMany:
+    def test_pages_cover_everything_once(self, tree):
+        seen, cursor, pages = [], None, 0
+        while True:
+            out = check_many(["src"], page_size=2, cursor=cursor, jobs=1)
+            pages += 1
+            assert out["total_files"] == 6
+            assert out["files_checked"] <= 2
+            seen += [r["file"] for r in out["results"]]
+            cursor = out["next_cursor"]
+            if cursor is None:
+                break
+        assert pages == 3
+        assert sorted(seen) == [f"src/{n}.py" for n in "abcde"]
+
+    def test_stale_cursor_rejected(self, tree):
+        out = check_many(["src"], page_size=2, jobs=1)
+        (tree / "src" / "f.py").write_text(DIRTY)
+        with pytest.raises(ValueError, match="stale cursor"):
+            check_many(["src"], page_size=2, cursor=out["next_cursor"], jobs=1)
+        with pytest.raises(ValueError):
+            check_many(["src"], cursor="garbage", jobs=1)
+
+    def test_summary_only(self, tree):
+        out = check_many(["src"], summary_only=True, page_size=1, jobs=1)
+        assert "results" not in out
+        assert out["files_checked"] == 6
+        assert out["files_with_issues"] == 5
+        assert out["rules"]["STX-IO001"] == 5
+        assert out["summary"]["warnings"] >= 5
+
+    def test_severity_filter(self, tree):
+        out = check_many(["src"], summary_only=True, severity="error", jobs=1)
+        assert "STX-IO001" not in out["rules"]
+
+    def test_parallel_matches_serial(self, tree):
+        serial = check_many(["src/*.py"], jobs=1, use_cache=False)
+        parallel = check_many(["src/*.py"], jobs=2, use_cache=False)
+        assert serial == parallel
+
+    @pytest.mark.parametrize("kwargs, expected", [({}, 1), ({"jobs": 2}, 2)])
+    def test_in_process_unless_jobs_given(self, tree, monkeypatch, kwargs, expected):
+        from scitex_linter import _parallel
+
+        seen = []
+        lint_paths = _parallel.lint_paths
+
+        def spy(paths, config, jobs=1, cache=None):
+            seen.append(jobs)
+            return lint_paths(paths, config, jobs=1, cache=cache)
+
+        monkeypatch.setattr(_parallel, "lint_paths", spy)
+        check_many(["src"], use_cache=False, **kwargs)
+        assert seen == [expected]
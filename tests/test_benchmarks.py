@@ -0,0 +1,55 @@
+"""Smoke tests for the benchmarks package (corpus generator + harness)."""
+
+import json
+
+from benchmarks import harness
+from benchmarks.corpus import KINDS, generate
+
+
+def _snapshot(root):
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+class TestCorpus:
+    def test_deterministic(self, tmp_path):
+        generate(tmp_path / "a", n_files=8, lines=40, notebook_output_kb=1)
+        generate(tmp_path / "b", n_files=8, lines=40, notebook_output_kb=1)
+        assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+
+    def test_all_kinds_valid(self, tmp_path):
+        import ast
+
+        written = generate(tmp_path, n_files=8, lines=40, notebook_output_kb=1)
+        assert set(written) == set(KINDS)
+        for kind, paths in written.items():
+            for p in paths:
+                text = p.read_text()
+                if kind == "notebook":
+                    assert json.loads(text)["cells"]
+                else:
+                    ast.parse(text)
+
+
+class TestHarness:
+    def test_run_task(self, tmp_path):
+        generate(tmp_path, n_files=8, lines=40, notebook_output_kb=1)
+        for task in harness.TASKS:
+            result = harness.run_task(task, tmp_path, repeat=1)
+            assert result["files"] > 0 and result["lines"] > 0
+            assert result["files_per_sec"] > 0
+        assert "parse" in harness.run_task("check", tmp_path, repeat=1)["stages"]
+        stages = harness.run_task("fix", tmp_path, repeat=1)["stages"]
+        assert {"read", "parse", "collect-edits"} <= set(stages)
+
+    def test_main_in_process(self, tmp_path, capsys):
+        out = tmp_path / "bench.json"
+        argv = ["--files", "4", "--lines", "30", "--notebook-output-kb", "1"]
+        argv += ["--repeat", "1", "--in-process", "--output", str(out)]
+        assert harness.main(argv) == 0
+        report = json.loads(out.read_text())
+        assert set(report["results"]) == set(harness.TASKS)
+        assert report["meta"]["files"] == 4
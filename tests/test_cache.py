@@ -0,0 +1,144 @@
+"""Tests for the persistent lint result cache."""
+
+import os
+
+import pytest
+
+from scitex_linter import checker
+from scitex_linter._cache import LintCache
+from scitex_linter.checker import lint_file
+from scitex_linter.cli import main
+from scitex_linter.config import LinterConfig
+
+BAD = "import argparse\n\nif __name__ == '__main__':\n    pass\n"
+
+
+def _ids(issues):
+    return [i.rule.id for i in issues]
+
+
+def _age(path, seconds=10):
+    """Backdate a file so its cache entry is not considered racily clean."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+@pytest.fixture
+def no_lint(monkeypatch):
+    def _boom(*args, **kwargs):
+        raise AssertionError("lint_source called on a cached file")
+
+    monkeypatch.setattr(checker, "lint_source", _boom)
+
+
+class TestLintCache:
+    def test_hit_skips_linting(self, tmp_path, monkeypatch):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        _age(f)
+        cache = LintCache(tmp_path / "cache")
+        config = LinterConfig()
+        first = lint_file(str(f), config=config, cache=cache)
+        assert "STX-S003" in _ids(first)
+
+        monkeypatch.setattr(
+            checker, "lint_source", lambda *a, **k: pytest.fail("re-linted")
+        )
+        second = lint_file(str(f), config=config, cache=cache)
+        assert _ids(second) == _ids(first)
+        assert second[0].source_line == first[0].source_line
+
+    def test_touched_but_unchanged_uses_hash(self, tmp_path, no_lint):
+        f = tmp_path / "script.py"
+        f.write_text("x = 1\n")
+        cache = LintCache(tmp_path / "cache")
+        config = LinterConfig()
+        cache.store(cache.lookup(f, config), [])
+        os.utime(f)  # new mtime, same bytes
+        assert lint_file(str(f), config=config, cache=cache) == []
+
+    def test_content_change_invalidates(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text("x = 1\n")
+        cache = LintCache(tmp_path / "cache")
+        config = LinterConfig()
+        lint_file(str(f), config=config, cache=cache)
+        f.write_text(BAD)
+        assert "STX-S003" in _ids(lint_file(str(f), config=config, cache=cache))
+
+    def test_config_change_invalidates(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        _age(f)
+        cache = LintCache(tmp_path / "cache")
+        lint_file(str(f), config=LinterConfig(), cache=cache)
+        disabled = LinterConfig(disable=["STX-S003"])
+        assert "STX-S003" not in _ids(lint_file(str(f), config=disabled, cache=cache))
+
+    def test_modified_rule_round_trips(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        _age(f)
+        cache = LintCache(tmp_path / "cache")
+        config = LinterConfig(per_rule_severity={"STX-S003": "info"})
+        lint_file(str(f), config=config, cache=cache)
+        cached = cache.lookup(f, config).issues
+        s003 = [i for i in cached if i.rule.id == "STX-S003"]
+        assert s003 and s003[0].rule.severity == "info"
+
+    def test_memory_layer(self, tmp_path, no_lint):
+        cache = LintCache(tmp_path / "cache", memory_entries=2)
+        config = LinterConfig()
+        files = []
+        for name in ("a.py", "b.py", "c.py"):
+            f = tmp_path / name
+            f.write_text("x = 1\n")
+            _age(f)
+            cache.store(cache.lookup(f, config), [])
+            files.append(f)
+        for entry in list(cache._iter_entries()):
+            os.remove(entry.path)  # only the in-memory records remain
+        assert cache.lookup(files[2], config).issues == []
+        assert cache.lookup(files[1], config).issues == []
+        assert cache.lookup(files[0], config).issues is None  # evicted
+
+    def test_prune_evicts_oldest(self, tmp_path):
+        cache = LintCache(tmp_path / "cache", max_bytes=1)
+        config = LinterConfig()
+        for n in range(3):
+            f = tmp_path / f"s{n}.py"
+            f.write_text(BAD)
+            lint_file(str(f), config=config, cache=cache)
+        assert cache.stats()["entries"] == 3
+        assert cache.prune() == 3
+        assert cache.stats()["entries"] == 0
+
+    def test_clear(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        cache = LintCache(tmp_path / "cache")
+        lint_file(str(f), config=LinterConfig(), cache=cache)
+        assert cache.clear() == 1
+        assert cache.stats()["entries"] == 0
+
+
+class TestCacheCLI:
+    def test_check_populates_cache(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        assert main(["check", str(f)]) == 2
+        assert LintCache().stats()["entries"] == 1
+
+    def test_no_cache_flag(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        assert main(["check", str(f), "--no-cache"]) == 2
+        assert LintCache().stats()["entries"] == 0
+
+    def test_cache_clear_subcommand(self, tmp_path, capsys):
+        f = tmp_path / "script.py"
+        f.write_text(BAD)
+        main(["check", str(f)])
+        assert main(["cache", "clear"]) == 0
+        assert "Removed 1 cache entry" in capsys.readouterr().out
+        assert LintCache().stats()["entries"] == 0
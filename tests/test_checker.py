@@ -613,3 +613,90 @@ import matplotlib.pyplot as plt  # stx-allow: STX-I001, STX-S003
 import matplotlib.pyplot as plt
 """
         assert "STX-I001" in _rule_ids(src, filepath="lib.py")
+
+
+# =========================================================================
+# Issue representation
+# =========================================================================
+
+
+class TestIssue:
+    SRC = 'import numpy as np\nnp.save("a.npy", 1)   \n'
+
+    def _io001(self):
+        issues = lint_source(self.SRC, filepath="script.py")
+        return next(i for i in issues if i.rule.id == "STX-IO001")
+
+    def test_dataclass_compatible(self):
+        from scitex_linter import rules
+        from scitex_linter.checker import Issue
+
+        a = Issue(rules.IO001, 2, 0, "x")
+        assert a == Issue(rule=rules.IO001, line=2, col=0, source_line="x")
+        assert a != Issue(rules.IO001, 2, 0, "x", cell=1)
+        assert repr(a) == (
+            f"Issue(rule={rules.IO001!r}, line=2, col=0, source_line='x', cell=None)"
+        )
+        assert not hasattr(a, "__dict__")
+
+    def test_lazy_source_line(self):
+        from scitex_linter import rules
+        from scitex_linter.checker import Issue
+
+        lines = ["x = 1", "y = 2   "]
+        issue = Issue(rules.IO001, 2, 0, lines=lines)
+        assert issue._source is lines
+        assert issue.source_line == "y = 2"
+
+    def test_returned_issues_detached_from_line_table(self):
+        issue = self._io001()
+        assert issue.source_line == 'np.save("a.npy", 1)'
+        assert issue._source.__class__ is str
+        assert issue._rule == "STX-IO001"
+
+    def test_asdict_and_replace(self):
+        import dataclasses
+
+        from scitex_linter.checker import Issue
+
+        issue = self._io001()
+        assert not dataclasses.is_dataclass(issue)
+        assert Issue._fields == ("rule", "line", "col", "source_line", "cell")
+        moved = issue._replace(line=3)
+        assert (moved.line, moved.source_line) == (3, issue.source_line)
+        data = issue._asdict()
+        assert list(data) == list(Issue._fields)
+        assert data["rule"]["id"] == "STX-IO001"
+        assert data["source_line"] == 'np.save("a.npy", 1)'
+
+    def test_setter_does_not_load_plugins(self, monkeypatch):
+        from scitex_linter import _plugin_loader
+        from scitex_linter.checker import Issue
+        from scitex_linter.rules import Rule
+
+        def fail():
+            raise AssertionError("plugins loaded")
+
+        monkeypatch.setattr(_plugin_loader, "load_plugins", fail)
+        plugin_rule = Rule("X-001", "warning", "x", "msg", "fix")
+        assert Issue(plugin_rule, 1, 0).rule is plugin_rule
+
+    def test_overridden_rule_kept(self):
+        from dataclasses import replace
+
+        from scitex_linter import rules
+        from scitex_linter.checker import Issue
+
+        custom = replace(rules.IO001, severity="error")
+        assert Issue(custom, 1, 0).rule is custom
+
+    def test_pickle_and_replace_detach(self):
+        import pickle
+
+        issue = self._io001()
+        clone = pickle.loads(pickle.dumps(issue))
+        assert clone == issue
+        assert clone._source.__class__ is str
+        moved = issue._replace(line=7, cell=3)
+        assert (moved.line, moved.cell) == (7, 3)
+        assert moved.source_line == issue.source_line
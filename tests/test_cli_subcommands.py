@@ -1,7 +1,13 @@
 """Tests for CLI subcommand structure."""
 
+import json
 import os
+import subprocess
+import sys
 import tempfile
+from pathlib import Path
+
+import pytest
 
 from scitex_linter.cli import main
 
@@ -94,6 +100,39 @@ class TestCheckSubcommand:
         code = main(["check", "/nonexistent/path.py"])
         assert code == 2
 
+    def test_check_format_json_equals_json_flag(self, tmp_path, capsys):
+        (tmp_path / "a.py").write_text("import argparse\n")
+        (tmp_path / "b.py").write_text("import numpy as np\nnp.save('x.npy', 1)\n")
+        main(["check", str(tmp_path), "--json", "--jobs", "1"])
+        legacy = capsys.readouterr().out
+        main(["check", str(tmp_path), "--format", "json", "--jobs", "1"])
+        assert capsys.readouterr().out == legacy
+        assert set(json.loads(legacy)) == {
+            str(tmp_path / "a.py"),
+            str(tmp_path / "b.py"),
+        }
+
+    def test_check_ndjson(self, tmp_path, capsys):
+        (tmp_path / "a.py").write_text("import argparse\n")
+        (tmp_path / "b.py").write_text("import numpy as np\nnp.save('x.npy', 1)\n")
+        code = main(["check", str(tmp_path), "--format", "ndjson", "--jobs", "1"])
+        lines = capsys.readouterr().out.splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [r["file"] for r in records] == [
+            str(tmp_path / "a.py"),
+            str(tmp_path / "b.py"),
+        ]
+        assert code == 2
+
+    def test_check_json_clean(self, tmp_path, capsys):
+        (tmp_path / "lib.py").write_text("x = 1\n")
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.scitex-linter]\nlibrary-patterns = ["lib.py"]\n'
+        )
+        code = main(["check", str(tmp_path), "--json"])
+        assert capsys.readouterr().out == "{}\n"
+        assert code == 0
+
 
 class TestFormatSubcommand:
     def test_format_fixes_file(self):
@@ -256,3 +295,102 @@ class TestMCPSubcommand:
     def test_mcp_no_subcommand(self):
         code = main(["mcp"])
         assert code == 0
+
+
+class TestLazyCommands:
+    def test_top_level_help_matches_full_registration(self, capsys):
+        from scitex_linter import _commands, cli
+
+        with pytest.raises(SystemExit):
+            main(["--help"])
+        lazy = capsys.readouterr().out
+        parser, subparsers = cli._make_parser()
+        _commands.add_commands(subparsers, full=True)
+        assert lazy == parser.format_help()
+
+    def test_alias_runs_full_command(self, capsys):
+        assert main(["api", "--json"]) == 0
+        assert "lint_file" in capsys.readouterr().out
+
+    def test_rule_catalog_in_sync(self, capsys):
+        from dataclasses import astuple
+
+        from scitex_linter._rule_catalog import RULES
+        from scitex_linter.rules import ALL_RULES
+
+        assert RULES == tuple(astuple(r) for r in ALL_RULES.values())
+        main(["rule", "--json"])
+        ids = [r["id"] for r in json.loads(capsys.readouterr().out)]
+        assert ids == list(ALL_RULES)
+
+
+# Modules the light commands must not import (the linter proper)
+_HEAVY = {
+    "scitex_linter.checker",
+    "scitex_linter.config",
+    "scitex_linter.fixer",
+    "scitex_linter.formatter",
+    "scitex_linter.rules",
+    "scitex_linter._cmd_api",
+    "scitex_linter._cmd_format",
+    "scitex_dev.cli",
+}
+# Import time allowed for everything imported from the first scitex_linter
+# module on, in milliseconds; SCITEX_LINTER_IMPORT_BUDGET_MS overrides it
+_BUDGET_MS = float(os.environ.get("SCITEX_LINTER_IMPORT_BUDGET_MS", 100))
+
+
+def _import_profile(*args):
+    """``(modules imported, ms)`` for running the CLI with *args*.
+
+    Parsed from ``-X importtime``; the time is the best of three runs and
+    covers the top-level imports from the first scitex_linter one on.
+    """
+    import scitex_linter
+
+    src = str(Path(scitex_linter.__file__).parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    code = "import sys; from scitex_linter.cli import main; main(sys.argv[1:])"
+    best = None
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code, *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        modules, total, started = set(), 0, False
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue  # header
+            modules.add(name.strip())
+            started = started or name.startswith(" scitex_linter")
+            if started and not name.startswith("  "):
+                total += int(cumulative)
+        best = total if best is None else min(best, total)
+    return modules, best / 1000
+
+
+class TestImportBudget:
+    @pytest.mark.parametrize(
+        "args", [["completion", "bash"], ["rule", "--json"], ["--help"]]
+    )
+    def test_light_commands(self, args):
+        modules, ms = _import_profile(*args)
+        assert "scitex_linter.cli" in modules
+        assert not modules & (_HEAVY | {"importlib.metadata"})
+        assert ms < _BUDGET_MS, f"{' '.join(args)}: {ms:.1f} ms of imports"
+
+    def test_version_imports_only_metadata(self):
+        modules, _ = _import_profile("--version")
+        assert "importlib.metadata" in modules
+        assert not modules & _HEAVY
+
+    def test_check_still_imports_linter(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        modules, _ = _import_profile("check", str(tmp_path), "--no-cache")
+        assert "scitex_linter.checker" in modules
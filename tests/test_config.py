@@ -1,7 +1,9 @@
 """Tests for scitex_linter.config — configuration system."""
 
+import os
 import textwrap
 
+from scitex_linter import config as config_mod
 from scitex_linter.config import LinterConfig, load_config, matches_library_pattern
 
 # =========================================================================
@@ -169,3 +171,67 @@ class TestLoadConfigFromEnv:
         monkeypatch.setenv("SCITEX_LINTER_EXCLUDE_DIRS", "build,dist")
         config = load_config()
         assert config.exclude_dirs == ["build", "dist"]
+
+
+# =========================================================================
+# TestLoadConfigCache
+# =========================================================================
+
+
+class TestLoadConfigCache:
+    """Test memoized config resolution and its invalidation."""
+
+    def _write(self, path, severity):
+        path.write_text(f'[tool.scitex-linter]\nseverity = "{severity}"\n')
+
+    def _bump_mtime(self, path):
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_siblings_resolve_without_rescan(self, tmp_path, monkeypatch):
+        self._write(tmp_path / "pyproject.toml", "warning")
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "b.py").write_text("")
+        calls = []
+        real_scan = config_mod._scan_pyproject
+        monkeypatch.setattr(
+            config_mod,
+            "_scan_pyproject",
+            lambda d: calls.append(d) or real_scan(d),
+        )
+        assert load_config(tmp_path / "a.py").severity == "warning"
+        assert load_config(tmp_path / "b.py").severity == "warning"
+        assert len(calls) == 1
+
+    def test_pyproject_mtime_invalidates(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        self._write(pyproject, "warning")
+        assert load_config(tmp_path).severity == "warning"
+        self._write(pyproject, "error")
+        self._bump_mtime(pyproject)
+        assert load_config(tmp_path).severity == "error"
+
+    def test_new_pyproject_in_start_dir_invalidates(self, tmp_path):
+        assert load_config(tmp_path).severity == "info"
+        self._write(tmp_path / "pyproject.toml", "warning")
+        self._bump_mtime(tmp_path)
+        assert load_config(tmp_path).severity == "warning"
+
+    def test_new_pyproject_in_ancestor_invalidates(self, tmp_path):
+        self._write(tmp_path / "pyproject.toml", "warning")
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        assert load_config(deep).severity == "warning"
+        self._write(tmp_path / "a" / "pyproject.toml", "error")
+        self._bump_mtime(tmp_path / "a")
+        assert load_config(deep).severity == "error"
+
+    def test_env_change_invalidates(self, tmp_path, monkeypatch):
+        assert load_config(tmp_path).disable == []
+        monkeypatch.setenv("SCITEX_LINTER_DISABLE", "STX-P004")
+        assert load_config(tmp_path).disable == ["STX-P004"]
+
+    def test_returned_configs_are_independent(self, tmp_path):
+        first = load_config(tmp_path)
+        first.disable.append("STX-S001")
+        assert load_config(tmp_path).disable == []
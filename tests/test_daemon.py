@@ -0,0 +1,218 @@
+"""Tests for the persistent lint daemon (serve / check --daemon)."""
+
+import socket
+import threading
+
+import pytest
+
+from scitex_linter import _daemon
+from scitex_linter._issue import _unpack_issues
+from scitex_linter.cli import main
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="unix sockets unavailable"
+)
+
+DIRTY = 'import numpy as np\nnp.save("a.npy", 1)\n'
+
+
+def _start(path, **kwargs):
+    server = _daemon.Server(path, **kwargs)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture
+def sock(tmp_path, monkeypatch):
+    path = tmp_path / "d.sock"
+    monkeypatch.setenv("SCITEX_LINTER_SOCKET", str(path))
+    monkeypatch.setattr(
+        _daemon, "spawn", lambda *a, **k: pytest.fail("spawned a subprocess")
+    )
+    return path
+
+
+@pytest.fixture
+def server(sock):
+    server, thread = _start(sock)
+    yield server
+    _daemon.shutdown(sock)
+    thread.join(5)
+
+
+class TestProtocol:
+    def test_ping(self, server, sock):
+        info = _daemon.ping(sock)
+        assert info["build"] == _daemon.build_id()
+
+    def test_check_source(self, server, sock):
+        req = {"op": "check_source", "source": DIRTY, "filepath": "x.py"}
+        (reply,) = _daemon.request(req, sock)
+        ids = [i.rule.id for i in _unpack_issues(reply["issues"])]
+        assert "STX-IO001" in ids
+
+    def test_unknown_op(self, server, sock):
+        assert "error" in next(_daemon.request({"op": "nope"}, sock))
+
+    def test_stalled_client_does_not_block_others(self, sock, monkeypatch):
+        monkeypatch.setattr(_daemon, "_CONN_TIMEOUT", 0.2)
+        server, thread = _start(sock)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+                stalled.connect(str(sock))  # never sends its request line
+                assert _daemon.ping(sock) is not None
+        finally:
+            _daemon.shutdown(sock)
+            thread.join(5)
+
+    def test_idle_timeout(self, sock):
+        _, thread = _start(sock, idle_timeout=0.1)
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not sock.exists()
+
+
+class TestCheckDaemon:
+    def test_matches_local_output(self, server, tmp_path, monkeypatch, capsys):
+        (tmp_path / "a.py").write_text(DIRTY)
+        (tmp_path / "clean.py").write_text("x = 1\n")
+        monkeypatch.chdir(tmp_path)
+        local = main(["check", ".", "--no-color", "--no-cache"]), capsys.readouterr()
+        remote = main(["check", ".", "--no-color", "--daemon"]), capsys.readouterr()
+        assert remote[0] == local[0] == 2
+        assert remote[1].out == local[1].out
+        assert "a.py:2:0" in remote[1].out
+
+    def test_json_format(self, server, tmp_path, capsys):
+        (tmp_path / "a.py").write_text(DIRTY)
+        main(["check", str(tmp_path), "--json", "--daemon"])
+        assert str(tmp_path / "a.py") in capsys.readouterr().out
+
+    def test_remote_error(self, server, tmp_path, capsys):
+        ret = main(["check", str(tmp_path), "--daemon", "--changed-since", "x"])
+        assert ret == 2
+        assert "Error:" in capsys.readouterr().err
+
+    def test_no_files(self, server, tmp_path, capsys):
+        assert main(["check", str(tmp_path), "--daemon"]) == 0
+        assert "No Python files found" in capsys.readouterr().err
+
+    def test_stale_daemon_replaced(self, sock, tmp_path, monkeypatch):
+        old, old_thread = _start(sock)
+        old.build = "0.0.0+stale"
+        started = []
+
+        def spawn(path=None, idle_timeout=None):
+            started.append(_start(path))
+
+        monkeypatch.setattr(_daemon, "spawn", spawn)
+        (tmp_path / "a.py").write_text(DIRTY)
+        assert main(["check", str(tmp_path), "--daemon"]) == 2
+        old_thread.join(5)
+        assert not old_thread.is_alive()
+        assert len(started) == 1
+        _daemon.shutdown(sock)
+        started[0][1].join(5)
+
+    @pytest.mark.parametrize("argv, expected", [([], 1), (["--jobs", "3"], 3)])
+    def test_jobs_forwarded(self, server, tmp_path, monkeypatch, argv, expected):
+        from scitex_linter import _parallel
+
+        seen = []
+        lint_paths = _parallel.lint_paths
+
+        def spy(paths, config, jobs=1, cache=None):
+            seen.append(jobs)
+            return lint_paths(paths, config, jobs=1, cache=cache)
+
+        monkeypatch.setattr(_parallel, "lint_paths", spy)
+        (tmp_path / "a.py").write_text(DIRTY)
+        assert main(["check", str(tmp_path), "--daemon", *argv]) == 2
+        assert seen == [expected]
+
+    def test_unavailable_falls_back(self, sock, tmp_path, monkeypatch, capsys):
+        def spawn(*a, **k):
+            raise _daemon.DaemonError("no daemon")
+
+        monkeypatch.setattr(_daemon, "spawn", spawn)
+        (tmp_path / "a.py").write_text(DIRTY)
+        assert main(["check", str(tmp_path), "--daemon", "--no-color"]) == 2
+        captured = capsys.readouterr()
+        assert "linting locally" in captured.err
+        assert "STX-IO001" in captured.out
+
+
+class TestSpawn:
+    def test_ensure_starts_detached_daemon(self, tmp_path):
+        path = tmp_path / "s.sock"
+        try:
+            info = _daemon.ensure(path)
+            assert info["build"] == _daemon.build_id()
+            assert _daemon.ping(path)["pid"] == info["pid"]
+        finally:
+            assert _daemon.shutdown(path)
+
+
+class TestSocketSafety:
+    def test_xdg_runtime_dir_preferred(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SCITEX_LINTER_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert _daemon.socket_path() == tmp_path / "scitex-linter" / "daemon.sock"
+
+    def test_shared_directory_refused(self, tmp_path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o755)
+        with pytest.raises(_daemon.DaemonError, match="other users"):
+            _daemon.Server(shared / "d.sock").bind()
+        with pytest.raises(_daemon.DaemonError, match="other users"):
+            _daemon.ensure(shared / "d.sock")
+        assert _daemon.ping(shared / "d.sock") is None
+
+    def test_symlinked_directory_refused(self, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir(mode=0o700)
+        (tmp_path / "link").symlink_to(real)
+        with pytest.raises(_daemon.DaemonError, match="symlink"):
+            _daemon.Server(tmp_path / "link" / "d.sock").bind()
+
+    def test_build_id_from_installed_record(self, monkeypatch):
+        import importlib.metadata
+        from pathlib import Path
+
+        here = Path(_daemon.__file__).resolve().parent
+
+        class Dist:
+            files = {"RECORD": "scitex_linter/__init__.py,sha256=abc,10\n"}
+
+            def read_text(self, name):
+                return self.files.get(name)
+
+            def locate_file(self, name):
+                return here.parent / name
+
+        monkeypatch.setattr(importlib.metadata, "distribution", lambda name: Dist())
+        digest = _daemon._record_digest()
+        assert digest and len(digest) == 16
+        Dist.files = {**Dist.files, "RECORD": "changed\n"}
+        assert _daemon._record_digest() != digest
+        Dist.files["direct_url.json"] = '{"dir_info": {"editable": true}}'
+        assert _daemon._record_digest() is None
+
+    def test_build_id_tracks_plugins(self, monkeypatch):
+        before = _daemon.build_id()
+        monkeypatch.setattr(
+            "scitex_linter._plugin_loader.plugin_versions",
+            lambda: [("new", "pkg:get_plugin", "1.0")],
+        )
+        assert _daemon.build_id() != before
+
+
+class TestServeCLI:
+    def test_status_and_stop(self, server, sock, capsys):
+        assert main(["serve", "--status"]) == 0
+        assert str(sock) in capsys.readouterr().out
+        assert main(["serve", "--stop"]) == 0
+        assert main(["serve", "--status"]) == 1
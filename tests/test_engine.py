@@ -0,0 +1,86 @@
+"""Tests for the single-traversal dispatch engine and plugin checkers."""
+
+import ast
+
+import pytest
+
+from scitex_linter import _plugin_loader
+from scitex_linter._engine import DispatchEngine
+from scitex_linter.checker import Issue, lint_source
+from scitex_linter.rules import Rule
+
+X001 = Rule(
+    id="STX-X001",
+    severity="warning",
+    category="io",
+    message="plugin rule",
+    suggestion="",
+)
+
+
+class _DeclaredChecker(ast.NodeVisitor):
+    category = "io"
+    node_types = ("Call",)
+
+    def __init__(self, lines, config):
+        self.issues = []
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id == "frob":
+            self.issues.append(Issue(rule=X001, line=node.lineno, col=node.col_offset))
+        self.generic_visit(node)
+
+
+class _LegacyChecker(_DeclaredChecker):
+    node_types = None
+
+
+class _BrokenChecker(_DeclaredChecker):
+    def visit_Call(self, node):
+        self.issues.append(Issue(rule=X001, line=node.lineno, col=node.col_offset))
+        raise RuntimeError("plugin bug")
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    def _install(*checkers):
+        monkeypatch.setattr(
+            _plugin_loader,
+            "_cache",
+            {"rules": {}, "call_rules": {}, "axes_hints": {}, "checkers": checkers},
+        )
+
+    return _install
+
+
+SRC = "def f():\n    frob(frob(1))\n"
+
+
+class TestDispatchEngine:
+    def test_preorder_with_leave(self):
+        tree = ast.parse("def f():\n    g()\n")
+        events = []
+        engine = DispatchEngine()
+        engine.register(ast.FunctionDef, lambda n: events.append("enter"))
+        engine.register(ast.FunctionDef, lambda n: events.append("leave"), leave=True)
+        engine.register(ast.Call, lambda n: events.append("call"))
+        engine.run(tree)
+        assert events == ["enter", "call", "leave"]
+
+
+class TestPluginCheckers:
+    def test_declared_node_types_dispatched_once(self, plugins):
+        plugins(_DeclaredChecker)
+        ids = [i.rule.id for i in lint_source(SRC, filepath="src/m.py")]
+        # Nested call visited exactly once per node despite generic_visit
+        assert ids.count("STX-X001") == 2
+
+    def test_legacy_checker_still_runs(self, plugins):
+        plugins(_LegacyChecker)
+        ids = [i.rule.id for i in lint_source(SRC, filepath="src/m.py")]
+        assert ids.count("STX-X001") == 2
+
+    def test_raising_checker_is_dropped(self, plugins):
+        plugins(_BrokenChecker, _DeclaredChecker)
+        ids = [i.rule.id for i in lint_source(SRC, filepath="src/m.py")]
+        assert ids.count("STX-X001") == 2
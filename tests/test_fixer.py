@@ -455,6 +455,48 @@ class TestFixIO:
         fixed = fix_source(src)
         assert "stx.io.save(fig, str(out_path))" in fixed
 
+    def test_nested_calls_fixed_without_corruption(self):
+        src = 'np.save("a.npy", np.load("b.npy"))\n'
+        fixed = fix_source(src)
+        assert fixed == (
+            'import scitex as stx\nstx.io.save(stx.io.load("b.npy"), "a.npy")\n'
+        )
+
+    def test_non_ascii_before_call(self):
+        src = 'x = "é"; np.save("ü.npy", y)\n'
+        fixed = fix_source(src)
+        assert fixed.endswith('x = "é"; stx.io.save(y, "ü.npy")\n')
+
+    def test_crlf_and_form_feed_line_endings(self):
+        src = '\x0cimport numpy as np\r\nnp.save("a.npy", x)\r\n'
+        fixed = fix_source(src)
+        assert fixed.endswith('import numpy as np\r\nstx.io.save(x, "a.npy")\r\n')
+
+    def test_multiline_call(self):
+        src = 'x = np.load(\n    "a.npy",\n)\ny = 1\n'
+        fixed = fix_source(src)
+        assert fixed.endswith('x = stx.io.load("a.npy")\ny = 1\n')
+
+    def test_trailing_newline_added(self):
+        assert fix_source("x = 1") == "x = 1\n"
+        assert fix_source("") == ""
+
+    def test_single_parse_for_many_fixes(self, monkeypatch):
+        import ast
+
+        calls = []
+        real_parse = ast.parse
+        monkeypatch.setattr(
+            ast, "parse", lambda *a, **k: calls.append(1) or real_parse(*a, **k)
+        )
+        src = "import scitex as stx\n\n@stx.session\ndef main():\n"
+        src += "".join(f'    np.save("a{i}.npy", x)\n' for i in range(200))
+        src += "    return 0\n"
+        fixed = fix_source(src)
+        assert len(calls) == 1
+        assert fixed.count("stx.io.save(") == 200
+        assert "logger=stx.session.INJECTED" in fixed
+
 
 # =========================================================================
 # TestFormatCLI: placeholder for post-integration tests
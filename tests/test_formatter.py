@@ -0,0 +1,46 @@
+"""Tests for the incremental JSON / NDJSON writers."""
+
+import io
+import json
+
+import pytest
+
+from scitex_linter.checker import lint_source
+from scitex_linter.formatter import JSONWriter, NDJSONWriter, to_json
+
+SOURCES = {
+    "a.py": "import argparse\n",
+    "dir/b ü.py": 'import numpy as np\nnp.save("x\\ny.npy", 1)\n',
+    "c.py": "import pickle\nimport argparse\n",
+}
+
+
+def _results(names):
+    return [(n, lint_source(SOURCES[n], filepath=n)) for n in names]
+
+
+class TestJSONWriter:
+    @pytest.mark.parametrize("names", [[], ["a.py"], list(SOURCES)])
+    def test_matches_json_dumps(self, names):
+        results = _results(names)
+        combined = {fp: to_json(issues, fp) for fp, issues in results}
+        out = io.StringIO()
+        writer = JSONWriter(out)
+        for fp, issues in results:
+            writer.add(fp, issues)
+        writer.close()
+        assert out.getvalue() == json.dumps(combined, indent=2) + "\n"
+
+
+class TestNDJSONWriter:
+    def test_one_object_per_line(self):
+        results = _results(list(SOURCES))
+        out = io.StringIO()
+        writer = NDJSONWriter(out)
+        for fp, issues in results:
+            writer.add(fp, issues)
+        writer.close()
+        lines = out.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            to_json(issues, fp) for fp, issues in results
+        ]
@@ -0,0 +1,133 @@
+"""Tests for git-aware file selection (--changed-since / --staged)."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from scitex_linter import _git
+from scitex_linter.cli import main
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git missing")
+
+DIRTY = 'import numpy as np\nnp.save("a.npy", 1)\n'
+CLEAN_LIB = "x = 1\n"
+
+
+def _git_cmd(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git_cmd(tmp_path, "init", "-q")
+    (tmp_path / "old.py").write_text(DIRTY)
+    (tmp_path / "gone.py").write_text(DIRTY)
+    (tmp_path / "notes.txt").write_text("hi\n")
+    _git_cmd(tmp_path, "add", ".")
+    _git_cmd(tmp_path, "commit", "-q", "-m", "base")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestChangedFiles:
+    def test_changed_since(self, repo):
+        (repo / "new.py").write_text(DIRTY)
+        (repo / "old.py").write_text(DIRTY + "y = 2\n")
+        (repo / "gone.py").unlink()
+        (repo / "notes.txt").write_text("changed\n")
+        _git_cmd(repo, "add", "-A")
+        files = _git.changed_files(repo, ref="HEAD")
+        assert [str(f) for f in files] == ["new.py", "old.py"]
+
+    def test_staged_only(self, repo):
+        (repo / "old.py").write_text(DIRTY + "y = 2\n")  # unstaged
+        (repo / "new.py").write_text(DIRTY)
+        _git_cmd(repo, "add", "new.py")
+        files = _git.changed_files(repo, staged=True)
+        assert [str(f) for f in files] == ["new.py"]
+
+    def test_scoped_to_path(self, repo):
+        (repo / "sub").mkdir()
+        (repo / "sub" / "a.py").write_text(DIRTY)
+        (repo / "b.py").write_text(DIRTY)
+        _git_cmd(repo, "add", "-A")
+        files = _git.changed_files(repo / "sub", staged=True)
+        assert [f.as_posix() for f in files] == ["sub/a.py"]
+
+    def test_not_a_repo(self, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        with pytest.raises(_git.GitError):
+            _git.changed_files(outside, ref="HEAD", staged=False)
+
+
+class TestBlobReader:
+    def test_reads_index_not_worktree(self, repo):
+        (repo / "new.py").write_text("staged = 1\n")
+        _git_cmd(repo, "add", "new.py")
+        (repo / "new.py").write_text("worktree = 1\n")
+        with _git.BlobReader(_git.repo_root(repo)) as blobs:
+            assert blobs.read_staged("new.py") == b"staged = 1\n"
+            assert blobs.read_staged("old.py") == DIRTY.encode()
+            assert blobs.read_staged("missing.py") is None
+
+
+class TestCLI:
+    def test_check_staged_lints_index_content(self, repo, capsys):
+        (repo / "new.py").write_text(DIRTY)
+        _git_cmd(repo, "add", "new.py")
+        (repo / "new.py").write_text(CLEAN_LIB)  # worktree is clean
+        ret = main(["check", ".", "--staged", "--no-color"])
+        out = capsys.readouterr().out
+        assert ret >= 1
+        assert "new.py" in out and "STX-IO001" in out
+        assert "old.py" not in out
+
+    def test_check_staged_jobs_match_serial(self, repo, capsys):
+        for name in ("a.py", "b.py", "c.py"):
+            (repo / name).write_text(DIRTY)
+            _git_cmd(repo, "add", name)
+            (repo / name).write_text(CLEAN_LIB)
+        main(["check", ".", "--staged", "--no-color", "--jobs", "1"])
+        serial = capsys.readouterr().out
+        main(["check", ".", "--staged", "--no-color", "--jobs", "2"])
+        assert capsys.readouterr().out == serial
+        assert serial.count("STX-IO001") == 3
+
+    def test_check_changed_since_nothing_changed(self, repo, capsys):
+        assert main(["check", ".", "--changed-since", "HEAD"]) == 0
+        assert "No Python files found" in capsys.readouterr().err
+
+    def test_check_bad_ref(self, repo, capsys):
+        assert main(["check", ".", "--changed-since", "no-such-ref"]) == 2
+        assert "Error:" in capsys.readouterr().err
+
+    def test_flags_mutually_exclusive(self, repo):
+        with pytest.raises(SystemExit):
+            main(["check", ".", "--staged", "--changed-since", "HEAD"])
+
+    def test_format_selects_changed_files(self, repo, capsys):
+        (repo / "old.py").write_text(DIRTY + "y = 2\n")
+        ret = main(["format", ".", "--changed-since", "HEAD", "--check"])
+        out = capsys.readouterr().out
+        assert ret == 1
+        assert "old.py" in out
+        assert "gone.py" not in out  # unchanged, though fixable
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_format_staged_file_deleted_from_worktree(self, repo, capsys, jobs):
+        for name in ("new.py", "other.py"):
+            (repo / name).write_text(DIRTY)
+            _git_cmd(repo, "add", name)
+        (repo / "new.py").unlink()
+        ret = main(["format", ".", "--staged", "--check", "--jobs", jobs])
+        captured = capsys.readouterr()
+        assert ret == 1
+        assert "Would fix other.py" in captured.out
+        assert "Skipped new.py" in captured.err
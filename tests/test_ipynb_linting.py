@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import json
 
-from scitex_linter.checker import lint_file
+import pytest
+
+from scitex_linter._ipynb import lint_ipynb
+from scitex_linter.checker import Issue, lint_file
+from scitex_linter.config import LinterConfig
+from scitex_linter.formatter import format_issue, to_json
 
 
 def _make_notebook(tmp_path, cells):
@@ -90,4 +95,83 @@ class TestIpynbLinting:
         assert lint_file(str(bad)) == []
 
 
+class TestSingleModule:
+    def test_lines_mapped_to_cells(self, tmp_path):
+        nb = _make_notebook(
+            tmp_path,
+            [
+                ("code", "import numpy as np\n"),
+                ("markdown", "# Save"),
+                ("code", ["x = 1\n", "np.save('y.npy', x)"]),
+            ],
+        )
+        io = [i for i in lint_file(str(nb)) if i.rule.id == "STX-IO001"]
+        assert [(i.cell, i.line) for i in io] == [(2, 2)]
+        assert io[0].source_line == "np.save('y.npy', x)"
+
+    def test_module_checks_run_once(self, tmp_path):
+        cells = [("code", f"x{n} = {n}\n") for n in range(5)]
+        nb = _make_notebook(tmp_path, cells)
+        s002 = [i for i in lint_file(str(nb)) if i.rule.id == "STX-S002"]
+        assert [(i.cell, i.line) for i in s002] == [(0, 1)]
+        per_cell = lint_ipynb(nb, per_cell=True)
+        assert sum(i.rule.id == "STX-S002" for i in per_cell) == 5
+
+    def test_names_resolve_across_cells(self, tmp_path):
+        nb = _make_notebook(
+            tmp_path,
+            [("code", "import numpy as np\n"), ("code", "np.save('a.npy', 1)\n")],
+        )
+        module = lint_ipynb(nb)
+        assert any(i.rule.id == "STX-IO001" and i.cell == 1 for i in module)
+
+    def test_unparsable_cells_excluded(self, tmp_path):
+        nb = _make_notebook(
+            tmp_path,
+            [
+                ("code", "%matplotlib inline\n"),
+                ("code", "def broken(:\n"),
+                ("code", "import numpy as np\nnp.save('a.npy', 1)\n"),
+            ],
+        )
+        io = [i for i in lint_ipynb(nb) if i.rule.id == "STX-IO001"]
+        assert [(i.cell, i.line) for i in io] == [(2, 2)]
+
+    @pytest.mark.parametrize("per_cell", [False, True])
+    def test_same_cell_issues_in_both_modes(self, tmp_path, per_cell):
+        nb = _make_notebook(
+            tmp_path,
+            [
+                ("code", "import numpy as np\r\nimport pandas as pd\r\n"),
+                ("code", "df = pd.read_csv('a.csv')\nnp.save('a.npy', 1)\n"),
+            ],
+        )
+        found = {
+            (i.rule.id, i.cell, i.line)
+            for i in lint_ipynb(nb, per_cell=per_cell)
+            if i.rule.category != "structure"
+        }
+        assert ("STX-IO001", 1, 2) in found
+        assert ("STX-IO003", 1, 1) in found
+
+    def test_config_selects_per_cell(self, tmp_path):
+        cells = [("code", "a = 1\n"), ("code", "b = 2\n")]
+        nb = _make_notebook(tmp_path, cells)
+        config = LinterConfig(notebook_per_cell=True)
+        s002 = [i for i in lint_file(str(nb), config) if i.rule.id == "STX-S002"]
+        assert [i.cell for i in s002] == [0, 1]
+
+    def test_formatted_location(self, tmp_path):
+        nb = _make_notebook(
+            tmp_path,
+            [("code", "pass\n"), ("code", "import numpy as np\nnp.save('a', 1)\n")],
+        )
+        io = next(i for i in lint_file(str(nb)) if i.rule.id == "STX-IO001")
+        assert f"{nb}::cell-1:2:0" in format_issue(io, str(nb), color=False)
+        entry = to_json([io], str(nb))["issues"][0]
+        assert (entry["cell"], entry["line"]) == (1, 2)
+        plain = Issue(rule=io.rule, line=1, col=0)
+        assert "cell" not in to_json([plain], "x.py")["issues"][0]
+
+
 # EOF
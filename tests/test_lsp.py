@@ -0,0 +1,280 @@
+"""Tests for the stdio Language Server (scitex-linter lsp)."""
+
+import io
+import queue
+import time
+
+import pytest
+
+from scitex_linter._lsp import (
+    Document,
+    LanguageServer,
+    read_message,
+    write_message,
+)
+from scitex_linter.fixer import fix_source
+
+URI = "file:///tmp/proj/script.py"
+DIRTY = 'import numpy as np\nnp.save("a.npy", 1)\n'
+
+
+def _messages(out: io.BytesIO) -> list:
+    stream = io.BytesIO(out.getvalue())
+    found = []
+    while True:
+        msg = read_message(stream)
+        if msg is None:
+            return found
+        found.append(msg)
+
+
+def _published(out) -> list:
+    return [
+        m["params"]
+        for m in _messages(out)
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+
+def _open(server, text=DIRTY, version=1):
+    server.handle(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {
+                    "uri": URI,
+                    "languageId": "python",
+                    "version": version,
+                    "text": text,
+                }
+            },
+        }
+    )
+
+
+def _change(server, version, changes):
+    server.handle(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": URI, "version": version},
+                "contentChanges": changes,
+            },
+        }
+    )
+
+
+def _edit(sl, sc, el, ec, text):
+    return {
+        "range": {
+            "start": {"line": sl, "character": sc},
+            "end": {"line": el, "character": ec},
+        },
+        "text": text,
+    }
+
+
+@pytest.fixture
+def server():
+    return LanguageServer(io.BytesIO(), debounce=0)
+
+
+class TestFraming:
+    def test_round_trip(self):
+        buf = io.BytesIO()
+        write_message(buf, {"jsonrpc": "2.0", "id": 1, "result": "é"})
+        raw = buf.getvalue()
+        assert raw.startswith(b"Content-Length: ")
+        assert read_message(io.BytesIO(raw)) == {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": "é",
+        }
+        assert read_message(io.BytesIO(b"")) is None
+
+
+class TestDocument:
+    def test_utf16_positions(self):
+        doc = Document(URI, "a\U0001f600b = 1\nx = 2\n")
+        doc.apply(_edit(0, 3, 0, 4, "c"))  # the emoji is two UTF-16 units
+        assert doc.text == "a\U0001f600c = 1\nx = 2\n"
+
+    def test_multi_line_and_crlf(self):
+        doc = Document(URI, "one\r\ntwo\r\nthree")
+        doc.apply(_edit(0, 2, 2, 1, "X"))
+        assert doc.text == "onXhree"
+        assert doc.end_position() == {"line": 0, "character": 7}
+
+    def test_full_replacement(self):
+        doc = Document(URI, "old\n")
+        doc.apply({"text": "new\n"})
+        assert doc.text == "new\n"
+
+
+class TestDiagnostics:
+    def test_open_publishes(self, server):
+        _open(server)
+        server.run_due()
+        (params,) = _published(server.out)
+        assert params["version"] == 1
+        io001 = [d for d in params["diagnostics"] if d["code"] == "STX-IO001"]
+        assert io001[0]["range"]["start"] == {"line": 1, "character": 0}
+        assert io001[0]["severity"] == 2
+        assert io001[0]["source"] == "scitex-linter"
+
+    def test_column_is_utf16(self, server):
+        _open(server, 'import numpy as np\ns = "\U0001f600"; np.save("a.npy", 1)\n')
+        server.run_due()
+        (params,) = _published(server.out)
+        io001 = next(d for d in params["diagnostics"] if d["code"] == "STX-IO001")
+        # AST col_offset 12 (UTF-8 bytes) is UTF-16 column 10
+        assert io001["range"]["start"]["character"] == 10
+
+    def test_incremental_change_relints(self, server):
+        _open(server)
+        server.run_due()
+        _change(server, 2, [_edit(1, 0, 2, 0, "")])  # delete np.save line
+        server.run_due()
+        last = _published(server.out)[-1]
+        assert last["version"] == 2
+        assert not any(d["code"] == "STX-IO001" for d in last["diagnostics"])
+
+    def test_unchanged_content_not_relinted(self, server):
+        _open(server)
+        server.run_due()
+        _change(server, 2, [_edit(0, 0, 0, 0, "x")])
+        _change(server, 3, [_edit(0, 0, 0, 1, "")])  # back to the original
+        server.run_due()
+        assert server.lints == 1
+        assert len(_published(server.out)) == 2
+
+    def test_debounce_coalesces_edits(self):
+        server = LanguageServer(io.BytesIO(), debounce=10)
+        _open(server)
+        server.run_due()
+        for v in range(2, 6):
+            _change(server, v, [_edit(0, 0, 0, 0, "#\n")])
+        server.run_due()
+        assert len(_published(server.out)) == 1  # still debouncing
+        server.run_due(now=time.monotonic() + 11)
+        published = _published(server.out)
+        assert [p["version"] for p in published] == [1, 5]
+        assert server.lints == 2
+
+    def test_superseded_result_dropped(self, server):
+        server._queue = queue.Queue()
+        _open(server)
+        real_lint = server._lint
+
+        def lint_then_edit(doc):
+            result = real_lint(doc)
+            if doc.version == 1:  # an edit arrives while v1 is being linted
+                server._queue.put(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "textDocument/didChange",
+                        "params": {
+                            "textDocument": {"uri": URI, "version": 2},
+                            "contentChanges": [{"text": "x = 1\n"}],
+                        },
+                    }
+                )
+            return result
+
+        server._lint = lint_then_edit
+        server.run_due()
+        assert _published(server.out) == []
+        server.run_due()
+        assert [p["version"] for p in _published(server.out)] == [2]
+
+    def test_close_clears(self, server):
+        _open(server)
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": URI}},
+            }
+        )
+        server.run_due()
+        assert _published(server.out) == [{"uri": URI, "diagnostics": []}]
+
+
+class TestCodeActions:
+    def _actions(self, server, only=None):
+        context = {"diagnostics": []}
+        if only:
+            context["only"] = only
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "id": 7,
+                "method": "textDocument/codeAction",
+                "params": {
+                    "textDocument": {"uri": URI},
+                    "range": _edit(0, 0, 0, 0, "")["range"],
+                    "context": context,
+                },
+            }
+        )
+        return _messages(server.out)[-1]["result"]
+
+    def test_fix_all_edit(self, server):
+        _open(server)
+        (action,) = self._actions(server)
+        assert action["kind"] == "source.fixAll.scitex"
+        (edit,) = action["edit"]["changes"][URI]
+        assert edit["newText"] == fix_source(DIRTY, "/tmp/proj/script.py")
+        assert edit["range"]["end"] == {"line": 2, "character": 0}
+
+    def test_only_filter(self, server):
+        _open(server)
+        kinds = [a["kind"] for a in self._actions(server, only=["quickfix"])]
+        assert kinds == ["quickfix"]
+
+    def test_nothing_to_fix(self, server):
+        _open(server, "x = 1\n")
+        assert self._actions(server) == []
+
+
+class TestSession:
+    def test_stdio_session(self):
+        inp = io.BytesIO()
+        for msg in [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": URI,
+                        "languageId": "python",
+                        "version": 1,
+                        "text": DIRTY,
+                    }
+                },
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "nope/unknown"},
+            {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]:
+            write_message(inp, msg)
+        inp.seek(0)
+        out = io.BytesIO()
+        assert LanguageServer(out, debounce=0).serve(inp) == 0
+
+        replies = {m["id"]: m for m in _messages(out) if "id" in m}
+        caps = replies[1]["result"]["capabilities"]
+        assert caps["textDocumentSync"]["change"] == 2
+        assert replies[2]["error"]["code"] == -32601
+        assert replies[3]["result"] is None
+        assert _published(out)
+
+    def test_exit_without_shutdown(self):
+        inp = io.BytesIO()
+        write_message(inp, {"jsonrpc": "2.0", "method": "exit"})
+        inp.seek(0)
+        assert LanguageServer(io.BytesIO(), debounce=0).serve(inp) == 1
@@ -0,0 +1,83 @@
+"""Tests for the MCP server's in-process result cache."""
+
+import os
+
+import pytest
+
+from scitex_linter._mcp import cache
+
+DIRTY = 'import numpy as np\nnp.save("a.npy", 1)\n'
+
+
+@pytest.fixture(autouse=True)
+def fresh():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _ids(issues):
+    return [i.rule.id for i in issues]
+
+
+class TestResultCache:
+    def test_lru_eviction(self):
+        lru = cache.ResultCache(2)
+        lru.put("a", [1])
+        lru.put("b", [2])
+        assert lru.get("a") == [1]  # "a" is now most recent
+        lru.put("c", [3])
+        assert lru.get("b") is None
+        assert lru.stats()["entries"] == 2
+        assert (lru.hits, lru.misses) == (1, 1)
+
+
+class TestSources:
+    def test_repeat_is_a_hit(self):
+        first = cache.lint_source(DIRTY)
+        assert cache.lint_source(DIRTY) is first
+        assert cache.stats()["sources"]["hits"] == 1
+        assert cache.stats()["sources"]["misses"] == 1
+
+    def test_role_separates_entries(self, tmp_path):
+        source = "import argparse\n"
+        script = cache.lint_source(source, str(tmp_path / "run.py"))
+        library = cache.lint_source(source, str(tmp_path / "src" / "mod.py"))
+        assert _ids(script) != _ids(library)
+        assert cache.stats()["sources"]["entries"] == 2
+        cache.lint_source(source, str(tmp_path / "other.py"))  # same role
+        assert cache.stats()["sources"]["hits"] == 1
+
+    def test_config_change_misses(self, monkeypatch):
+        cache.lint_source(DIRTY)
+        monkeypatch.setenv("SCITEX_LINTER_DISABLE", "STX-IO001")
+        assert "STX-IO001" not in _ids(cache.lint_source(DIRTY))
+        assert cache.stats()["sources"]["misses"] == 2
+
+
+class TestFiles:
+    def _write(self, path, text, age=10):
+        path.write_text(text)
+        t = os.stat(path).st_mtime - age
+        os.utime(path, (t, t))
+
+    def test_unchanged_file_is_a_hit(self, tmp_path):
+        f = tmp_path / "script.py"
+        self._write(f, DIRTY)
+        first = cache.lint_file(str(f))
+        assert cache.lint_file(str(f)) is first
+        assert cache.stats()["files"]["hits"] == 1
+
+    def test_modified_file_relints(self, tmp_path):
+        f = tmp_path / "script.py"
+        self._write(f, DIRTY)
+        assert "STX-IO001" in _ids(cache.lint_file(str(f)))
+        self._write(f, "x = 1\n", age=5)
+        assert "STX-IO001" not in _ids(cache.lint_file(str(f)))
+        assert cache.stats()["files"]["hits"] == 0
+
+    def test_fresh_mtime_not_cached(self, tmp_path):
+        f = tmp_path / "script.py"
+        f.write_text(DIRTY)
+        cache.lint_file(str(f))
+        assert cache.stats()["files"]["entries"] == 0
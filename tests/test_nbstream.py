@@ -0,0 +1,116 @@
+"""Tests for the streaming .ipynb cell reader."""
+
+import io
+import json
+import random
+import tracemalloc
+
+import pytest
+
+from scitex_linter._nbstream import iter_cells
+
+NOTEBOOK = {
+    "metadata": {"kernelspec": {"name": "python3"}, "tags": [1, 2.5, None]},
+    "nbformat": 4,
+    "cells": [
+        {"cell_type": "markdown", "source": ["# Tïtle \U0001f600\n"]},
+        {
+            "outputs": [
+                {
+                    "data": {"image/png": "iVBOR" * 500, "text/html": ['<a href="x">']},
+                    "output_type": "display_data",
+                    "metadata": {"nested": [[{"a": "]}"}], {}], "b": "\\\\"},
+                }
+            ],
+            "source": ["import numpy as np\n", 'print("a\\tb \\"q\\"")\n'],
+            "cell_type": "code",
+            "execution_count": 12,
+        },
+        {"cell_type": "code", "source": "x = 'é\\u00e9'\n", "attachments": {}},
+        "not-a-cell",
+        {"cell_type": "raw"},
+    ],
+    "nbformat_minor": 5,
+}
+
+
+def _expected(doc):
+    return [
+        (i, c.get("cell_type"), c.get("source", ""))
+        for i, c in enumerate(doc["cells"])
+        if isinstance(c, dict)
+    ]
+
+
+def _read(text, chunk_size=7):
+    fp = io.BytesIO(text.encode("utf-8"))
+    return list(iter_cells(fp, chunk_size=chunk_size))
+
+
+class TestIterCells:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+    def test_matches_json_loads(self, chunk_size):
+        for indent in (None, 1):
+            text = json.dumps(NOTEBOOK, indent=indent)
+            assert _read(text, chunk_size) == _expected(json.loads(text))
+
+    def test_random_escapes_across_chunks(self):
+        rng = random.Random(0)
+        alphabet = ['"', "\\", "\n", "a", "]", "}", "é", "\u2028"]
+        for _ in range(200):
+            junk = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            doc = {
+                "cells": [
+                    {"outputs": [{"text": junk}], "cell_type": "code", "source": junk}
+                ]
+            }
+            chunk_size = rng.randint(1, 5)
+            assert _read(json.dumps(doc), chunk_size) == [(0, "code", junk)]
+
+    def test_ascii_escaped_dump(self):
+        text = json.dumps(NOTEBOOK, ensure_ascii=True)
+        assert _read(text, 5) == _expected(NOTEBOOK)
+
+    def test_no_cells(self):
+        assert _read('{"metadata": {}, "cells": null}') == []
+        assert _read("{}") == []
+        assert _read(' {"cells" : [ ] } \n') == []
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "[]",
+            '{"cells": [',
+            '{"cells": [{"source": "x}]}',
+            '{"cells": [{"outputs": [}], "source": ""}]}',
+            '{"cells": [], "n": tru}',
+            '{"cells": []} trailing',
+            '{"cells": [] "n": 1}',
+        ],
+    )
+    def test_malformed_raises(self, text):
+        with pytest.raises(ValueError):
+            _read(text, 3)
+
+    def test_outputs_not_materialised(self):
+        blob = "A" * (8 << 20)
+        doc = {
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "outputs": [{"data": {"image/png": blob}}],
+                    "source": "x = 1\n",
+                }
+            ]
+        }
+        fp = io.BytesIO(json.dumps(doc).encode())
+        del doc, blob
+        tracemalloc.start()
+        try:
+            cells = list(iter_cells(fp, chunk_size=1 << 16))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert cells == [(0, "code", "x = 1\n")]
+        assert peak < 1 << 20
@@ -0,0 +1,67 @@
+"""Tests for import-free package availability detection."""
+
+import sys
+
+import pytest
+
+from scitex_linter import _packages
+
+
+@pytest.fixture
+def fake_pkgs(tmp_path, monkeypatch):
+    """Packages whose import would fail loudly."""
+    pkg = tmp_path / "stxfake"
+    (pkg / "plt").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("raise RuntimeError('imported!')\n")
+    (pkg / "plt" / "__init__.py").write_text("raise RuntimeError('imported!')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _packages.reset()
+    yield
+    _packages.reset()
+
+
+class TestCanImport:
+    def test_top_level_found_without_import(self, fake_pkgs):
+        assert _packages._can_import("stxfake")
+        assert "stxfake" not in sys.modules
+
+    def test_submodule_found_without_importing_parent(self, fake_pkgs):
+        assert _packages._can_import("stxfake.plt")
+        assert "stxfake" not in sys.modules
+
+    def test_missing(self, fake_pkgs):
+        assert not _packages._can_import("stxfake.nope")
+        assert not _packages._can_import("no_such_pkg_xyz")
+
+    def test_already_imported_module(self):
+        assert _packages._can_import("json")
+
+
+class TestDetect:
+    def test_keys(self):
+        _packages.reset()
+        result = _packages.detect()
+        assert set(result) == {"scitex", "figrecipe"}
+
+    def test_disk_cache_reused(self, monkeypatch):
+        _packages.reset()
+        first = _packages.detect()
+        _packages.reset()
+        monkeypatch.setattr(
+            _packages, "_can_import", lambda name: pytest.fail("re-detected")
+        )
+        assert _packages.detect() == first
+        _packages.reset()
+
+    def test_path_change_invalidates_disk_cache(self, tmp_path, monkeypatch):
+        _packages.reset()
+        _packages.detect()
+        _packages.reset()
+        monkeypatch.syspath_prepend(str(tmp_path))
+        seen = []
+        monkeypatch.setattr(
+            _packages, "_can_import", lambda name: seen.append(name) or False
+        )
+        assert _packages.detect() == {"scitex": False, "figrecipe": False}
+        assert "scitex" in seen
+        _packages.reset()
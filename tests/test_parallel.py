@@ -0,0 +1,138 @@
+"""Tests for multi-process `check --jobs` and `format --jobs`."""
+
+import os
+
+from scitex_linter import _parallel
+from scitex_linter._parallel import lint_paths, resolve_jobs
+from scitex_linter.cli import main
+from scitex_linter.config import LinterConfig
+
+BAD = "import argparse\nimport pickle\n\nif __name__ == '__main__':\n    pass\n"
+CLEAN = "x = 1\n"
+
+
+def _make_tree(tmp_path, n=6):
+    for k in range(n):
+        (tmp_path / f"s{k:02d}.py").write_text(BAD if k % 2 else CLEAN)
+    return tmp_path
+
+
+class TestResolveJobs:
+    def test_clamped_to_item_count(self):
+        assert resolve_jobs(8, 3) == 3
+
+    def test_default_is_at_least_one(self):
+        assert resolve_jobs(None, 1) == 1
+        assert resolve_jobs(0, 100) >= 1
+
+
+class TestLintPaths:
+    def test_parallel_matches_sequential(self, tmp_path):
+        files = sorted(_make_tree(tmp_path).glob("*.py"))
+        config = LinterConfig()
+        seq = [(p, [i.rule.id for i in iss]) for p, iss in lint_paths(files, config)]
+        par = [
+            (p, [i.rule.id for i in iss])
+            for p, iss in lint_paths(files, config, jobs=3)
+        ]
+        assert par == seq
+        assert [p for p, _ in par] == [str(f) for f in files]
+
+    def test_worker_cache_writes_reported(self, tmp_path):
+        from scitex_linter._cache import LintCache
+
+        (tmp_path / "src").mkdir()
+        files = sorted(_make_tree(tmp_path / "src").glob("*.py"))
+        for f in files:
+            st = os.stat(f)
+            os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns - 10 * 10**9))
+        cache = LintCache(tmp_path / "cache")
+        list(lint_paths(files, LinterConfig(), jobs=3, cache=cache))
+        assert cache.take_writes() == len(files)
+        # Warm run: every file hits, so there is nothing to prune
+        list(_parallel.count_paths(files, LinterConfig(), jobs=3, cache=cache))
+        assert cache.take_writes() == 0
+
+
+class TestPlan:
+    def test_small_lazy_tree_clamps_jobs(self, tmp_path):
+        files = iter(sorted(_make_tree(tmp_path, n=2).glob("*.py")))
+        paths, jobs = _parallel._plan(files, 8)
+        assert jobs == 2
+        assert len(paths) == 2
+
+    def test_single_file_runs_in_process(self, tmp_path, monkeypatch):
+        files = iter(sorted(_make_tree(tmp_path, n=1).glob("*.py")))
+        monkeypatch.setattr(_parallel, "imap", lambda *a, **k: 1 / 0)
+        assert len(list(lint_paths(files, LinterConfig(), jobs=8))) == 1
+
+    def test_large_lazy_tree_stays_lazy(self, tmp_path):
+        files = iter(sorted(_make_tree(tmp_path, n=6).glob("*.py")))
+        paths, jobs = _parallel._plan(files, 2)
+        assert jobs == 2
+        assert not hasattr(paths, "__len__")
+        assert len(list(paths)) == 6
+
+    def test_sized_paths_keep_len(self, tmp_path):
+        files = sorted(_make_tree(tmp_path, n=6).glob("*.py"))
+        paths, jobs = _parallel._plan(files, 4)
+        assert (len(paths), jobs) == (6, 4)
+
+
+class TestCheckJobs:
+    def test_output_identical_across_jobs(self, tmp_path, capsys):
+        _make_tree(tmp_path)
+        code1 = main(["check", str(tmp_path), "--jobs", "1", "--no-color"])
+        out1 = capsys.readouterr().out
+        code4 = main(["check", str(tmp_path), "--jobs", "4", "--no-color"])
+        out4 = capsys.readouterr().out
+        assert code1 == code4 == 2
+        assert out1 == out4
+        assert "STX-I003" in out4
+
+
+FIXABLE = 'import numpy as np\nnp.save("a.npy", x)\n'
+
+
+def _make_fixable_tree(tmp_path, n=6):
+    for k in range(n):
+        (tmp_path / f"f{k:02d}.py").write_text(FIXABLE if k % 2 else CLEAN)
+    return tmp_path
+
+
+class TestFormatJobs:
+    def test_diff_identical_across_jobs(self, tmp_path, capsys):
+        _make_fixable_tree(tmp_path)
+        code1 = main(["format", str(tmp_path), "--check", "--diff", "--jobs", "1"])
+        out1 = capsys.readouterr().out
+        code4 = main(["format", str(tmp_path), "--check", "--diff", "--jobs", "4"])
+        out4 = capsys.readouterr().out
+        assert code1 == code4 == 1
+        assert out1 == out4
+        assert out4.index("f01.py") < out4.index("f03.py") < out4.index("f05.py")
+
+    def test_parallel_writes(self, tmp_path):
+        _make_fixable_tree(tmp_path)
+        assert main(["format", str(tmp_path), "--jobs", "3"]) == 0
+        for k in (1, 3, 5):
+            assert "stx.io.save(x" in (tmp_path / f"f{k:02d}.py").read_text()
+
+    def test_unchanged_files_not_rewritten(self, tmp_path):
+        _make_fixable_tree(tmp_path, n=2)
+        clean = tmp_path / "f00.py"
+        os.utime(clean, ns=(0, 0))
+        main(["format", str(tmp_path), "--jobs", "1"])
+        assert os.stat(clean).st_mtime_ns == 0
+
+    def test_atomic_write_keeps_mode_and_symlink(self, tmp_path):
+        real = tmp_path / "real.py"
+        real.write_text(FIXABLE)
+        os.chmod(real, 0o751)
+        link = tmp_path / "sub" / "link.py"
+        link.parent.mkdir()
+        link.symlink_to(real)
+        assert main(["format", str(link)]) == 0
+        assert link.is_symlink()
+        assert "stx.io.save(x" in real.read_text()
+        assert os.stat(real).st_mode & 0o777 == 0o751
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
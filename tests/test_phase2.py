@@ -447,3 +447,65 @@ if __name__ == "__main__":
     pass
 """
         assert "STX-IO003" in _rule_ids(src)
+
+    def test_alias_only_applies_after_import(self):
+        src = """
+arr = nump.load("a.npy")
+import numpy as nump
+nump.load("b.npy")
+"""
+        issues = lint_source(src, filepath="src/pkg/mod.py")
+        assert [(i.rule.id, i.line) for i in issues] == [("STX-IO002", 4)]
+
+
+# =========================================================================
+# Merged call-rule index (built-in + plugin rules)
+# =========================================================================
+
+
+class TestCallIndex:
+    def _plugins(self, monkeypatch, call_rules):
+        from scitex_linter.rules import Rule
+
+        plugins = {"rules": {}, "call_rules": {}, "axes_hints": {}, "checkers": []}
+        for key, (rule_id, category) in call_rules.items():
+            plugins["call_rules"][key] = Rule(
+                rule_id, "warning", category, "msg", "fix"
+            )
+        monkeypatch.setattr(
+            "scitex_linter._plugin_loader.load_plugins", lambda: plugins
+        )
+
+    def test_builtin_wins_over_plugin(self, monkeypatch):
+        self._plugins(
+            monkeypatch,
+            {("np", "save"): ("X-1", "io"), ("np", "unsave"): ("X-2", "io")},
+        )
+        src = "import numpy as np\nnp.save('a', 1)\nnp.unsave('a')\n"
+        assert _rule_ids(src, "src/m.py") == ["STX-IO001", "X-2"]
+
+    def test_plugin_resolved_and_wildcard(self, monkeypatch):
+        self._plugins(
+            monkeypatch,
+            {("mylib", "write"): ("X-1", "io"), (None, "dump_all"): ("X-2", "io")},
+        )
+        src = "import mylib as ml\nml.write(1)\nobj.dump_all()\nother.write(1)\n"
+        assert _rule_ids(src, "src/m.py") == ["X-1", "X-2"]
+
+    def test_figure_plugin_rules_need_fm(self, monkeypatch):
+        from scitex_linter.config import LinterConfig
+
+        self._plugins(monkeypatch, {(None, "set_size"): ("X-FM", "figure")})
+        src = "fig.set_size(1)\nfr.fig.set_size(1)\n"
+        off = lint_source(src, "src/m.py", LinterConfig())
+        on = lint_source(src, "src/m.py", LinterConfig(enable=["FM"]))
+        assert [i.rule.id for i in off] == []
+        assert [(i.rule.id, i.line) for i in on] == [("X-FM", 1)]
+
+    def test_unrelated_attributes_not_indexed(self):
+        from scitex_linter import _call_index
+        from scitex_linter.config import LinterConfig
+
+        index = _call_index.for_config(LinterConfig())
+        assert "append" not in index
+        assert {"save", "load", "mkdir", "plot", "to_csv"} <= set(index)
@@ -0,0 +1,246 @@
+"""Tests for plugin discovery, the manifest cache and lazy plugin import."""
+
+import ast
+import os
+
+import pytest
+
+from scitex_linter import _plugin_loader, rules
+from scitex_linter.checker import Issue, lint_source
+from scitex_linter.config import LinterConfig
+from scitex_linter.rules import Rule
+
+X001 = Rule(
+    id="STX-X001",
+    severity="warning",
+    category="io",
+    message="Use stx.io.save() instead of frob()",
+    suggestion="",
+)
+X002 = Rule(
+    id="STX-X002",
+    severity="info",
+    category="figure",
+    message="figure plugin rule",
+    suggestion="",
+)
+
+
+class _FrobChecker(ast.NodeVisitor):
+    category = "io"
+    node_types = (ast.Call,)
+
+    def __init__(self, lines, config):
+        self.issues = []
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id == "frob":
+            self.issues.append(Issue(X001, node.lineno, node.col_offset))
+
+
+class _FigureChecker(_FrobChecker):
+    category = "figure"
+
+
+class _Dist:
+    name = "scitex-fake-plugin"
+    version = "1.0"
+
+
+class _EntryPoint:
+    name = "fake"
+    value = "scitex_fake_plugin:get_plugin"
+    dist = _Dist()
+
+    def __init__(self, plugin, log):
+        self._plugin = plugin
+        self._log = log
+
+    def load(self):
+        self._log.append(self.name)
+        return lambda: self._plugin
+
+
+@pytest.fixture
+def installed(monkeypatch):
+    """Install a fake plugin; yields the list of times it was imported."""
+    log = []
+    plugin = {
+        "rules": [X001, X002],
+        "call_rules": {("np", "frobnicate"): X001, (None, "set_size"): X002},
+        "axes_hints": {"hexbin": rules.P001},
+        "checkers": [_FrobChecker, _FigureChecker],
+    }
+    monkeypatch.setattr(
+        _plugin_loader,
+        "_iter_entry_points",
+        lambda group: [_EntryPoint(plugin, log)],
+    )
+    _plugin_loader.reset()
+    yield log
+    _plugin_loader.reset()
+
+
+def _new_process():
+    """Forget everything but the disk cache, as a fresh process would."""
+    _plugin_loader.reset()
+
+
+class TestManifestCache:
+    def test_cold_load_imports_and_writes_manifest(self, installed):
+        plugins = _plugin_loader.load_plugins()
+        assert installed == ["fake"]
+        assert _plugin_loader._cache_file().exists()
+        assert plugins["rules"]["STX-X001"] == X001
+        assert plugins["call_rules"][("np", "frobnicate")] == X001
+        assert [c.category for c in plugins["checkers"]] == ["io", "figure"]
+        assert plugins["checkers"][0].node_types == ("Call",)
+
+    def test_warm_load_imports_nothing(self, installed):
+        _plugin_loader.load_plugins()
+        _new_process()
+        plugins = _plugin_loader.load_plugins()
+        assert installed == ["fake"]
+        assert plugins["rules"]["STX-X002"] == X002
+        # Built-in rules come back as the canonical objects
+        assert plugins["axes_hints"]["hexbin"] is rules.P001
+
+    def test_version_change_invalidates(self, installed, monkeypatch):
+        _plugin_loader.load_plugins()
+        _new_process()
+        monkeypatch.setattr(_Dist, "version", "1.1")
+        _plugin_loader.load_plugins()
+        assert installed == ["fake", "fake"]
+
+    def test_reinstall_invalidates(self, installed, monkeypatch):
+        monkeypatch.setattr(
+            _Dist, "read_text", lambda self, name: "a.py,sha256=1,1\n", raising=False
+        )
+        _plugin_loader.load_plugins()
+        _new_process()
+        # Same version, different files
+        monkeypatch.setattr(_Dist, "read_text", lambda self, name: "a.py,sha256=2,1\n")
+        _plugin_loader.load_plugins()
+        assert installed == ["fake", "fake"]
+
+    @pytest.fixture
+    def package(self, monkeypatch, tmp_path):
+        pkg = tmp_path / "scitex_fake_plugin"
+        (pkg / "rules").mkdir(parents=True)
+        (pkg / "__init__.py").write_text("def get_plugin(): ...\n")
+        (pkg / "rules" / "io.py").write_text("X001 = None\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        return pkg
+
+    def test_submodule_save_invalidates(self, installed, package):
+        _plugin_loader.load_plugins()
+        _new_process()
+        _plugin_loader.load_plugins()
+        assert installed == ["fake"]
+
+        _new_process()
+        # Editors save by writing a new file and renaming it into place
+        new = package / "rules" / ".io.py.swp"
+        new.write_text("X001 = 1\n")
+        rules_dir = package / "rules"
+        st = rules_dir.stat()
+        new.replace(rules_dir / "io.py")
+        os.utime(rules_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        _plugin_loader.load_plugins()
+        assert installed == ["fake", "fake"]
+
+    def test_entry_module_edit_invalidates(self, installed, package):
+        _plugin_loader.load_plugins()
+        _new_process()
+        entry = package / "__init__.py"
+        st = entry.stat()
+        os.utime(entry, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        _plugin_loader.load_plugins()
+        assert installed == ["fake", "fake"]
+
+    @pytest.mark.parametrize(
+        "direct_url, stamped",
+        [(None, False), ('{"dir_info": {"editable": true}}', True)],
+    )
+    def test_package_stamped_only_when_editable(
+        self, installed, package, monkeypatch, direct_url, stamped
+    ):
+        texts = {"RECORD": "a.py,sha256=1,1\n", "direct_url.json": direct_url}
+        monkeypatch.setattr(
+            _Dist, "read_text", lambda self, name: texts[name], raising=False
+        )
+        calls = []
+        package_files = _plugin_loader._package_files
+        monkeypatch.setattr(
+            _plugin_loader,
+            "_package_files",
+            lambda value: calls.append(value) or package_files(value),
+        )
+        _plugin_loader.load_plugins()
+        assert bool(calls) is stamped
+
+    def test_disk_cache_bypassed(self, installed):
+        _plugin_loader.load_plugins()
+        _new_process()
+        _plugin_loader.set_disk_cache(False)
+        _plugin_loader.load_plugins()
+        assert installed == ["fake", "fake"]
+
+    def test_no_cache_flag_bypasses_manifest(self, installed, tmp_path):
+        from scitex_linter.cli import main
+
+        _plugin_loader.load_plugins()
+        _new_process()
+        f = tmp_path / "script.py"
+        f.write_text("frob(1)\n")
+        main(["check", str(f), "--no-cache"])
+        assert installed == ["fake", "fake"]
+
+    def test_cache_clear_deletes_manifest(self, installed):
+        from scitex_linter.cli import main
+
+        _plugin_loader.load_plugins()
+        assert main(["cache", "clear"]) == 0
+        assert not _plugin_loader._cache_file().exists()
+
+    def test_failed_plugin_is_not_cached(self, monkeypatch):
+        class _Broken(_EntryPoint):
+            def load(self):
+                raise ImportError("missing dependency")
+
+        monkeypatch.setattr(
+            _plugin_loader, "_iter_entry_points", lambda group: [_Broken({}, [])]
+        )
+        _plugin_loader.reset()
+        assert _plugin_loader.load_plugins()["rules"] == {}
+        assert not _plugin_loader._cache_file().exists()
+        _plugin_loader.reset()
+
+
+class TestLazyChecker:
+    SRC = "def f():\n    frob(1)\n"
+
+    def test_imported_when_a_file_runs_it(self, installed):
+        _plugin_loader.load_plugins()
+        _new_process()
+        ids = [i.rule.id for i in lint_source(self.SRC, "src/pkg/mod.py")]
+        assert ids == ["STX-X001"]
+        assert installed == ["fake", "fake"]
+        lint_source(self.SRC, "src/pkg/other.py")
+        assert installed == ["fake", "fake"]
+
+    def test_gated_figure_checker_not_imported(self, installed, monkeypatch):
+        _plugin_loader.load_plugins()
+        _new_process()
+        plugins = _plugin_loader.load_plugins()
+        # Only the figure checker is installed; without FM it never runs
+        monkeypatch.setitem(plugins, "checkers", plugins["checkers"][1:])
+        lint_source(self.SRC, "src/pkg/mod.py", LinterConfig())
+        assert installed == ["fake"]
+
+    def test_load_failure_skips_checker(self, installed, monkeypatch):
+        plugins = _plugin_loader.load_plugins()
+        monkeypatch.setitem(_plugin_loader._loaded, ("fake", _EntryPoint.value), None)
+        with pytest.raises(ImportError):
+            plugins["checkers"][0].load()
+        assert lint_source(self.SRC, "src/pkg/mod.py") == []
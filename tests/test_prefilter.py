@@ -0,0 +1,82 @@
+"""Tests for the lexical prefilter that skips parsing library modules."""
+
+from pathlib import Path
+
+import pytest
+
+import scitex_linter
+from scitex_linter import _prefilter, checker
+from scitex_linter._rule_tables import CALL_RULES
+from scitex_linter.config import LinterConfig
+
+LIB = "src/pkg/mod.py"
+SRC_DIR = Path(scitex_linter.__file__).parent
+
+
+def _lint_unfiltered(source, filepath, config, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(_prefilter, "can_skip", lambda *a: False)
+        return checker.lint_source(source, filepath=filepath, config=config)
+
+
+class TestCanSkip:
+    def test_plain_library_module(self):
+        assert _prefilter.can_skip("def f(x):\n    return x + 1\n", LIB, LinterConfig())
+
+    def test_scripts_are_parsed(self):
+        assert not _prefilter.can_skip("x = 1\n", "run.py", LinterConfig())
+
+    def test_non_ascii_is_parsed(self):
+        # NFKC-normalized identifier: this is np.save
+        source = "import numpy as np\nnp.ｓave('a.npy', 1)\n"
+        assert not _prefilter.can_skip(source, LIB, LinterConfig())
+        assert "STX-IO001" in [i.rule.id for i in checker.lint_source(source, LIB)]
+
+    def test_fm_enabled_is_parsed(self):
+        config = LinterConfig(enable=["FM"])
+        assert not _prefilter.can_skip("x = 1\n", LIB, config)
+
+    def test_plugin_checker_is_parsed(self, monkeypatch):
+        plugins = {"call_rules": {}, "axes_hints": {}, "checkers": [object]}
+        monkeypatch.setattr(
+            "scitex_linter._plugin_loader.load_plugins", lambda: plugins
+        )
+        assert not _prefilter.can_skip("x = 1\n", LIB, LinterConfig())
+
+    def test_tokens_cover_call_rules(self):
+        tokens = _prefilter.trigger_tokens()
+        for _, func in CALL_RULES:
+            assert any(t in func for t in tokens)
+
+
+class TestConservative:
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "import matplotlib.pyplot as plt\n",
+            "from scipy import stats\n",
+            "import pickle, random, logging\n",
+            "import numpy as np\nnp . save('a.npy', 1)\n",
+            "df.to_csv('x.csv')\n",
+            "from pathlib import Path\nPath('out').mkdir()\n",
+            "import scitex as stx\nstx.io.save(obj, '/abs/out.csv')\n",
+            "cfg = stx.io.load_configs()\n",
+            "@stx.session\ndef main(CONFIG):\n    print(1)\n",
+            "ax.scatter(x, y)\n",
+        ],
+    )
+    def test_triggering_sources_unchanged(self, source, monkeypatch):
+        config = LinterConfig()
+        expected = _lint_unfiltered(source, LIB, config, monkeypatch)
+        assert expected
+        assert checker.lint_source(source, LIB, config) == expected
+
+    def test_own_sources_unchanged(self, monkeypatch):
+        config = LinterConfig()
+        skipped = 0
+        for path in sorted(SRC_DIR.rglob("*.py")):
+            source = path.read_text(encoding="utf-8")
+            skipped += _prefilter.can_skip(source, LIB, config)
+            expected = _lint_unfiltered(source, LIB, config, monkeypatch)
+            assert checker.lint_source(source, LIB, config) == expected, path
+        assert skipped
@@ -0,0 +1,115 @@
+"""Tests for --profile-rules instrumentation."""
+
+import json
+
+import pytest
+
+from scitex_linter import _profile
+from scitex_linter.checker import lint_file, lint_source
+from scitex_linter.cli import main
+
+SRC = (
+    "import numpy as np\n"
+    "def f():\n"
+    "    np.save('a.npy', 1)\n"
+    "    return np.load('a.npy')\n"
+)
+
+
+@pytest.fixture
+def prof():
+    p = _profile.enable()
+    yield p
+    _profile.disable()
+
+
+class TestProfiler:
+    def test_stages_and_handlers(self, prof, tmp_path):
+        path = tmp_path / "s.py"
+        path.write_text(SRC)
+        issues = lint_file(str(path))
+        assert {"read", "parse", "setup", "dispatch", "post-checks"} <= set(prof.stages)
+        calls = prof.handlers[("SciTeXChecker._check_call", "Call")]
+        assert calls[1] == 2  # two calls visited
+        assert calls[2] >= 2  # IO001 + IO002
+        assert prof.files[0][1] == str(path)
+        assert sum(prof.rules.values()) == len(issues)
+
+    def test_node_type_totals(self, prof):
+        lint_source(SRC)
+        nodes = prof.by_node_type()
+        assert nodes["FunctionDef"][1] == 2  # enter + leave handlers
+        assert nodes["Import"][1] == 1
+
+    def test_report_and_dict(self, prof):
+        lint_source(SRC, filepath="x.py")
+        text = prof.report(top=3)
+        assert "Stage" in text and "STX-IO001" in text
+        data = prof.to_dict()
+        io001 = data["rules"]["STX-IO001"]
+        assert (io001["hits"], io001["files"], io001["calls"]) == (1, 1, 2)
+        assert io001["seconds"] > 0
+        json.dumps(data)
+
+    def test_handler_time_charged_to_emitted_rules(self, prof):
+        lint_source(SRC, filepath="x.py")
+        timing, unattributed = prof.by_rule()
+        call = prof.handlers[("SciTeXChecker._check_call", "Call")]
+        emitted = prof.handler_rules[("SciTeXChecker._check_call", "Call")]
+        assert emitted == {"STX-IO001": 1, "STX-IO002": 1}
+        share = timing["STX-IO001"][0] + timing["STX-IO002"][0]
+        assert share == pytest.approx(call[0])
+        assert timing["STX-IO001"][1] == call[1]
+        assert unattributed > 0  # e.g. the Import handler emitted nothing
+
+    def test_inserted_issue_attributed_to_its_rule(self, prof):
+        # S004 is inserted ahead of the body's issues, not appended
+        src = (
+            "import scitex as stx\n"
+            "@stx.session\n"
+            "def main(CONFIG, COLORS, logger, plt, rngg):\n"
+            "    np.save('a.npy', 1)\n"
+            "if __name__ == '__main__':\n"
+            "    main()\n"
+        )
+        lint_source(src, filepath="script.py")
+        leave = prof.handler_rules[("SciTeXChecker._leave_function", "FunctionDef")]
+        assert leave == {"STX-S004": 1}
+
+    def test_plugin_handlers_profiled(self, prof):
+        import ast
+
+        from scitex_linter._engine import DispatchEngine
+
+        class Plugin(ast.NodeVisitor):
+            node_types = ("Name",)
+
+            def __init__(self):
+                self.issues = []
+
+            def visit_Name(self, node):
+                self.issues.append(node.id)
+
+        engine = DispatchEngine()
+        engine.add_checker(Plugin())
+        engine.run(ast.parse("a = b + c"))
+        assert prof.handlers[("Plugin.visit_Name", "Name")][1:] == [3, 3]
+
+
+class TestDisabled:
+    def test_no_instrumentation_when_off(self, monkeypatch):
+        monkeypatch.setattr(
+            _profile.Profiler, "wrap", lambda *a: pytest.fail("instrumented")
+        )
+        assert _profile.current is None
+        assert lint_source(SRC)
+
+
+class TestCLI:
+    def test_report_on_stderr(self, tmp_path, capsys):
+        (tmp_path / "a.py").write_text(SRC)
+        main(["check", str(tmp_path), "--json", "--profile-rules", "2"])
+        captured = capsys.readouterr()
+        assert str(tmp_path / "a.py") in json.loads(captured.out)
+        assert "Slowest 2 files" in captured.err
+        assert _profile.current is None
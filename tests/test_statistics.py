@@ -0,0 +1,86 @@
+"""Tests for check --statistics and the counters behind it."""
+
+import json
+from collections import Counter
+
+import pytest
+
+from scitex_linter import collect_statistics
+from scitex_linter._statistics import Statistics
+from scitex_linter.cli import main
+
+SCRIPT = (
+    "import scitex as stx\n"
+    "import numpy as np\n"
+    "@stx.session\n"
+    "def main(CONFIG, COLORS, logger, plt, rngg):\n"
+    "    np.save('a.npy', 1)\n"
+    "    print(1)\n"
+    "    return 0\n"
+    "if __name__ == '__main__':\n"
+    "    main()\n"
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for d in ("scripts_a", "scripts_b"):
+        (tmp_path / d / "sub").mkdir(parents=True)
+        (tmp_path / d / "one.py").write_text(SCRIPT)
+        (tmp_path / d / "sub" / "two.py").write_text(SCRIPT + "import pickle\n")
+    (tmp_path / "top.py").write_text("import random\n")
+    (tmp_path / "clean" / "src").mkdir(parents=True)
+    (tmp_path / "clean" / "src" / "mod.py").write_text("x = 1\n")
+    return tmp_path
+
+
+class TestStatistics:
+    def test_matrix_grows_with_rules_and_dirs(self, tmp_path):
+        stats = Statistics(tmp_path)
+        stats.add_counts(str(tmp_path / "a" / "x.py"), [("R1", "warning", "io", 2)])
+        stats.add_counts(str(tmp_path / "b" / "y.py"), [("R2", "error", "path", 1)])
+        stats.add_counts(str(tmp_path / "z.py"), [])
+        assert stats.dirs == ["a", "b", "."]
+        assert [list(r) for r in stats._rows] == [[2, 0], [0, 1], [0, 0]]
+        assert stats.by_rule() == {"R1": 2, "R2": 1}
+        assert stats.rule_by_directory() == {"a": {"R1": 2}, "b": {"R2": 1}}
+        assert (stats.files, stats.files_with_issues, stats.total) == (3, 2, 3)
+
+    def test_filters(self, tmp_path):
+        stats = Statistics(tmp_path, min_severity="warning", categories={"io"})
+        counts = [("R1", "warning", "io", 2), ("R2", "info", "io", 5)]
+        counts.append(("R3", "error", "path", 1))
+        assert stats.add_counts(str(tmp_path / "x.py"), counts) == 2
+        assert stats.by_rule() == {"R1": 2}
+
+
+class TestCheckStatistics:
+    def _json(self, capsys, *args):
+        main(["check", *args, "--no-cache", "--json"])
+        return json.loads(capsys.readouterr().out)
+
+    def test_matches_json_post_processing(self, tree, capsys):
+        full = self._json(capsys, str(tree))
+        stats = self._json(capsys, str(tree), "--statistics")
+        rules = Counter(i["rule_id"] for f in full.values() for i in f["issues"])
+        assert stats["by_rule"] == dict(rules)
+        assert stats["issues"] == sum(rules.values())
+        assert stats["files_with_issues"] == len(full)
+        assert stats["files"] == 6
+        assert stats["by_directory"]["scripts_a"]["files"] == 2
+        assert stats["rule_by_directory"]["scripts_b"]["STX-I003"] == 1
+        assert "clean" not in stats["rule_by_directory"]
+
+    def test_filters_and_exit_code(self, tree, capsys):
+        code = main(["check", str(tree), "--statistics", "--category", "io"])
+        out = capsys.readouterr().out
+        assert "STX-IO001" in out
+        assert "STX-S002" not in out
+        assert out.rstrip().endswith("issues in 4 of 6 files")
+        assert code == 1
+
+    def test_api_parallel_matches_serial(self, tree):
+        serial = collect_statistics(tree, jobs=1, use_cache=False)
+        parallel = collect_statistics(tree, jobs=2, use_cache=False)
+        assert serial.to_json() == parallel.to_json()
+        assert serial.by_severity()["error"] > 0
@@ -0,0 +1,143 @@
+"""Tests for the pruning, .gitignore-aware file walker."""
+
+import os
+
+import pytest
+
+from scitex_linter import _walk
+from scitex_linter._select import collect_files
+from scitex_linter._walk import IgnoreFile, iter_files
+from scitex_linter.config import LinterConfig
+
+
+def _touch(root, *rels):
+    for rel in rels:
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x = 1\n")
+
+
+def _rels(root, files):
+    return [str(f.relative_to(root)) for f in files]
+
+
+class TestOrderAndPruning:
+    def test_same_order_as_sorted_glob(self, tmp_path):
+        _touch(tmp_path, "b.py", "a/z.py", "a-b/y.py", "a.py", "a/sub/x.py", "c.txt")
+        expected = sorted(tmp_path.glob("**/*.py"))
+        assert list(iter_files(tmp_path, config=LinterConfig())) == expected
+
+    def test_excluded_dirs_not_entered(self, tmp_path, monkeypatch):
+        _touch(tmp_path, "keep.py", ".venv/lib/x.py", "node_modules/y.py")
+        entered = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(
+            _walk.os, "scandir", lambda p: entered.append(p) or real_scandir(p)
+        )
+        files = list(iter_files(tmp_path, config=LinterConfig()))
+        assert _rels(tmp_path, files) == ["keep.py"]
+        assert not any(".venv" in p or "node_modules" in p for p in entered)
+
+    def test_non_recursive(self, tmp_path):
+        _touch(tmp_path, "a.py", "sub/b.py")
+        files = iter_files(tmp_path, config=LinterConfig(), recursive=False)
+        assert _rels(tmp_path, files) == ["a.py"]
+
+    def test_single_file(self, tmp_path):
+        _touch(tmp_path, "a.py")
+        assert list(iter_files(tmp_path / "a.py")) == [tmp_path / "a.py"]
+
+    def test_symlink_loop(self, tmp_path):
+        _touch(tmp_path, "pkg/a.py")
+        try:
+            os.symlink(tmp_path / "pkg", tmp_path / "pkg" / "loop")
+        except OSError:
+            pytest.skip("symlinks unsupported")
+        files = list(iter_files(tmp_path, config=LinterConfig()))
+        assert _rels(tmp_path, files) == ["pkg/a.py"]
+
+    def test_collect_files_returns_list(self, tmp_path):
+        _touch(tmp_path, "a.py")
+        assert collect_files(tmp_path) == [tmp_path / "a.py"]
+
+
+class TestGitignore:
+    def test_patterns(self, tmp_path):
+        _touch(
+            tmp_path,
+            "keep.py",
+            "gen_out.py",
+            "data/raw.py",
+            "src/build/x.py",
+            "src/ok.py",
+            "notes/important.py",
+            "notes/other.py",
+        )
+        (tmp_path / ".gitignore").write_text(
+            "# comment\ngen_*.py\n/data/\nbuild/\nnotes/*.py\n!notes/important.py\n"
+        )
+        files = iter_files(tmp_path, config=LinterConfig())
+        assert _rels(tmp_path, files) == ["keep.py", "notes/important.py", "src/ok.py"]
+
+    def test_nested_gitignore_takes_precedence(self, tmp_path):
+        _touch(tmp_path, "a/keep.py", "a/skip.py")
+        (tmp_path / ".gitignore").write_text("*.py\n!a/\n")
+        (tmp_path / "a" / ".gitignore").write_text("!keep.py\n")
+        files = iter_files(tmp_path, config=LinterConfig())
+        assert _rels(tmp_path, files) == ["a/keep.py"]
+
+    def test_ancestor_gitignore_and_info_exclude(self, tmp_path):
+        (tmp_path / ".git" / "info").mkdir(parents=True)
+        (tmp_path / ".git" / "info" / "exclude").write_text("local_*.py\n")
+        (tmp_path / ".gitignore").write_text("proj/tmp/\n")
+        _touch(tmp_path, "proj/a.py", "proj/local_b.py", "proj/tmp/c.py")
+        files = iter_files(tmp_path / "proj", config=LinterConfig())
+        assert _rels(tmp_path, files) == ["proj/a.py"]
+
+    def test_respect_gitignore_false(self, tmp_path):
+        _touch(tmp_path, "gen.py")
+        (tmp_path / ".gitignore").write_text("gen.py\n")
+        files = iter_files(tmp_path, config=LinterConfig(respect_gitignore=False))
+        assert _rels(tmp_path, files) == ["gen.py"]
+
+    def test_ignore_filter_looks_up_each_dir_once(self, tmp_path, monkeypatch):
+        (tmp_path / ".git" / "info").mkdir(parents=True)
+        (tmp_path / ".git" / "info" / "exclude").write_text("local_*.py\n")
+        (tmp_path / ".gitignore").write_text("tmp/\n")
+        names = ["a.py", "b.py", "local_c.py", "tmp/d.py", "sub/e.py"]
+        _touch(tmp_path, *names)
+        roots, loads = [], []
+        find_git_root, load = _walk._find_git_root, IgnoreFile.load
+        monkeypatch.setattr(
+            _walk, "_find_git_root", lambda d: roots.append(d) or find_git_root(d)
+        )
+        monkeypatch.setattr(
+            IgnoreFile, "load", lambda *a: loads.append(a[-1]) or load(*a)
+        )
+        ignored = _walk.ignore_filter(LinterConfig())
+        hits = [n for n in names if ignored(str(tmp_path / n))]
+        assert hits == ["local_c.py", "tmp/d.py"]
+        assert len(roots) == len(set(roots)) == 3
+        assert len(loads) == len(set(loads))
+
+
+class TestIgnoreFile:
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,expected",
+        [
+            ("*.log", "a/b/x.log", False, True),
+            ("/x.py", "x.py", False, True),
+            ("/x.py", "a/x.py", False, None),
+            ("a/**/b.py", "a/b.py", False, True),
+            ("a/**/b.py", "a/1/2/b.py", False, True),
+            ("**/cache", "deep/er/cache", True, True),
+            ("logs/**", "logs/x/y.py", False, True),
+            ("out/", "out", False, None),
+            ("out/", "out", True, True),
+            ("f?o.py", "foo.py", False, True),
+            ("[ab].py", "c.py", False, None),
+        ],
+    )
+    def test_match(self, pattern, path, is_dir, expected):
+        layer = IgnoreFile("/base", [pattern])
+        assert layer.match("/base/" + path, is_dir) is expected
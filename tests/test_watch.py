@@ -0,0 +1,211 @@
+"""Tests for the incremental 'watch' subcommand."""
+
+import os
+import sys
+import types
+
+from scitex_linter import _cmd_watch
+from scitex_linter._cmd_watch import Watcher
+from scitex_linter.cli import main
+
+DIRTY = 'import argparse\nimport numpy as np\nnp.save("a.npy", 1)\n'
+LESS_DIRTY = "import argparse\nimport numpy as np\nx = 1\n"
+
+
+def _ids(issues):
+    return sorted(i.rule.id for i in issues)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestWatcher:
+    def test_first_cycle_reports_everything(self, tmp_path):
+        (tmp_path / "a.py").write_text(DIRTY)
+        (tmp_path / "b.py").write_text(DIRTY)
+        delta = Watcher(tmp_path).cycle()
+        assert sorted(delta) == [str(tmp_path / "a.py"), str(tmp_path / "b.py")]
+        added, removed, current = delta[str(tmp_path / "a.py")]
+        assert "STX-IO001" in _ids(added)
+        assert removed == [] and _ids(current) == _ids(added)
+
+    def test_unchanged_files_not_relinted(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        calls = []
+        monkeypatch.setattr(w, "_relint", lambda p: calls.append(p))
+        assert w.cycle() == {}
+        assert calls == []
+
+    def test_touch_without_content_change(self, tmp_path, monkeypatch):
+        f = tmp_path / "a.py"
+        f.write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        _bump_mtime(f)
+        import scitex_linter.checker as checker
+
+        monkeypatch.setattr(
+            checker, "_lint_path", lambda *a, **k: (_ for _ in ()).throw(AssertionError)
+        )
+        assert w.cycle() == {}
+
+    def test_only_changed_diagnostics(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        f.write_text(LESS_DIRTY)
+        _bump_mtime(f)
+        added, removed, current = w.cycle()[str(f)]
+        assert added == []
+        assert _ids(removed) == ["STX-IO001"]
+        assert "STX-IO001" not in _ids(current)
+
+    def test_deleted_file(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        f.unlink()
+        added, removed, current = w.cycle()[str(f)]
+        assert added == [] and current == []
+        assert "STX-IO001" in _ids(removed)
+        assert str(f) not in w.results
+
+    def test_config_change_relints_all(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        monkeypatch.setenv("SCITEX_LINTER_DISABLE", "STX-IO001")
+        added, removed, _ = w.cycle()[str(tmp_path / "a.py")]
+        assert _ids(removed) == ["STX-IO001"]
+
+    def test_severity_filter(self, tmp_path):
+        (tmp_path / "a.py").write_text(DIRTY)
+        delta = Watcher(tmp_path, severity="error").cycle()
+        _, _, current = delta[str(tmp_path / "a.py")]
+        assert all(i.rule.severity == "error" for i in current)
+
+    def test_debounce_coalesces_changes(self, tmp_path, monkeypatch):
+        f = tmp_path / "a.py"
+        f.write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        g = tmp_path / "b.py"
+        sleeps = []
+
+        def fake_sleep(seconds):
+            # A second save lands during the first debounce window
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                g.write_text(DIRTY)
+
+        monkeypatch.setattr(_cmd_watch.time, "sleep", fake_sleep)
+        f.write_text(LESS_DIRTY)
+        _bump_mtime(f)
+        changed = w.wait_for_changes(interval=0.5, debounce=0.2)
+        assert changed == {str(f), str(g)}
+        assert sleeps == [0.2, 0.2]
+
+
+class TestTreeStamps:
+    def test_unchanged_tree_not_rewalked(self, tmp_path, monkeypatch):
+        from scitex_linter import _walk
+
+        f = tmp_path / "a.py"
+        f.write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+
+        def no_walk(*args, **kwargs):
+            raise AssertionError("tree re-walked")
+
+        monkeypatch.setattr(_walk, "iter_files", no_walk)
+        f.write_text(LESS_DIRTY)
+        _bump_mtime(f)
+        assert w.poll() == {str(f)}
+
+    def test_new_file_in_subdirectory(self, tmp_path):
+        sub = tmp_path / "pkg"
+        sub.mkdir()
+        (sub / "a.py").write_text(DIRTY)
+        w = Watcher(tmp_path)
+        w.cycle()
+        g = sub / "b.py"
+        g.write_text(DIRTY)
+        _bump_mtime(sub)
+        assert w.poll() == {str(g)}
+
+    def test_gitignore_edit_rewalks(self, tmp_path):
+        (tmp_path / "a.py").write_text(DIRTY)
+        (tmp_path / "gen.py").write_text(DIRTY)
+        ignore = tmp_path / ".gitignore"
+        ignore.write_text("build/\n")
+        w = Watcher(tmp_path)
+        w.cycle()
+        ignore.write_text("gen.py\n")
+        _bump_mtime(ignore)
+        assert w.poll() == {str(tmp_path / "gen.py")}
+        assert str(tmp_path / "gen.py") not in w.stats
+
+
+class TestObserver:
+    def test_without_watchdog_polls(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "watchdog", None)
+        assert Watcher(tmp_path).observe() is False
+
+    def test_notification_wakes_watcher(self, tmp_path, monkeypatch):
+        scheduled = []
+
+        class FakeObserver:
+            def schedule(self, handler, path, recursive):
+                scheduled.append((handler, path, recursive))
+
+            def start(self):
+                pass
+
+            def stop(self):
+                pass
+
+            def join(self):
+                pass
+
+        events = types.ModuleType("watchdog.events")
+        events.FileSystemEventHandler = object
+        observers = types.ModuleType("watchdog.observers")
+        observers.Observer = FakeObserver
+        monkeypatch.setitem(sys.modules, "watchdog", types.ModuleType("watchdog"))
+        monkeypatch.setitem(sys.modules, "watchdog.events", events)
+        monkeypatch.setitem(sys.modules, "watchdog.observers", observers)
+
+        w = Watcher(tmp_path)
+        assert w.observe() is True
+        handler, path, recursive = scheduled[0]
+        assert (path, recursive) == (str(tmp_path), True)
+        assert not w._wake.is_set()
+        handler.on_any_event(None)
+        assert w._wake.is_set()
+        w.close()
+
+
+class TestWatchCLI:
+    def test_once_reports_and_exits(self, tmp_path, capsys):
+        (tmp_path / "a.py").write_text(DIRTY)
+        ret = main(["watch", str(tmp_path), "--once", "--no-color"])
+        out = capsys.readouterr().out
+        assert ret == 2
+        assert "STX-IO001" in out
+
+    def test_once_clean(self, tmp_path):
+        (tmp_path / "lib.py").write_text("x = 1\n")
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.scitex-linter]\nlibrary-patterns = ["lib.py"]\n'
+        )
+        assert main(["watch", str(tmp_path), "--once", "--no-color"]) == 0
+
+    def test_missing_path(self, tmp_path):
+        assert main(["watch", str(tmp_path / "nope"), "--once"]) == 2